@@ -463,8 +463,8 @@ def get_user_region_assignments(user):
 		frappe.log(f"Found {len(region_assignments)} region assignments for user {user}")
 
 		# Log the projects and regions for debugging
-		projects = list(set([a.project for a in region_assignments]))
-		regions = list(set([a.administrative_region for a in region_assignments]))
+		projects = list(dict.fromkeys(a.project for a in region_assignments))
+		regions = list(dict.fromkeys(a.administrative_region for a in region_assignments))
 		frappe.log(f"User {user} has access to projects: {projects}")
 		frappe.log(f"User {user} is assigned to regions: {regions}")
 
@@ -71,12 +71,7 @@ def _get_active_projects(project_id=None):
 			return [project_id]
 		return []
 
-	projects = frappe.get_all(
-		"GRM Project",
-		filters={"is_active": 1},
-		fields=["name"],
-	)
-	return [p.name for p in projects]
+	return frappe.get_all("GRM Project", filters={"is_active": 1}, pluck="name")
 
 
 def _empty_dashboard():
@@ -231,8 +231,7 @@ def get_overview_stats(accessible_projects, date_filter):
 	total_issues = frappe.db.count("GRM Issue", filters)
 
 	# Open issues
-	open_statuses = frappe.get_all("GRM Issue Status", filters={"open_status": 1}, fields=["name"])
-	open_status_ids = [s.name for s in open_statuses]
+	open_status_ids = frappe.get_all("GRM Issue Status", filters={"open_status": 1}, pluck="name")
 
 	open_filters = filters.copy()
 	if open_status_ids:
@@ -240,8 +239,7 @@ def get_overview_stats(accessible_projects, date_filter):
 	open_issues = frappe.db.count("GRM Issue", open_filters)
 
 	# Resolved issues
-	resolved_statuses = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, fields=["name"])
-	resolved_status_ids = [s.name for s in resolved_statuses]
+	resolved_status_ids = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, pluck="name")
 
 	resolved_filters = filters.copy()
 	if resolved_status_ids:
@@ -249,8 +247,7 @@ def get_overview_stats(accessible_projects, date_filter):
 	resolved_issues = frappe.db.count("GRM Issue", resolved_filters)
 
 	# Pending issues (initial status)
-	pending_statuses = frappe.get_all("GRM Issue Status", filters={"initial_status": 1}, fields=["name"])
-	pending_status_ids = [s.name for s in pending_statuses]
+	pending_status_ids = frappe.get_all("GRM Issue Status", filters={"initial_status": 1}, pluck="name")
 
 	pending_filters = filters.copy()
 	if pending_status_ids:
@@ -388,9 +385,9 @@ def get_user_performance(accessible_projects, user, date_filter):
 	# Issues resolved by user
 	resolved_filters = filters.copy()
 	resolved_filters["assignee"] = user
-	resolved_statuses = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, fields=["name"])
-	if resolved_statuses:
-		resolved_filters["status"] = ["in", [s.name for s in resolved_statuses]]
+	resolved_status_ids = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, pluck="name")
+	if resolved_status_ids:
+		resolved_filters["status"] = ["in", resolved_status_ids]
 		resolved_count = frappe.db.count("GRM Issue", resolved_filters)
 	else:
 		resolved_count = 0
@@ -464,9 +461,9 @@ def get_user_resolved_issues(accessible_projects, user, date_filter):
 		filters["creation"] = [">=", date_filter]
 
 	# Add resolved status filter
-	resolved_statuses = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, fields=["name"])
-	if resolved_statuses:
-		filters["status"] = ["in", [s.name for s in resolved_statuses]]
+	resolved_status_ids = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, pluck="name")
+	if resolved_status_ids:
+		filters["status"] = ["in", resolved_status_ids]
 		return frappe.db.count("GRM Issue", filters)
 
 	return 0
@@ -652,15 +649,15 @@ def get_project_performance_indicators(project_id):
 	total_issues = frappe.db.count("GRM Issue", {"project": project_id})
 
 	# Resolved issues
-	resolved_statuses = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, fields=["name"])
+	resolved_status_ids = frappe.get_all("GRM Issue Status", filters={"final_status": 1}, pluck="name")
 
 	resolved_count = 0
-	if resolved_statuses:
+	if resolved_status_ids:
 		resolved_count = frappe.db.count(
 			"GRM Issue",
 			{
 				"project": project_id,
-				"status": ["in", [s.name for s in resolved_statuses]],
+				"status": ["in", resolved_status_ids],
 			},
 		)
 
@@ -9,18 +9,29 @@ Follows the WatermelonDB sync specification:
 - pushChanges: POST endpoint that accepts and processes client changes
 """
 
+import base64
+import functools
 import hashlib
 import json
 import logging
+import mmap
+import os
+import re
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import frappe
 from frappe import _
-from frappe.model.document import Document
 from frappe.utils import cint, get_datetime, get_timestamp, now_datetime
 from frappe.utils.caching import request_cache, site_cache
 
+try:
+	import orjson
+except ImportError:  # Frappe depends on it; stdlib json keeps sync working without
+	orjson = None
+
 # Import user filtering functions from lookup.py
 from egrm.api.lookup import get_user_accessible_regions, get_user_region_assignments
 
@@ -39,16 +50,23 @@ log = logging.getLogger(__name__)
 _DRAFT_BYPASS_ROLES = frozenset({"System Manager", "GRM Platform Administrator", "GRM Supervise"})
 
 
+@request_cache
+def _user_roles(user):
+	"""``frappe.get_roles(user)`` as a set, resolved once per request — the
+	push path asks for every record it validates."""
+	return frozenset(frappe.get_roles(user))
+
+
 def _user_can_see_others_drafts(user):
 	if user == "Administrator":
 		return True
-	return bool(_DRAFT_BYPASS_ROLES.intersection(frappe.get_roles(user)))
+	return bool(_DRAFT_BYPASS_ROLES.intersection(_user_roles(user)))
 
 
 def _strip_foreign_drafts(records, user):
 	"""Filter out GRM Issue drafts that don't belong to `user`. Records
-	here come straight from frappe.get_all(..., fields=['*']) so each
-	dict carries `docstatus` and `owner`."""
+	here come straight from the pull query, whose standard columns give
+	each dict `docstatus` and `owner`."""
 	if _user_can_see_others_drafts(user):
 		return records
 	visible = []
@@ -87,9 +105,21 @@ SYNC_TABLES = {
 	"grm_issue_attachments": "GRM Issue Attachment",
 }
 
+# Issue child tables the mobile app pushes. They are written by appending to
+# the parent GRM Issue rather than inserted on their own.
+CHILD_TABLE_DOCTYPES = ("GRM Issue Log", "GRM Issue Comment", "GRM Issue Attachment")
+
+# Issue child tables pulled in the main table loop, scoped through their
+# parent issue. Attachments are pulled separately with their file data.
+PULLED_ISSUE_CHILD_DOCTYPES = ("GRM Issue Log", "GRM Issue Comment")
+
 # Reverse mapping for table name lookup
 DOCTYPE_TO_TABLE = {v: k for k, v in SYNC_TABLES.items()}
 
+# Every synced doctype, in SYNC_TABLES order. The tombstone lookup takes the
+# whole set on every pull; building it once here keeps the argument stable.
+SYNCED_DOCTYPES = tuple(SYNC_TABLES.values())
+
 # Reference tables reachable through a GRM Project Link child row. Their
 # entitled size is a pure function of the user's project set, which is what
 # makes a shared count cache correct across users.
@@ -150,6 +180,33 @@ FULL_SYNC_ESCALATION_COOLDOWN = 900
 # Set to 0 to disable pagination entirely.
 PULL_PAGE_SIZE = 1000
 
+# Largest page a client may ask for with ``pageSize``. At 5000 a page is still
+# about half a second and ~10 MB (see above); beyond that a single response
+# starts to look like the unpaged replay pagination exists to avoid.
+MAX_PULL_PAGE_SIZE = 5000
+
+# gzip level for streamed pulls. 6 is zlib's default trade-off; the higher
+# levels cost several times the CPU for a few percent on repetitive JSON.
+PULL_STREAM_GZIP_LEVEL = 6
+
+# Records above which a push from a client that sent ``asyncPush`` is applied by
+# a background worker. The client gets a job id back straight away instead of
+# holding the connection open while hundreds of issues are inserted.
+PUSH_BACKGROUND_THRESHOLD = 200
+
+# How long a queued push's outcome stays pollable.
+PUSH_JOB_STATUS_TTL = 3600
+PUSH_JOB_CACHE_PREFIX = "grm_sync_push_job:"
+
+# Pushed updates applied per UPDATE statement. ``frappe.db.bulk_update`` writes
+# a chunk as one ``SET field = CASE name WHEN ...`` query, so the statement
+# grows with this times the distinct changed fields.
+PUSH_UPDATE_CHUNK_SIZE = 100
+
+# Threads reading attachment files for a pull. The work is disk or network
+# I/O, so a handful overlaps it without crowding the web worker.
+ATTACHMENT_READ_WORKERS = 8
+
 
 @request_cache
 def _sync_scope(user):
@@ -307,12 +364,44 @@ def _resolve_full_sync(user, last_sync_time, local_counts):
 		return False, None
 	frappe.cache().set_value(cache_key, 1, expires_in_sec=FULL_SYNC_ESCALATION_COOLDOWN)
 
-	frappe.log(f"🔁 [SYNC_BACKEND] Escalating {user} to full sync; device short on {detail}")
+	log.info("[SYNC_BACKEND] Escalating %s to full sync; device short on %s", user, detail)
 	return True, f"missing-records ({detail})"
 
 
+def _parse_last_pulled_at(value):
+	"""Turn a client watermark into a naive local datetime.
+
+	Almost every client sends integer milliseconds (as a number, or as a digit
+	string off the query string), so that is tried first and costs one float()
+	and one C call. Only what does not parse as a number is handed to
+	``get_datetime``, whose dateutil parser is far too slow to sit on the
+	common path.
+
+	``fromtimestamp`` — not ``utcfromtimestamp`` — on purpose: the response
+	watermark is produced with ``datetime.timestamp()`` on a naive datetime,
+	which resolves in the process timezone, and the round-trip has to be exact.
+	"""
+	if isinstance(value, bool):
+		raise ValueError(f"Unsupported timestamp format: {type(value)}")
+	try:
+		millis = float(value)
+	except (TypeError, ValueError):
+		if not isinstance(value, str):
+			raise ValueError(f"Unsupported timestamp format: {type(value)}") from None
+		return get_datetime(value)
+	return datetime.fromtimestamp(millis / 1000)
+
+
 @frappe.whitelist()
-def pull_changes(lastPulledAt=None, fullSync=None, counts=None, paging=None):
+def pull_changes(
+	lastPulledAt=None,
+	fullSync=None,
+	counts=None,
+	paging=None,
+	stream=None,
+	knownHashes=None,
+	pageSize=None,
+):
 	"""
 	WatermelonDB standard pullChanges endpoint - GET with query parameters
 
@@ -372,6 +461,26 @@ def pull_changes(lastPulledAt=None, fullSync=None, counts=None, paging=None):
 	applies the page, then syncs again straight away to fetch the next one. This
 	keeps a full replay for a large account off a single unbounded request, and
 	makes an interrupted replay resume from the last page it acknowledged.
+
+	``pageSize`` optionally overrides the ``PULL_PAGE_SIZE`` issue count a page
+	is cut at, up to ``MAX_PULL_PAGE_SIZE``. A device on a fast connection can
+	ask for fewer, larger pages; one on a poor link for smaller ones. The
+	cursor is still ``timestamp``, so pages of different sizes can be mixed
+	within one replay.
+
+	``stream=1`` returns the same payload as newline-delimited JSON: one
+	``{"table": ..., "changes": {...}}`` line per table, then a final line with
+	``timestamp``, ``fullSync``, ``fullSyncReason`` and ``hasMore``. Each line is
+	serialised as it is written, so the server never holds the whole body as one
+	string and a client with an incremental parser can apply tables as they
+	arrive.
+
+	``knownHashes`` is an optional JSON list of the attachment content hashes
+	the device already has files for. Sending it opts in to hash-aware
+	attachment rows: each one carries ``file_hash`` (the ``content_hash`` of its
+	File), and ``file_data`` is left out when that hash is in the list, so an
+	attachment whose metadata changed does not ship its file again. Clients
+	that omit it get ``file_data`` on every attachment, as before.
 	"""
 	# Start timing the entire operation
 	start_time = time.time()
@@ -380,12 +489,18 @@ def pull_changes(lastPulledAt=None, fullSync=None, counts=None, paging=None):
 		# Parse timestamp parameter. Read the request lazily off frappe.local:
 		# `frappe.request` raises RuntimeError when unbound, which made this
 		# endpoint impossible to exercise from `bench console` or a unit test.
-		request = getattr(frappe.local, "request", None)
-		args = request.args if request is not None else None
-		last_pulled_at = args.get("lastPulledAt") if args else lastPulledAt
-		full_sync = cint(args.get("fullSync") if args else fullSync)
-		raw_counts = args.get("counts") if args else counts
-		is_paging = cint(args.get("paging") if args else paging)
+		# Query-string values win; the keyword arguments cover direct calls.
+		args = getattr(getattr(frappe.local, "request", None), "args", None) or {}
+		last_pulled_at = args.get("lastPulledAt", lastPulledAt)
+		full_sync = cint(args.get("fullSync", fullSync))
+		raw_counts = args.get("counts", counts)
+		is_paging = cint(args.get("paging", paging))
+		is_stream = cint(args.get("stream", stream))
+		raw_known_hashes = args.get("knownHashes", knownHashes)
+		requested_page_size = cint(args.get("pageSize", pageSize))
+		page_size = (
+			min(requested_page_size, MAX_PULL_PAGE_SIZE) if requested_page_size > 0 else PULL_PAGE_SIZE
+		)
 
 		# What the device says it currently holds, per table. Optional: older
 		# clients don't send it and simply lose the reconciliation safety net.
@@ -396,128 +511,36 @@ def pull_changes(lastPulledAt=None, fullSync=None, counts=None, paging=None):
 				if isinstance(parsed_counts, dict):
 					local_counts = parsed_counts
 			except (ValueError, TypeError) as e:
-				frappe.log(f"⚠️ [SYNC_BACKEND] Ignoring unparsable counts payload: {e!s}")
-
-		full_sync_reason = "requested" if full_sync else None
+				log.warning("[SYNC_BACKEND] Ignoring unparsable counts payload: %s", e)
 
-		# Validate and parse timestamp
-		if full_sync:
-			# Caller has no usable local data: replay history from the beginning.
-			last_sync_time = datetime.min
-		elif last_pulled_at:
+		# Attachment files the device already holds. None, not an empty set,
+		# when absent, so clients that never sent it keep getting every file.
+		known_hashes = None
+		if raw_known_hashes:
 			try:
-				# Handle both string and numeric timestamps
-				if isinstance(last_pulled_at, int | float):
-					# Convert milliseconds to datetime
-					last_sync_time = datetime.fromtimestamp(last_pulled_at / 1000)
-				elif isinstance(last_pulled_at, str):
-					# Handle string timestamps
-					if last_pulled_at.isdigit():
-						# String contains numeric timestamp
-						last_sync_time = datetime.fromtimestamp(int(last_pulled_at) / 1000)
-					else:
-						# ISO string timestamp
-						last_sync_time = get_datetime(last_pulled_at)
-				else:
-					raise ValueError(f"Unsupported timestamp format: {type(last_pulled_at)}")
-			except Exception as e:
-				frappe.log_error(f"❌ [SYNC_BACKEND] Invalid timestamp: {last_pulled_at} - {e!s}")
-				frappe.throw(f"Invalid lastPulledAt timestamp: {last_pulled_at} - {e!s}")
-		else:
-			# First sync - get all data from beginning of time
-			last_sync_time = datetime.min
-			full_sync_reason = "first-sync"
-
-		# An incremental pull only ever describes the window since the
-		# watermark, so it cannot repair a device that is missing older
-		# records — whether because a bug dropped them, a write failed, or the
-		# user's scope just widened. Detect that here rather than waiting for
-		# somebody to phone support and be told to tap "Download all my data
-		# again".
-		#
-		# Except while the client is walking pages. A continuation page is an
-		# ordinary incremental request as far as this endpoint can tell — same
-		# watermark shape, and a device legitimately mid-replay is short of
-		# records and carries a watermark older than its own assignment row, so
-		# both escalation checks fire on it. Escalating means restarting the
-		# replay from record one, and the client then walks back to the same
-		# page and trips it again. Measured on a paginated replay: pages 2 and 3
-		# each re-escalated and refetched page one, so 5 requests delivered what
-		# 3 should have, and the cursor stood still twice. `paging=1` says "I
-		# know I am behind, I am already fixing it" — the safety net is for
-		# devices that are stuck, not devices making progress. The next pull
-		# without the flag re-arms it.
-		if not full_sync and not is_paging and last_sync_time != datetime.min:
-			should_escalate, reason = _resolve_full_sync(frappe.session.user, last_sync_time, local_counts)
-			if should_escalate:
-				last_sync_time = datetime.min
-				full_sync = 1
-				full_sync_reason = reason
-
-		# Cap this response at a page boundary. Resolved before the payload is
-		# built so every table can be clamped to the same instant.
-		scope = _sync_scope(frappe.session.user)
-		page_boundary, has_more = _resolve_page_boundary(
-			last_sync_time, scope["projects"], list(scope["region_ids"]), frappe.session.user
-		)
-
-		# Get all changes since last sync
-		changes = get_changes_since(last_sync_time, page_boundary)
-
-		# Generate timestamp with validation
-		current_dt = now_datetime()
-		# WatermelonDB expects timestamp as milliseconds since epoch (number, not
-		# string). It stores whatever we return and sends it back as the next
-		# lastPulledAt, so this must be the real instant of this pull.
-		#
-		# frappe.utils.get_timestamp() is NOT usable here: it runs the value
-		# through getdate(), which returns a date, so the time component is
-		# discarded and every response claimed the client was synced as of
-		# midnight. Clients then re-requested from midnight forever and only
-		# ever received records touched today — records created earlier matched
-		# neither the "created" nor the "updated" filter and were never sent.
-		#
-		# datetime.timestamp() on a naive datetime resolves it in the process
-		# timezone, which is the same convention datetime.fromtimestamp() uses
-		# when parsing lastPulledAt above, so the round-trip stays exact.
-		#
-		# On a paginated page the watermark is the page boundary, not now:
-		# advancing to now would silently skip everything after the boundary.
-		# The client sends this value straight back as the next lastPulledAt, so
-		# it is also the cursor that resumes the next page.
-		current_timestamp = int((page_boundary or current_dt).timestamp() * 1000)
-
-		# Validate timestamp format
-		if not isinstance(current_timestamp, int) or current_timestamp <= 0:
-			frappe.log_error(
-				f"❌ [SYNC_BACKEND] Invalid timestamp generated: {current_timestamp} (type: {type(current_timestamp)})"
-			)
-			raise ValueError(f"Invalid timestamp generated: {current_timestamp}")
-
-		# Single-line completion summary (instead of ~10 chatty lines)
-		total_duration = time.time() - start_time
-		total_created = sum(len(t.get("created", [])) for t in changes.values())
-		total_updated = sum(len(t.get("updated", [])) for t in changes.values())
-		total_deleted = sum(len(t.get("deleted", [])) for t in changes.values())
-		frappe.log(
-			f"✅ [SYNC_BACKEND] pullChanges done: +{total_created} ~{total_updated} -{total_deleted} in {total_duration:.3f}s"
-			+ (f" [full: {full_sync_reason}]" if full_sync else "")
-			+ (" [page: more]" if has_more else "")
+				parsed_hashes = (
+					json.loads(raw_known_hashes) if isinstance(raw_known_hashes, str) else raw_known_hashes
+				)
+				if isinstance(parsed_hashes, list):
+					known_hashes = frozenset(h for h in parsed_hashes if isinstance(h, str))
+			except (ValueError, TypeError) as e:
+				log.warning("[SYNC_BACKEND] Ignoring unparsable knownHashes payload: %s", e)
+
+		payload = _pull_payload(
+			last_pulled_at,
+			full_sync=full_sync,
+			local_counts=local_counts,
+			is_paging=is_paging,
+			known_hashes=known_hashes,
+			page_size=page_size,
 		)
+		if is_stream:
+			return _stream_pull_response(payload.pop("changes"), payload)
 
-		return {
-			"changes": changes,
-			"timestamp": current_timestamp,
-			# Tells the client this response is a full replay rather than a
-			# delta, and why. WatermelonDB ignores extra keys; the app logs it
-			# so an escalation is visible in the request log without guessing.
-			"fullSync": bool(full_sync),
-			"fullSyncReason": full_sync_reason,
-			# More pages remain. The client should sync again immediately rather
-			# than waiting for its next interval; `timestamp` above is already
-			# the cursor to resume from.
-			"hasMore": bool(has_more),
-		}
+		# Direct callers (bench console, tests) still get the plain dict.
+		if orjson is not None and getattr(frappe.local, "request", None) is not None:
+			return _json_pull_response(payload)
+		return payload
 
 	except Exception as e:
 		total_duration = time.time() - start_time
@@ -526,6 +549,212 @@ def pull_changes(lastPulledAt=None, fullSync=None, counts=None, paging=None):
 		frappe.throw(_("Sync failed. Please try again."))
 
 
+def _pull_payload(
+	last_pulled_at=None,
+	full_sync=0,
+	local_counts=None,
+	is_paging=0,
+	known_hashes=None,
+	page_size=PULL_PAGE_SIZE,
+):
+	"""Build the ``pull_changes`` result for the session user as a plain dict.
+
+	Takes its inputs as arguments and never reads the request, so an internal
+	caller such as ``get_user_data`` gets a dict however it was reached.
+	Serialising it (orjson, NDJSON) is left to the ``pull_changes`` endpoint.
+	"""
+	start_time = time.time()
+	local_counts = local_counts or {}
+
+	full_sync_reason = "requested" if full_sync else None
+
+	# Validate and parse timestamp
+	if full_sync:
+		# Caller has no usable local data: replay history from the beginning.
+		last_sync_time = datetime.min
+	elif last_pulled_at:
+		try:
+			last_sync_time = _parse_last_pulled_at(last_pulled_at)
+		except Exception as e:
+			frappe.log_error(f"❌ [SYNC_BACKEND] Invalid timestamp: {last_pulled_at} - {e!s}")
+			frappe.throw(f"Invalid lastPulledAt timestamp: {last_pulled_at} - {e!s}")
+	else:
+		# First sync - get all data from beginning of time
+		last_sync_time = datetime.min
+		full_sync_reason = "first-sync"
+
+	# An incremental pull only ever describes the window since the
+	# watermark, so it cannot repair a device that is missing older
+	# records — whether because a bug dropped them, a write failed, or the
+	# user's scope just widened. Detect that here rather than waiting for
+	# somebody to phone support and be told to tap "Download all my data
+	# again".
+	#
+	# Except while the client is walking pages. A continuation page is an
+	# ordinary incremental request as far as this endpoint can tell — same
+	# watermark shape, and a device legitimately mid-replay is short of
+	# records and carries a watermark older than its own assignment row, so
+	# both escalation checks fire on it. Escalating means restarting the
+	# replay from record one, and the client then walks back to the same
+	# page and trips it again. Measured on a paginated replay: pages 2 and 3
+	# each re-escalated and refetched page one, so 5 requests delivered what
+	# 3 should have, and the cursor stood still twice. `paging=1` says "I
+	# know I am behind, I am already fixing it" — the safety net is for
+	# devices that are stuck, not devices making progress. The next pull
+	# without the flag re-arms it.
+	if not full_sync and not is_paging and last_sync_time != datetime.min:
+		should_escalate, reason = _resolve_full_sync(frappe.session.user, last_sync_time, local_counts)
+		if should_escalate:
+			last_sync_time = datetime.min
+			full_sync = 1
+			full_sync_reason = reason
+
+	# Cap this response at a page boundary. Resolved before the payload is
+	# built so every table can be clamped to the same instant.
+	scope = _sync_scope(frappe.session.user)
+	page_boundary, has_more = _resolve_page_boundary(
+		last_sync_time, scope["projects"], scope["region_ids"], frappe.session.user, page_size
+	)
+
+	# Read the clock before the queries rather than after them. A record
+	# written while the tables are being read is then re-sent on the next
+	# pull instead of being skipped by a watermark stamped past it.
+	pull_started_at = now_datetime()
+
+	# Get all changes since last sync
+	# A device that has never pulled holds no records, so there is nothing
+	# for a tombstone to remove. A forced full replay still needs them: the
+	# device it repairs may hold records deleted since.
+	changes = get_changes_since(
+		last_sync_time,
+		page_boundary,
+		known_hashes,
+		include_deleted=full_sync_reason != "first-sync",
+	)
+
+	# WatermelonDB expects timestamp as milliseconds since epoch (number, not
+	# string). It stores whatever we return and sends it back as the next
+	# lastPulledAt, so this must be the real instant of this pull.
+	#
+	# frappe.utils.get_timestamp() is NOT usable here: it runs the value
+	# through getdate(), which returns a date, so the time component is
+	# discarded and every response claimed the client was synced as of
+	# midnight. Clients then re-requested from midnight forever and only
+	# ever received records touched today — records created earlier matched
+	# neither the "created" nor the "updated" filter and were never sent.
+	#
+	# datetime.timestamp() on a naive datetime resolves it in the process
+	# timezone, which is the same convention datetime.fromtimestamp() uses
+	# when parsing lastPulledAt above, so the round-trip stays exact.
+	#
+	# On a paginated page the watermark is the page boundary, not now:
+	# advancing to now would silently skip everything after the boundary.
+	# The client sends this value straight back as the next lastPulledAt, so
+	# it is also the cursor that resumes the next page.
+	#
+	# Not time.time_ns(): now_datetime() is wall-clock time in the site's
+	# timezone, which is how `creation`/`modified` are stored. A true epoch
+	# would only agree with them when the worker happens to run in the
+	# site's timezone. int() already guarantees the type, so there is
+	# nothing left to validate.
+	current_timestamp = int((page_boundary or pull_started_at).timestamp() * 1000)
+
+	# The one line a pull logs at INFO; per-table detail is at DEBUG.
+	if log.isEnabledFor(logging.INFO):
+		log.info(
+			"[SYNC_BACKEND] pull user=%s dur=%.3f tables=%d created=%d updated=%d deleted=%d full=%s more=%s",
+			frappe.session.user,
+			time.time() - start_time,
+			len(changes),
+			sum(len(t.get("created", [])) for t in changes.values()),
+			sum(len(t.get("updated", [])) for t in changes.values()),
+			sum(len(t.get("deleted", [])) for t in changes.values()),
+			full_sync_reason if full_sync else "no",
+			bool(has_more),
+		)
+
+	return {
+		"changes": changes,
+		"timestamp": current_timestamp,
+		# Tells the client this response is a full replay rather than a
+		# delta, and why. WatermelonDB ignores extra keys; the app logs it
+		# so an escalation is visible in the request log without guessing.
+		"fullSync": bool(full_sync),
+		"fullSyncReason": full_sync_reason,
+		# More pages remain. The client should sync again immediately rather
+		# than waiting for its next interval; `timestamp` above is already
+		# the cursor to resume from.
+		"hasMore": bool(has_more),
+	}
+
+
+def _json_pull_response(payload):
+	"""Serialise a pull result with orjson, in Frappe's ``{"message": ...}`` envelope.
+
+	Frappe's own response path runs the whole payload through ``json.dumps``,
+	which for a full page of issues is most of the CPU the request spends after
+	the queries. orjson produces the same document several times faster and
+	writes bytes directly. Dates and datetimes go through Frappe's
+	``json_handler`` so they render exactly as before.
+	"""
+	from frappe.utils.response import json_handler
+	from werkzeug.wrappers import Response
+
+	body = orjson.dumps({"message": payload}, default=json_handler, option=orjson.OPT_PASSTHROUGH_DATETIME)
+	return Response(body, mimetype="application/json")
+
+
+def _stream_pull_response(changes, meta):
+	"""Wrap a pull result as a chunked NDJSON response, one table per line.
+
+	Lines are encoded with orjson where it is installed: it writes UTF-8 bytes
+	directly and is several times faster than ``json.dumps`` on the large
+	record lists a full replay produces. Dates and datetimes are passed through
+	to Frappe's ``json_handler`` so both encoders render them identically.
+
+	When the client accepts gzip the lines are compressed here, in one gzip
+	stream flushed after every line so a table still reaches the client as
+	soon as it is written. The JSON endpoint is left to the proxy, but its
+	stock ``gzip_types`` do not cover ``application/x-ndjson``, so without this
+	the streamed replay — the largest response the app requests — went out
+	uncompressed. Field names and ids repeat on every record, so it shrinks
+	several-fold.
+	"""
+	from frappe.utils.response import json_handler
+	from werkzeug.wrappers import Response
+
+	if orjson is not None:
+		options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE
+
+		def _dumps(obj):
+			return orjson.dumps(obj, default=json_handler, option=options)
+	else:
+
+		def _dumps(obj):
+			return (json.dumps(obj, default=json_handler, separators=(",", ":")) + "\n").encode()
+
+	def _lines():
+		# Pop as we go so each table's records can be freed once written.
+		for table_name in list(changes):
+			yield _dumps({"table": table_name, "changes": changes.pop(table_name)})
+		yield _dumps(meta)
+
+	request = getattr(frappe.local, "request", None)
+	if not (request and request.accept_encodings.quality("gzip")):
+		return Response(_lines(), mimetype="application/x-ndjson")
+
+	def _gzipped_lines():
+		compressor = zlib.compressobj(PULL_STREAM_GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip framing
+		for line in _lines():
+			yield compressor.compress(line) + compressor.flush(zlib.Z_SYNC_FLUSH)
+		yield compressor.flush()
+
+	response = Response(_gzipped_lines(), mimetype="application/x-ndjson")
+	response.headers["Content-Encoding"] = "gzip"
+	response.vary.add("Accept-Encoding")
+	return response
+
+
 @frappe.whitelist()
 def push_changes():
 	"""
@@ -534,20 +763,24 @@ def push_changes():
 	Method: POST
 	Body: {
 	    "changes": {...},
-	    "lastPulledAt": "timestamp"
+	    "lastPulledAt": "timestamp",
+	    "asyncPush": true  // optional
 	}
 
 	Returns: void (204 No Content) on success, HTTP error on failure
+
+	A client that sends ``asyncPush`` and pushes more than
+	``PUSH_BACKGROUND_THRESHOLD`` records without attachments gets a 202 with
+	``{"file_urls": {}, "job_id": ...}`` instead, and polls ``push_status``
+	for the outcome.
 	"""
 	start_time = time.time()
-	frappe.log("🔄 [SYNC_BACKEND] Starting pushChanges operation")
 
 	try:
 		# Parse request data with timing
 		parse_start = time.time()
-		data = frappe.request.get_json(silent=True) or {}
+		data = _push_request_body()
 		changes = data.get("changes", {})
-		data.get("lastPulledAt")
 
 		# ------------------------------------------------------------------
 		# 🔄  Accept Issue Actions sync: grm_issues (created/updated) and
@@ -619,11 +852,10 @@ def push_changes():
 			# mobile client (and AQE contract suite) can parse the
 			# response uniformly. The empty `file_urls` dict signals
 			# "nothing to remap".
-			frappe.log("📤 [SYNC_BACKEND] No Issue Actions changes to process – returning empty envelope")
+			log.debug("[SYNC_BACKEND] No Issue Actions changes to process – returning empty envelope")
 			return {"file_urls": {}}
 
-		parse_duration = time.time() - parse_start
-		frappe.log(f"⏱️ [SYNC_BACKEND] Request parsing took: {parse_duration:.3f}s")
+		log.debug("[SYNC_BACKEND] Request parsing took: %.3fs", time.time() - parse_start)
 
 		# Log push statistics
 		total_created = total_updated = total_deleted = 0
@@ -634,55 +866,47 @@ def push_changes():
 			total_created += created
 			total_updated += updated
 			total_deleted += deleted
-			frappe.log(f"📋 [SYNC_BACKEND] Push {table_name}: +{created} ~{updated} -{deleted}")
-
-		frappe.log(
-			f"📊 [SYNC_BACKEND] Total push changes: +{total_created} ~{total_updated} -{total_deleted}"
-		)
+			log.debug("[SYNC_BACKEND] Push %s: +%d ~%d -%d", table_name, created, updated, deleted)
+
+		# A large batch is applied off the request when the client says it can
+		# poll for the result. Attachments always stay inline: the client needs
+		# their file_urls in this response to remap its local records.
+		if (
+			data.get("asyncPush")
+			and "grm_issue_attachments" not in changes
+			and total_created + total_updated + total_deleted > PUSH_BACKGROUND_THRESHOLD
+		):
+			job_id = _enqueue_push(changes)
+			frappe.local.response.http_status_code = 202
+			return {"file_urls": {}, "job_id": job_id}
 
 		# Process changes in transaction with timing
 		transaction_start = time.time()
 		try:
-			frappe.log("💾 [SYNC_BACKEND] Starting database transaction...")
-			frappe.db.begin()
-
-			# Collect file URLs for uploaded attachments
-			file_url_mappings = {}
-
-			for table_name, table_changes in changes.items():
-				table_start = time.time()
-				if table_name == "grm_issue_attachments":
-					# Process attachments and collect file URLs
-					file_urls = process_table_changes(table_name, table_changes)
-					if file_urls:
-						file_url_mappings[table_name] = file_urls
-				else:
-					process_table_changes(table_name, table_changes)
-				table_duration = time.time() - table_start
-				frappe.log(f"⏱️ [SYNC_BACKEND] Processing {table_name} took: {table_duration:.3f}s")
-
-			frappe.db.commit()
-			transaction_duration = time.time() - transaction_start
-			frappe.log(f"✅ [SYNC_BACKEND] Database transaction completed in {transaction_duration:.3f}s")
+			file_url_mappings = _apply_push_changes(changes)
+			log.info(
+				"[SYNC_BACKEND] push user=%s dur=%.3f created=%d updated=%d deleted=%d",
+				frappe.session.user,
+				time.time() - start_time,
+				total_created,
+				total_updated,
+				total_deleted,
+			)
 
 			# API-5 contract: always return a JSON envelope with
 			# `file_urls` so the client can do `body.file_urls`
 			# unconditionally. When no attachments were processed this is
 			# an empty dict (NOT a 204). The mobile client treats an
 			# empty dict identically to "no remap needed".
-			frappe.log(f"📤 [SYNC_BACKEND] Returning file URLs: {file_url_mappings}")
+			log.debug("[SYNC_BACKEND] Returning file URLs: %s", file_url_mappings)
 			return {"file_urls": file_url_mappings}
 
 		except Exception as e:
-			frappe.db.rollback()
 			transaction_duration = time.time() - transaction_start
 			frappe.log_error(f"❌ [SYNC_BACKEND] Transaction failed after {transaction_duration:.3f}s: {e!s}")
 			frappe.log_error(f"Push changes failed: {e!s}")
 			frappe.throw(_("Failed to save changes. Please try again."))
 
-		total_duration = time.time() - start_time
-		frappe.log(f"✅ [SYNC_BACKEND] pushChanges completed successfully in {total_duration:.3f}s")
-
 	except Exception as e:
 		total_duration = time.time() - start_time
 		frappe.log_error(f"❌ [SYNC_BACKEND] pushChanges failed after {total_duration:.3f}s: {e!s}")
@@ -690,6 +914,114 @@ def push_changes():
 		frappe.throw(_("Failed to process push changes request."))
 
 
+def _push_request_body():
+	"""The pushed JSON body as a dict, or ``{}`` when absent or unparsable.
+
+	Same contract as ``get_json(silent=True) or {}``, parsed with orjson where
+	it is installed: a push of a few thousand records is dominated by parsing,
+	and orjson decodes straight from the request bytes.
+	"""
+	request = frappe.request
+	if orjson is None or not request.is_json:
+		data = request.get_json(silent=True)
+	else:
+		try:
+			data = orjson.loads(request.get_data(cache=True))
+		except orjson.JSONDecodeError:
+			data = None
+	return data if isinstance(data, dict) else {}
+
+
+def _apply_push_changes(changes):
+	"""Apply a filtered push in one transaction and return the attachment URL map.
+
+	Rolls back and re-raises on any failure, so the batch lands whole or not at
+	all — the same guarantee whether it runs in the request or in a worker.
+	"""
+	frappe.db.begin()
+	try:
+		# Collect file URLs for uploaded attachments
+		file_url_mappings = {}
+
+		for table_name, table_changes in changes.items():
+			table_start = time.time()
+			if table_name == "grm_issue_attachments":
+				# Process attachments and collect file URLs
+				file_urls = process_table_changes(table_name, table_changes)
+				if file_urls:
+					file_url_mappings[table_name] = file_urls
+			else:
+				process_table_changes(table_name, table_changes)
+			log.debug("[SYNC_BACKEND] Processing %s took: %.3fs", table_name, time.time() - table_start)
+
+		frappe.db.commit()
+		return file_url_mappings
+	except Exception:
+		frappe.db.rollback()
+		raise
+
+
+def _push_job_cache_key(job_id):
+	return f"{PUSH_JOB_CACHE_PREFIX}{job_id}"
+
+
+def _enqueue_push(changes):
+	"""Queue a push for a background worker and return the id to poll with."""
+	job_id = frappe.generate_hash(length=20)
+	frappe.cache().set_value(
+		_push_job_cache_key(job_id),
+		{"user": frappe.session.user, "status": "queued"},
+		expires_in_sec=PUSH_JOB_STATUS_TTL,
+	)
+	frappe.enqueue(
+		"egrm.api.sync._process_push",
+		# Hundreds of issues, each with its routing and SLA hooks, outrun the
+		# short queue's timeout; the long queue's leaves room for them.
+		queue="long",
+		job_id=f"grm_sync_push:{job_id}",
+		enqueue_after_commit=True,
+		changes=changes,
+		push_job_id=job_id,
+	)
+	log.info("[SYNC_BACKEND] Large push queued as job %s", job_id)
+	return job_id
+
+
+def _process_push(changes, push_job_id):
+	"""Background entry point for a queued push. Runs as the pushing user."""
+	cache_key = _push_job_cache_key(push_job_id)
+	try:
+		_apply_push_changes(changes)
+	except Exception as e:
+		frappe.log_error(f"❌ [SYNC_BACKEND] Background push {push_job_id} failed: {e!s}")
+		frappe.cache().set_value(
+			cache_key,
+			{"user": frappe.session.user, "status": "failed"},
+			expires_in_sec=PUSH_JOB_STATUS_TTL,
+		)
+		# Re-raise so the worker records the job as failed too.
+		raise
+	frappe.cache().set_value(
+		cache_key,
+		{"user": frappe.session.user, "status": "finished"},
+		expires_in_sec=PUSH_JOB_STATUS_TTL,
+	)
+
+
+@frappe.whitelist()
+def push_status(job_id):
+	"""Poll a push queued by ``push_changes``.
+
+	Returns ``{"status": "queued" | "finished" | "failed"}``. A job id that is
+	unknown, expired or owned by someone else reads as ``"unknown"`` — the
+	client should treat that like a failure and push the batch again.
+	"""
+	state = frappe.cache().get_value(_push_job_cache_key(job_id))
+	if not state or state.get("user") != frappe.session.user:
+		return {"status": "unknown"}
+	return {"status": state["status"]}
+
+
 def get_deleted_records_by_doctype(doctypes, since_timestamp, until_timestamp=None):
 	"""
 	Get deleted records for several doctypes in one query.
@@ -709,25 +1041,24 @@ def get_deleted_records_by_doctype(doctypes, since_timestamp, until_timestamp=No
 	results = {doctype: [] for doctype in doctypes}
 
 	try:
-		filters = [
-			["deleted_doctype", "in", list(doctypes)],
-			["creation", ">", since_timestamp],
-		]
-		if until_timestamp is not None:
-			filters.append(["creation", "<=", until_timestamp])
-
-		deleted_docs = frappe.get_all(
-			"Deleted Document",
-			filters=filters,
-			fields=["deleted_doctype", "deleted_name"],
-			ignore_permissions=True,  # We need to see all deleted records
+		# Plain SQL returning tuples: this runs on every pull, and the ORM's
+		# query builder, permission pass and per-row dicts bought nothing for
+		# two columns off a table every user may read through sync anyway.
+		upper = " and creation <= %(until)s" if until_timestamp is not None else ""
+		rows = frappe.db.sql(
+			f"""
+			select deleted_doctype, deleted_name
+			from `tabDeleted Document`
+			where deleted_doctype in %(doctypes)s and creation > %(since)s{upper}
+			""",
+			{"doctypes": list(doctypes), "since": since_timestamp, "until": until_timestamp},
 		)
 
-		for doc in deleted_docs:
+		for deleted_doctype, deleted_name in rows:
 			# A tombstone for a doctype we didn't ask about cannot appear given
 			# the filter, but guard anyway rather than raising mid-pull.
-			if doc.deleted_doctype in results:
-				results[doc.deleted_doctype].append(doc.deleted_name)
+			if deleted_doctype in results:
+				results[deleted_doctype].append(deleted_name)
 
 		return results
 
@@ -738,7 +1069,7 @@ def get_deleted_records_by_doctype(doctypes, since_timestamp, until_timestamp=No
 		return results
 
 
-def _resolve_page_boundary(last_sync_time, user_projects, accessible_region_ids, user):
+def _resolve_page_boundary(last_sync_time, user_projects, accessible_region_ids, user, page_size=None):
 	"""Pick the upper bound of this page, or ``None`` for "everything left".
 
 	Pagination hangs on one property of Frappe's timestamps: ``modified`` is set
@@ -757,10 +1088,14 @@ def _resolve_page_boundary(last_sync_time, user_projects, accessible_region_ids,
 	them to the same boundary drains them within the first page or two. Cost is
 	one indexed ``limit 2 offset N-1`` seek.
 
+	``page_size`` defaults to ``PULL_PAGE_SIZE``.
+
 	Returns ``(boundary, has_more)``. ``(None, False)`` means no cap: the caller
 	sends the remainder and advances the watermark to now.
 	"""
-	if not PULL_PAGE_SIZE:
+	if page_size is None:
+		page_size = PULL_PAGE_SIZE
+	if not page_size:
 		return None, False
 
 	filters = get_user_filters_for_doctype("GRM Issue", user_projects, accessible_region_ids, user)
@@ -784,7 +1119,7 @@ def _resolve_page_boundary(last_sync_time, user_projects, accessible_region_ids,
 			filters=conditions,
 			fields=["modified"],
 			order_by="modified asc",
-			start=PULL_PAGE_SIZE - 1,
+			start=page_size - 1,
 			page_length=2,
 		)
 	except Exception as e:
@@ -806,18 +1141,34 @@ def _resolve_page_boundary(last_sync_time, user_projects, accessible_region_ids,
 	boundary = raw.replace(microsecond=0) + timedelta(milliseconds=-(-raw.microsecond // 1000))
 
 	# Records sharing the boundary millisecond are all included, so a page can
-	# exceed PULL_PAGE_SIZE after a bulk import. That is deliberate: excluding
+	# exceed page_size after a bulk import. That is deliberate: excluding
 	# them would either skip them or, if they filled the whole page, stall the
 	# cursor forever.
 	return boundary, True
 
 
-def get_changes_since(last_sync_time, page_boundary=None):
+@request_cache
+def _pulled_fields(doctype):
+	"""Columns of ``doctype`` a pull selects.
+
+	Exactly what ``frappe_to_watermelon_raw`` keeps: the doctype's own columns
+	and Frappe's standard ones, but not the ``_``-prefixed bookkeeping columns
+	(``_comments``, ``_assign``, ``_liked_by``, ...) it would drop anyway. Those
+	are free-form JSON text, so ``SELECT *`` spent most of a row's width on
+	bytes that were discarded on arrival. Derived from meta, so custom fields
+	are pulled without a list to maintain.
+	"""
+	return [fieldname for fieldname in frappe.get_meta(doctype).get_valid_columns() if fieldname[0] != "_"]
+
+
+def get_changes_since(last_sync_time, page_boundary=None, known_hashes=None, include_deleted=True):
 	"""Get all changes since last sync time with user permissions and region filtering
 
 	``page_boundary`` closes the window at the top, so the response carries only
 	``last_sync_time < modified <= page_boundary``. ``None`` means no upper
-	bound.
+	bound. ``known_hashes`` is passed through to ``optimize_attachment_sync``.
+	``include_deleted=False`` skips the tombstone lookup and sends every
+	``deleted`` list empty.
 	"""
 	function_start = time.time()
 	user = frappe.session.user
@@ -828,7 +1179,7 @@ def get_changes_since(last_sync_time, page_boundary=None):
 	scope = _sync_scope(user)
 	user_accessible_projects = scope["projects"]
 	user_assignments = scope["assignments"]
-	assigned_region_ids = list(scope["region_ids"])
+	assigned_region_ids = scope["region_ids"]
 
 	# Pre-compute the BFS-expanded accessible-region set ONCE for the
 	# whole pull. Without this, get_user_filters_for_doctype re-runs the
@@ -842,22 +1193,24 @@ def get_changes_since(last_sync_time, page_boundary=None):
 		{r.get("name") or r.get("id") for r in _accessible_regions_full if (r.get("name") or r.get("id"))}
 	)
 	if not accessible_region_ids_full:
-		accessible_region_ids_full = list(assigned_region_ids)
+		accessible_region_ids_full = assigned_region_ids
 	# Stash on frappe.local.flags so get_user_filters_for_doctype reuses
 	# them. The flag is request-scoped so it auto-clears after the pull.
 	frappe.local.flags.aqe_sync_user_projects = user_accessible_projects
 	frappe.local.flags.aqe_sync_accessible_regions = accessible_region_ids_full
 
-	changes = {}
+	# Every table is present in the response, in SYNC_TABLES order, even one
+	# whose query fails below — it just comes back empty, which WatermelonDB
+	# treats the same as an absent key. Sized once instead of grown per table.
+	changes = {table_name: {"created": [], "updated": [], "deleted": []} for table_name in SYNC_TABLES}
 	total_records_processed = 0
 
-	# Track issues being synced for child table filtering
-	synced_issue_ids = set()
-
 	# Resolve every table's tombstones up front, in one query, rather than
 	# once per table inside the loop below.
-	deleted_by_doctype = get_deleted_records_by_doctype(
-		set(SYNC_TABLES.values()), last_sync_time, page_boundary
+	deleted_by_doctype = (
+		get_deleted_records_by_doctype(SYNCED_DOCTYPES, last_sync_time, page_boundary)
+		if include_deleted
+		else {}
 	)
 
 	for table_name, doctype in SYNC_TABLES.items():
@@ -871,85 +1224,66 @@ def get_changes_since(last_sync_time, page_boundary=None):
 			# Handle child table filtering separately
 			child_table_filter = user_filters.pop("_child_table_filter", None)
 
-			# Combine time filters with user filters.
+			# These filters are the access control for the whole pull: the
+			# queries below go through frappe.get_all, which applies no DocPerm
+			# check, so a table that comes back unscoped would be sent to the
+			# device in full. Refuse it rather than trust that every doctype
+			# has a branch above.
 			#
-			# Both streams are additionally clamped by `modified <= boundary` on
-			# a paginated page. "created" is bounded on modified rather than
-			# creation on purpose: modified is the ordering key the watermark
-			# advances along, and for a freshly created record the two are
-			# equal, so this is the same window expressed once.
-			created_filters = {"creation": [">", last_sync_time]}
-			updated_filters = [
-				["modified", ">", last_sync_time],
-				["creation", "<=", last_sync_time],
-			]
+			# Issue child rows carry no project or region of their own and are
+			# scoped through their parent issue instead (_issue_child_rows).
+			# Attachments only need their tombstones here: their rows, with file
+			# data, come from optimize_attachment_sync after the loop.
+			if doctype == "GRM Issue Attachment":
+				changes[table_name]["deleted"] = deleted_by_doctype.get(doctype, [])
+				continue
+			if not user_filters and not child_table_filter and doctype not in PULLED_ISSUE_CHILD_DOCTYPES:
+				frappe.log_error(f"❌ [SYNC_BACKEND] No scope filter for {doctype}; table skipped")
+				continue
+
+			# One query covers the window: a record created since the watermark
+			# was necessarily modified since it too, so everything touched in
+			# the window is fetched together and split into the created and
+			# updated streams on `creation` below.
+			#
+			# On a paginated page the window is also clamped by
+			# `modified <= boundary`: modified is the ordering key the watermark
+			# advances along, and for a freshly created record it equals
+			# creation, so the same bound serves both streams.
+			window_filters = [["modified", ">", last_sync_time]]
 			if page_boundary is not None:
-				created_filters["modified"] = ["<=", page_boundary]
-				updated_filters.append(["modified", "<=", page_boundary])
-
-			# Add user-specific filters (now properly formatted)
-			if user_filters:
-				# For created filters (dict format), add properly formatted filters
-				for key, value in user_filters.items():
-					if isinstance(value, list) and len(value) > 1:
-						created_filters[key] = ["in", value]
-					elif isinstance(value, list) and len(value) == 1:
-						created_filters[key] = value[0]
-					else:
-						created_filters[key] = value
-
-				# For updated filters (list format), add properly formatted filters
-				for key, value in user_filters.items():
-					if isinstance(value, list) and len(value) > 1:
-						updated_filters.append([key, "in", value])
-					elif isinstance(value, list) and len(value) == 1:
-						updated_filters.append([key, "=", value[0]])
-					else:
-						updated_filters.append([key, "=", value])
-
-			# Add child table filters if present
-			if child_table_filter:
-				child_doctype = child_table_filter["child_doctype"]
-				field = child_table_filter["field"]
-				values = child_table_filter["values"]
-
-				if len(values) > 1:
-					# Multiple values - use "in" operator
-					child_filter = [child_doctype, field, "in", values]
+				window_filters.append(["modified", "<=", page_boundary])
+
+			# Add user-specific filters
+			for key, value in user_filters.items():
+				if isinstance(value, list) and len(value) > 1:
+					window_filters.append([key, "in", value])
+				elif isinstance(value, list) and len(value) == 1:
+					window_filters.append([key, "=", value[0]])
 				else:
-					# Single value - use "=" operator
-					child_filter = [child_doctype, field, "=", values[0]]
-
-				# Convert created_filters to list format and add child filter.
-				# Carry the page boundary across the format switch — dropping it
-				# here would let the reference tables run past the window the
-				# client is about to acknowledge.
-				created_filters_list = [["creation", ">", last_sync_time], child_filter]
-				if page_boundary is not None:
-					created_filters_list.append(["modified", "<=", page_boundary])
-				# Replace dict format with list format for child table queries
-				created_filters = created_filters_list
-				updated_filters.append(child_filter)
-
-			# Get created records with user filtering
-			created_records = frappe.get_all(
-				doctype,
-				filters=created_filters,
-				fields=["*"],
-			)
+					window_filters.append([key, "=", value])
 
-			# Mirror the created-records query and use frappe.get_all so the
-			# per-DocPerm permission check is bypassed. The sync layer enforces
-			# access via get_user_filters_for_doctype + validate_user_record_access
-			# + (for attachments) optimize_attachment_sync's parent.isin filter,
-			# so deferring to DocPerm here would silently swallow updates for
-			# restricted-by-role child doctypes (e.g. GRM Issue Attachment for
-			# Intake-only users).
-			updated_records = frappe.get_all(
-				doctype,
-				filters=updated_filters,
-				fields=["*"],
-			)
+			if doctype in PULLED_ISSUE_CHILD_DOCTYPES:
+				created_records, updated_records = _issue_child_rows(
+					doctype, user, last_sync_time, page_boundary
+				)
+			else:
+				if child_table_filter:
+					window_records = _project_linked_rows(
+						doctype, child_table_filter, last_sync_time, page_boundary
+					)
+				else:
+					# frappe.get_all skips the per-DocPerm check. The sync layer
+					# enforces access via get_user_filters_for_doctype +
+					# validate_user_record_access, so deferring to DocPerm here
+					# would silently swallow rows of doctypes restricted by role.
+					window_records = frappe.get_all(
+						doctype,
+						filters=window_filters,
+						fields=_pulled_fields(doctype),
+					)
+				created_records = [r for r in window_records if r.creation > last_sync_time]
+				updated_records = [r for r in window_records if r.creation <= last_sync_time]
 
 			# Deleted records came from the single batched tombstone query above.
 			deleted_ids = deleted_by_doctype.get(doctype, [])
@@ -962,14 +1296,9 @@ def get_changes_since(last_sync_time, page_boundary=None):
 				created_records = _strip_foreign_drafts(created_records, user)
 				updated_records = _strip_foreign_drafts(updated_records, user)
 
-			# Track issue IDs for child table filtering
-			if doctype == "GRM Issue":
-				for record in created_records + updated_records:
-					synced_issue_ids.add(record.get("name"))
-
 			# Convert to WatermelonDB format
-			created_raw = remove_duplicates_by_id([frappe_to_watermelon_raw(rec) for rec in created_records])
-			updated_raw = remove_duplicates_by_id([frappe_to_watermelon_raw(rec) for rec in updated_records])
+			created_raw = frappe_to_watermelon_raw_bulk(created_records)
+			updated_raw = frappe_to_watermelon_raw_bulk(updated_records)
 
 			changes[table_name] = {
 				"created": created_raw,
@@ -977,11 +1306,13 @@ def get_changes_since(last_sync_time, page_boundary=None):
 				"deleted": deleted_ids,
 			}
 
-			table_duration = time.time() - table_start
-
-			# Single-line per-table summary (instead of ~10 chatty lines)
-			frappe.log(
-				f"✅ [SYNC_BACKEND] {table_name}: +{len(created_records)} ~{len(updated_records)} -{len(deleted_ids)} ({table_duration:.3f}s)"
+			log.debug(
+				"[SYNC_BACKEND] %s: +%d ~%d -%d (%.3fs)",
+				table_name,
+				len(created_raw),
+				len(updated_raw),
+				len(deleted_ids),
+				time.time() - table_start,
 			)
 
 			total_records_processed += len(created_records) + len(updated_records) + len(deleted_ids)
@@ -995,30 +1326,23 @@ def get_changes_since(last_sync_time, page_boundary=None):
 			# Continue with other tables even if one fails
 			continue
 
-	# Optimize attachment fetching with proper parent filtering
-	if "grm_issue_attachments" in changes and synced_issue_ids:
+	# Attachments are always fetched here, scoped through their parent issue.
+	# They used to be gated on this page having synced an issue, which left
+	# an attachment added to an older issue undelivered.
+	if "grm_issue_attachments" in changes:
 		changes["grm_issue_attachments"] = optimize_attachment_sync(
-			changes["grm_issue_attachments"], last_sync_time, page_boundary
+			changes["grm_issue_attachments"], last_sync_time, page_boundary, known_hashes
 		)
 
-	function_duration = time.time() - function_start
-	frappe.log(
-		f"✅ [SYNC_BACKEND] get_changes_since done: {total_records_processed} records in {function_duration:.3f}s"
+	log.debug(
+		"[SYNC_BACKEND] get_changes_since done: %d records in %.3fs",
+		total_records_processed,
+		time.time() - function_start,
 	)
 
 	return changes
 
 
-def remove_duplicates_by_id(objects):
-	seen = set()
-	unique_objects = []
-	for obj in objects:
-		if obj["id"] not in seen:
-			seen.add(obj["id"])
-			unique_objects.append(obj)
-	return unique_objects
-
-
 def get_user_filters_for_doctype(doctype, user_projects, accessible_region_ids, user):
 	"""
 	Get user-specific filters for a given doctype based on their project assignments
@@ -1034,447 +1358,503 @@ def get_user_filters_for_doctype(doctype, user_projects, accessible_region_ids,
 	"""
 
 	# Reuse the request-scoped cache populated by get_changes_since to
-	# avoid re-resolving the project list 14 times per pull. Falls back
-	# to a fresh resolution for callers outside the sync hot path.
+	# avoid re-resolving the project list 14 times per pull. Callers outside
+	# the pull loop (the page-boundary probe, the attachment scope) fall back
+	# to _sync_scope, which is request-cached too, so they resolve it at most
+	# once per request between them.
 	user_accessible_projects = (
 		getattr(frappe.local.flags, "aqe_sync_user_projects", None)
 		if hasattr(frappe, "local") and getattr(frappe, "local", None) is not None
 		else None
 	)
 	if user_accessible_projects is None:
-		user_accessible_projects = get_user_accessible_projects(user)
+		user_accessible_projects = _sync_scope(user)["projects"]
 
 	# If user has no project access, they get no data
 	if not user_accessible_projects:
 		log.warning(f"⚠️ [SYNC_BACKEND] User {user} has no project assignments")
 		frappe.throw(_("User has no access to any project"))
 
-	filters = {}
-
-	# Define project field mapping for each doctype
-	# For child tables, we need to specify the child doctype in filters
-	CHILD_TABLE_DOCTYPES = {
-		"GRM Issue Category": "GRM Project Link",
-		"GRM Issue Type": "GRM Project Link",
-		"GRM Issue Status": "GRM Project Link",
-		"GRM Issue Age Group": "GRM Project Link",
-		"GRM Issue Citizen Group": "GRM Project Link",
-		"GRM Issue Department": "GRM Project Link",
-	}
-
-	if doctype == "GRM Issue":
-		# Special case: Filter issues by both project AND accessible regions.
-		filters["project"] = user_accessible_projects  # Return just the list, not wrapped
-
-		# Reuse the BFS-expanded region set computed once in
-		# get_changes_since (cached on frappe.local.flags). Falls back to
-		# an in-place BFS for callers outside the sync hot path.
-		cached_regions = (
-			getattr(frappe.local.flags, "aqe_sync_accessible_regions", None)
-			if hasattr(frappe, "local") and getattr(frappe, "local", None) is not None
-			else None
-		)
-		if cached_regions is not None:
-			accessible_region_ids_local = list(cached_regions)
-		else:
-			from egrm.api.lookup import get_user_accessible_regions
-
-			user_assignments = get_user_region_assignments(user)
-			accessible = get_user_accessible_regions(user_assignments) or []
-			accessible_region_ids_local = list(
-				{r.get("name") or r.get("id") for r in accessible if (r.get("name") or r.get("id"))}
-			)
-			# Fall back to direct assignments when hierarchy expansion fails
-			# (defensive: never let an empty accessible-set silently leak all
-			# issues — keep the strict filter on direct assignments).
-			if not accessible_region_ids_local:
-				accessible_region_ids_local = list(
-					{a.administrative_region for a in user_assignments if a.administrative_region}
-				)
-
-		if accessible_region_ids_local:
-			filters["administrative_region"] = accessible_region_ids_local  # Return just the list
-
-	elif doctype == "GRM Administrative Region":
-		# For regions, the caller's `accessible_region_ids` already holds
-		# the user's directly-assigned region set (computed in
-		# get_changes_since from get_user_region_assignments). Reuse it
-		# to avoid a redundant per-doctype query.
-		if accessible_region_ids:
-			assigned_region_ids = list(accessible_region_ids)
-		else:
-			user_assignments = get_user_region_assignments(user)
-			assigned_region_ids = list(
-				set([a.administrative_region for a in user_assignments if a.administrative_region])
-			)
-
-		if assigned_region_ids:
-			# Filter regions by both user-assigned regions AND projects
-			filters = {
-				"name": assigned_region_ids,  # Return just the list
-				"project": user_accessible_projects,  # Return just the list
-			}
-		else:
-			# User has no region assignments, return no regions
-			filters["name"] = "NONE"
-
-	elif doctype == "GRM Project":
-		# Special case - filter by project name itself
-		filters["name"] = user_accessible_projects
-
-	elif doctype == "GRM Administrative Level Type":
-		# Direct project FK on the level-type DocType; scope to the
-		# caller's accessible projects.
-		filters["project"] = user_accessible_projects
-
-	elif doctype == "User":
-		# Only return the current user's data for privacy
-		filters["name"] = user
-
-	elif doctype in CHILD_TABLE_DOCTYPES:
-		# For doctypes with child table project links, use special child table filter
-		child_doctype = CHILD_TABLE_DOCTYPES[doctype]
-		# We'll handle this in get_changes_since with proper child table syntax
-		filters["_child_table_filter"] = {
-			"child_doctype": child_doctype,
-			"field": "project",
-			"values": user_accessible_projects,
-		}
-
-	else:
+	builder = _SCOPE_FILTER_BUILDERS.get(doctype)
+	if builder is None:
 		log.warning(f"⚠️ [SYNC_BACKEND] Unknown doctype for filtering: {doctype}")
 		# Default to no filtering for unknown doctypes
 		return {}
-
-	return filters
+	return builder(doctype, user_accessible_projects, accessible_region_ids, user)
 
 
-def validate_user_record_access(doctype, record_data, user):
-	"""
-	Validate that a user has permission to access/modify a specific record
+def _issue_filters(doctype, projects, accessible_region_ids, user):
+	# Filter issues by both project AND accessible regions.
+	filters = {"project": projects}
 
-	Args:
-	    doctype (str): The Frappe doctype
-	    record_data (dict): The record data (for validation)
-	    user (str): Current user email
+	# Reuse the BFS-expanded region set computed once in
+	# get_changes_since (cached on frappe.local.flags). Falls back to
+	# an in-place BFS for callers outside the sync hot path.
+	cached_regions = (
+		getattr(frappe.local.flags, "aqe_sync_accessible_regions", None)
+		if hasattr(frappe, "local") and getattr(frappe, "local", None) is not None
+		else None
+	)
+	if cached_regions is not None:
+		accessible_region_ids_local = list(cached_regions)
+	else:
+		scope = _sync_scope(user)
+		accessible = get_user_accessible_regions(scope["assignments"]) or []
+		accessible_region_ids_local = list(
+			{r.get("name") or r.get("id") for r in accessible if (r.get("name") or r.get("id"))}
+		)
+		# Fall back to direct assignments when hierarchy expansion fails
+		# (defensive: never let an empty accessible-set silently leak all
+		# issues — keep the strict filter on direct assignments).
+		if not accessible_region_ids_local:
+			accessible_region_ids_local = list(scope["region_ids"])
+
+	if accessible_region_ids_local:
+		filters["administrative_region"] = accessible_region_ids_local
+	return filters
 
-	Returns:
-	    bool: True if user has access, False otherwise
-	"""
 
-	# Get fresh user accessible projects (this handles admin check internally)
-	user_accessible_projects = get_user_accessible_projects(user)
+def _region_filters(doctype, projects, accessible_region_ids, user):
+	# For regions, the caller's `accessible_region_ids` already holds
+	# the user's directly-assigned region set (computed in
+	# get_changes_since from get_user_region_assignments). Reuse it
+	# to avoid a redundant per-doctype query.
+	if accessible_region_ids:
+		assigned_region_ids = list(accessible_region_ids)
+	else:
+		# Request-memoised, so a caller outside the pull does not pay for
+		# the assignment query more than once either.
+		assigned_region_ids = list(_sync_scope(user)["region_ids"])
 
-	# Check if user is Administrator or has System Manager role (handled in get_user_accessible_projects)
-	if user == "Administrator" or "System Manager" in frappe.get_roles(user):
-		frappe.log(f"🔓 [SYNC_BACKEND] User {user} has admin access - allowing record operation")
-		return True
+	if not assigned_region_ids:
+		# User has no region assignments, return no regions
+		return {"name": "NONE"}
+	# Filter regions by both user-assigned regions AND projects
+	return {"name": assigned_region_ids, "project": projects}
 
-	# If user has no project access, deny access
-	if not user_accessible_projects:
-		log.warning(f"❌ [SYNC_BACKEND] User {user} has no project assignments")
-		return False
 
-	if doctype == "GRM Issue":
-		# Drafts are private to their owner. record_data may not carry
-		# docstatus/owner on every code path (e.g. partial WatermelonDB
-		# payloads on update), so re-read them from the DB when the
-		# record already exists. New-record creates always run as the
-		# current user, so the draft they produce is by definition owned
-		# by `user` and falls through the check.
-		record_id = record_data.get("id") or record_data.get("name")
-		if record_id and frappe.db.exists("GRM Issue", record_id):
-			row = frappe.db.get_value(
-				"GRM Issue",
-				record_id,
-				("docstatus", "owner"),
-				as_dict=True,
-			)
-			if (
-				row
-				and (row.get("docstatus") or 0) == 0
-				and row.get("owner") != user
-				and not _user_can_see_others_drafts(user)
-			):
-				log.warning(
-					f"❌ [SYNC_BACKEND] User {user} cannot access draft "
-					f"GRM Issue {record_id} owned by {row.get('owner')}"
-				)
-				return False
+def _project_filters(doctype, projects, accessible_region_ids, user):
+	# Filter by project name itself
+	return {"name": projects}
 
-		# Check if issue belongs to user's accessible project
-		issue_project = record_data.get("project")
 
-		if issue_project not in user_accessible_projects:
-			log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access project {issue_project}")
-			return False
+def _project_column_filters(doctype, projects, accessible_region_ids, user):
+	# Direct project column: level types carry a project FK, and project
+	# link rows are scoped by the project they point at.
+	return {"project": projects}
 
-		# Also check region access for issues, but use the user's full
-		# accessible-region hierarchy (assigned region + all descendants)
-		# — not just the direct assignment row. A user assigned at the
-		# Country level should be able to file/process issues in every
-		# village under that country, mirroring the lookup envelope the
-		# mobile client receives via `lookup.user_context.accessible_regions`.
-		issue_region = record_data.get("administrative_region")
-		if issue_region:
-			from egrm.api.lookup import (
-				get_user_accessible_regions,
-				get_user_region_assignments,
-			)
 
-			user_assignments = get_user_region_assignments(user)
-			accessible = get_user_accessible_regions(user_assignments) or []
-			accessible_region_ids = {r.get("name") or r.get("id") for r in accessible}
-			# Always include direct assignments as a defensive fallback
-			for a in user_assignments:
-				if a.administrative_region:
-					accessible_region_ids.add(a.administrative_region)
-
-			if issue_region not in accessible_region_ids:
-				log.warning(
-					f"❌ [SYNC_BACKEND] User {user} cannot access region {issue_region} "
-					f"(accessible regions: {len(accessible_region_ids)} via hierarchy)"
-				)
-				return False
+def _user_filters(doctype, projects, accessible_region_ids, user):
+	# Only return the current user's data for privacy
+	return {"name": user}
 
-	elif doctype == "GRM Administrative Region":
-		# Check if region is assigned to user and project is accessible
-		region_id = record_data.get("name") or record_data.get("id")
-		region_project = record_data.get("project")
 
-		# Check project access first
-		if region_project not in user_accessible_projects:
-			log.warning(
-				f"❌ [SYNC_BACKEND] User {user} cannot access project {region_project} for region {region_id}"
-			)
-			return False
+def _issue_child_filters(doctype, projects, accessible_region_ids, user):
+	# No scope columns of their own: these are filtered through their
+	# parent issue by _issue_child_rows, not by a filter dict.
+	return {}
 
-		# Check region assignment
-		user_assignments = get_user_region_assignments(user)
-		assigned_region_ids = list(set([assignment.administrative_region for assignment in user_assignments]))
 
-		if region_id not in assigned_region_ids:
-			log.warning(f"❌ [SYNC_BACKEND] User {user} is not assigned to region {region_id}")
-			return False
+def _project_linked_filters(doctype, projects, accessible_region_ids, user):
+	# Scoped through their GRM Project Link rows; applied by
+	# _project_linked_rows in get_changes_since.
+	return {
+		"_child_table_filter": {
+			"child_doctype": "GRM Project Link",
+			"field": "project",
+			"values": projects,
+		}
+	}
 
-	elif doctype == "GRM Project":
-		# Check if project is accessible to user
-		project_id = record_data.get("name") or record_data.get("id")
-		if project_id not in user_accessible_projects:
-			log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access project {project_id}")
-			return False
 
-	elif doctype in [
+# Project-scoped lookup tables, and the issue-action child tables whose rows
+# must be written by the pushing user.
+_LOOKUP_DOCTYPES = frozenset(
+	{
 		"GRM Issue Category",
 		"GRM Issue Type",
 		"GRM Issue Status",
 		"GRM Issue Age Group",
 		"GRM Issue Citizen Group",
 		"GRM Issue Department",
-	]:
-		# For lookup tables, check project access if they have a project field
-		record_project = record_data.get("project")
-		if record_project and record_project not in user_accessible_projects:
-			log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access project {record_project} for {doctype}")
-			return False
+	}
+)
+_ACTION_DOCTYPES = frozenset({"GRM Issue Log", "GRM Issue Comment"})
+
+# One scope-filter builder per synced doctype, so the pull loop looks its
+# table's filter up instead of walking a branch per doctype. Each builder
+# takes (doctype, projects, accessible_region_ids, user).
+_SCOPE_FILTER_BUILDERS = {
+	"GRM Issue": _issue_filters,
+	"GRM Administrative Region": _region_filters,
+	"GRM Project": _project_filters,
+	"GRM Administrative Level Type": _project_column_filters,
+	"GRM Project Link": _project_column_filters,
+	"User": _user_filters,
+	**dict.fromkeys(CHILD_TABLE_DOCTYPES, _issue_child_filters),
+	**dict.fromkeys(_LOOKUP_DOCTYPES, _project_linked_filters),
+}
 
-	elif doctype == "User":
-		# Only allow access to current user's own record
-		record_user = record_data.get("name") or record_data.get("id")
-		if record_user != user:
-			log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access other user's record {record_user}")
-			return False
 
-	elif doctype in ["GRM Issue Log", "GRM Issue Comment"]:
-		# For Issue Actions child tables, validate that the user creating the record
-		# is the same as the current user (Issue Actions are always performed by the current user)
-		record_user = record_data.get("user")
-		if record_user and record_user != user:
+@request_cache
+def _record_access_scope(user):
+	"""The user's project and directly-assigned region sets, for push validation.
+
+	``validate_user_record_access`` runs once per pushed record. Resolving the
+	scope inside it meant an assignment query, a project query and a role lookup
+	for every row of a batch — the same answer each time. Built on
+	``_sync_scope`` so the lookups are shared with the rest of the request, and
+	frozen so each membership test is a hash lookup.
+	"""
+	scope = _sync_scope(user)
+	return {
+		"projects": frozenset(scope["projects"]),
+		"region_ids": frozenset(scope["region_ids"]),
+	}
+
+
+@request_cache
+def _accessible_region_set(user):
+	"""Every region ``user`` may file issues in: the hierarchy-expanded set
+	plus direct assignments as a defensive fallback. Resolved once per request;
+	the hierarchy walk reads each assigned project's whole region table."""
+	accessible = get_user_accessible_regions(_sync_scope(user)["assignments"]) or []
+	region_ids = {r.get("name") or r.get("id") for r in accessible}
+	region_ids.update(_record_access_scope(user)["region_ids"])
+	return frozenset(region_ids)
+
+
+def _validate_issue_access(doctype, record_data, user, scope):
+	# Drafts are private to their owner. record_data may not carry
+	# docstatus/owner on every code path (e.g. partial WatermelonDB
+	# payloads on update), so re-read them from the DB when the
+	# record already exists. New-record creates always run as the
+	# current user, so the draft they produce is by definition owned
+	# by `user` and falls through the check.
+	get = record_data.get
+	record_id = get("id") or get("name")
+	if record_id and frappe.db.exists("GRM Issue", record_id):
+		row = frappe.db.get_value(
+			"GRM Issue",
+			record_id,
+			("docstatus", "owner"),
+			as_dict=True,
+		)
+		if (
+			row
+			and (row.get("docstatus") or 0) == 0
+			and row.get("owner") != user
+			and not _user_can_see_others_drafts(user)
+		):
 			log.warning(
-				f"❌ [SYNC_BACKEND] User {user} cannot create {doctype} record for other user {record_user}"
+				f"❌ [SYNC_BACKEND] User {user} cannot access draft "
+				f"GRM Issue {record_id} owned by {row.get('owner')}"
 			)
 			return False
 
-		# Note: Additional validation for parent issue access is handled by the mobile app
-		# before sending the sync request, so we trust that the user has access to the related issue
-		frappe.log(f"✅ [SYNC_BACKEND] User {user} can create {doctype} record")
+	# Check if issue belongs to user's accessible project
+	issue_project = get("project")
 
-	frappe.log(f"✅ [SYNC_BACKEND] User {user} has access to {doctype} record")
-	return True
+	if issue_project not in scope["projects"]:
+		log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access project {issue_project}")
+		return False
 
+	# Also check region access for issues, but use the user's full
+	# accessible-region hierarchy (assigned region + all descendants)
+	# — not just the direct assignment row. A user assigned at the
+	# Country level should be able to file/process issues in every
+	# village under that country, mirroring the lookup envelope the
+	# mobile client receives via `lookup.user_context.accessible_regions`.
+	issue_region = get("administrative_region")
+	if issue_region:
+		accessible_region_ids = _accessible_region_set(user)
+		if issue_region not in accessible_region_ids:
+			log.warning(
+				f"❌ [SYNC_BACKEND] User {user} cannot access region {issue_region} "
+				f"(accessible regions: {len(accessible_region_ids)} via hierarchy)"
+			)
+			return False
 
-def process_table_changes(table_name, table_changes):
-	"""Process changes for a specific table with detailed logging"""
-	start_time = time.time()
-	frappe.log(f"📋 [SYNC_BACKEND] Processing changes for table: {table_name}")
+	return True
 
-	# Convert table name back to DocType
-	doctype = SYNC_TABLES.get(table_name)
-	if not doctype:
-		frappe.log_error(f"❌ [SYNC_BACKEND] Unknown table name: {table_name}")
-		raise ValueError(f"Unknown table name: {table_name}")
 
-	frappe.log(f"📋 [SYNC_BACKEND] Mapped {table_name} -> {doctype}")
+def _validate_region_access(doctype, record_data, user, scope):
+	# Check if region is assigned to user and project is accessible
+	region_id = record_data.get("name") or record_data.get("id")
+	region_project = record_data.get("project")
 
-	# Track file URLs for attachments
-	file_urls = {}
+	# Check project access first
+	if region_project not in scope["projects"]:
+		log.warning(
+			f"❌ [SYNC_BACKEND] User {user} cannot access project {region_project} for region {region_id}"
+		)
+		return False
 
-	# Process created records
-	created_records = table_changes.get("created", [])
-	if created_records:
-		created_start = time.time()
-		frappe.log(f"📝 [SYNC_BACKEND] Processing {len(created_records)} created records...")
+	# Check region assignment
+	if region_id not in scope["region_ids"]:
+		log.warning(f"❌ [SYNC_BACKEND] User {user} is not assigned to region {region_id}")
+		return False
 
-		for i, raw_record in enumerate(created_records):
-			try:
-				record_start = time.time()
-				frappe.log(f"✏️ [SYNC_BACKEND] raw_record record {raw_record}")
-
-				# Special handling for attachments to collect file URLs
-				if doctype == "GRM Issue Attachment":
-					file_url = create_record(doctype, raw_record, return_file_url=True)
-					if file_url and raw_record.get("id"):
-						file_urls[raw_record["id"]] = file_url
-				else:
-					create_record(doctype, raw_record)
+	return True
 
-				record_duration = time.time() - record_start
-				frappe.log(
-					f"📝 [SYNC_BACKEND] Created record {i+1}/{len(created_records)} in {record_duration:.3f}s"
-				)
-			except Exception as e:
-				frappe.log_error(f"❌ [SYNC_BACKEND] Failed to create {doctype} record {i+1}: {e!s}")
-				raise
 
-		created_duration = time.time() - created_start
-		frappe.log(f"✅ [SYNC_BACKEND] Created {len(created_records)} records in {created_duration:.3f}s")
+def _validate_project_access(doctype, record_data, user, scope):
+	project_id = record_data.get("name") or record_data.get("id")
+	if project_id not in scope["projects"]:
+		log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access project {project_id}")
+		return False
+	return True
 
-	# Process updated records
-	updated_records = table_changes.get("updated", [])
-	if updated_records:
-		updated_start = time.time()
-		frappe.log(f"✏️ [SYNC_BACKEND] Processing {len(updated_records)} updated records...")
 
-		for i, raw_record in enumerate(updated_records):
-			try:
-				record_start = time.time()
-				update_record(doctype, raw_record)
-				record_duration = time.time() - record_start
-				frappe.log(
-					f"✏️ [SYNC_BACKEND] Updated record {i+1}/{len(updated_records)} in {record_duration:.3f}s"
-				)
-			except Exception as e:
-				frappe.log_error(f"❌ [SYNC_BACKEND] Failed to update {doctype} record {i+1}: {e!s}")
-				raise
+def _validate_lookup_access(doctype, record_data, user, scope):
+	# For lookup tables, check project access if they have a project field
+	record_project = record_data.get("project")
+	if record_project and record_project not in scope["projects"]:
+		log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access project {record_project} for {doctype}")
+		return False
+	return True
 
-		updated_duration = time.time() - updated_start
-		frappe.log(f"✅ [SYNC_BACKEND] Updated {len(updated_records)} records in {updated_duration:.3f}s")
 
-	# Process deleted records
-	deleted_ids = table_changes.get("deleted", [])
-	if deleted_ids:
-		deleted_start = time.time()
-		frappe.log(f"🗑️ [SYNC_BACKEND] Processing {len(deleted_ids)} deleted records...")
+def _validate_user_access(doctype, record_data, user, scope):
+	# Only allow access to current user's own record
+	record_user = record_data.get("name") or record_data.get("id")
+	if record_user != user:
+		log.warning(f"❌ [SYNC_BACKEND] User {user} cannot access other user's record {record_user}")
+		return False
+	return True
 
-		for i, record_id in enumerate(deleted_ids):
-			try:
-				record_start = time.time()
-				delete_record(doctype, record_id)
-				record_duration = time.time() - record_start
-				frappe.log(
-					f"🗑️ [SYNC_BACKEND] Deleted record {i+1}/{len(deleted_ids)} in {record_duration:.3f}s"
-				)
+
+def _validate_issue_action_access(doctype, record_data, user, scope):
+	# For Issue Actions child tables, validate that the user creating the record
+	# is the same as the current user (Issue Actions are always performed by the current user)
+	record_user = record_data.get("user")
+	if record_user and record_user != user:
+		log.warning(
+			f"❌ [SYNC_BACKEND] User {user} cannot create {doctype} record for other user {record_user}"
+		)
+		return False
+
+	# Access to the parent issue is checked when it is loaded, by
+	# _get_parent_issue, not here for every row.
+	return True
+
+
+# One access check per doctype. Doctypes not listed here (e.g. GRM Issue
+# Attachment, which is scoped through its parent issue) pass once the user has
+# any project at all.
+_RECORD_ACCESS_VALIDATORS = {
+	"GRM Issue": _validate_issue_access,
+	"GRM Administrative Region": _validate_region_access,
+	"GRM Project": _validate_project_access,
+	"User": _validate_user_access,
+	**dict.fromkeys(_LOOKUP_DOCTYPES, _validate_lookup_access),
+	**dict.fromkeys(_ACTION_DOCTYPES, _validate_issue_action_access),
+}
+
+
+def validate_user_record_access(doctype, record_data, user):
+	"""
+	Validate that a user has permission to access/modify a specific record
+
+	Args:
+	    doctype (str): The Frappe doctype
+	    record_data (dict | Document): The record data (for validation); only
+	        read through ``.get()``
+	    user (str): Current user email
+
+	Returns:
+	    bool: True if user has access, False otherwise
+	"""
+
+	# Admins short-circuit before their project scope is resolved: they never
+	# need it, and it costs a project and an assignment query.
+	if user == "Administrator" or "System Manager" in _user_roles(user):
+		return True
+
+	# Scope is resolved once per request and shared by every record in the
+	# push, not re-read from the database for each one.
+	scope = _record_access_scope(user)
+
+	# If user has no project access, deny access
+	if not scope["projects"]:
+		log.warning(f"❌ [SYNC_BACKEND] User {user} has no project assignments")
+		return False
+
+	validator = _RECORD_ACCESS_VALIDATORS.get(doctype)
+	if validator and not validator(doctype, record_data, user, scope):
+		return False
+
+	return True
+
+
+def _existing_names(doctype, names):
+	"""The subset of ``names`` that already exist in ``doctype``, in one query."""
+	names = [n for n in names if n]
+	if not names:
+		return set()
+	return set(frappe.get_all(doctype, filters={"name": ["in", names]}, pluck="name"))
+
+
+def process_table_changes(table_name, table_changes):
+	"""Apply one table's pushed changes.
+
+	Logs one summary line per table. Per-record progress goes to the module
+	logger at debug level only: these loops run once per pushed record, and
+	``frappe.log`` lines — some of which serialised whole records — were the
+	bulk of the time spent in them.
+	"""
+	start_time = time.time()
+
+	# Convert table name back to DocType
+	doctype = SYNC_TABLES.get(table_name)
+	if not doctype:
+		frappe.log_error(f"❌ [SYNC_BACKEND] Unknown table name: {table_name}")
+		raise ValueError(f"Unknown table name: {table_name}")
+
+	# Track file URLs for attachments
+	file_urls = {}
+
+	created_records = table_changes.get("created", [])
+	updated_records = table_changes.get("updated", [])
+	deleted_ids = table_changes.get("deleted", [])
+
+	# Classify every id in the batch against the table with one query, rather
+	# than one exists() probe per record in each of the three phases. Child
+	# rows are appended to their parent without an existence check, so their
+	# created ids are not looked up.
+	lookup_ids = [r.get("id") for r in updated_records]
+	if doctype not in CHILD_TABLE_DOCTYPES:
+		lookup_ids += [r.get("id") for r in created_records]
+	lookup_ids += deleted_ids
+	existing = _existing_names(doctype, lookup_ids)
+
+	# Process created records. Child rows (attachments included, which is
+	# where the uploaded file URLs come from) are applied per parent issue so
+	# each parent is loaded and saved once for the whole batch.
+	if doctype in CHILD_TABLE_DOCTYPES:
+		if created_records:
+			try:
+				file_urls = create_child_records(doctype, created_records)
+			except Exception as e:
+				frappe.log_error(f"❌ [SYNC_BACKEND] Failed to create {doctype} records: {e!s}")
+				raise
+			existing.update(r.get("id") for r in created_records)
+	else:
+		for i, raw_record in enumerate(created_records):
+			try:
+				create_record(doctype, raw_record, exists=raw_record.get("id") in existing)
+				# Keep the snapshot true for a later duplicate or delete of the
+				# same id within this batch.
+				existing.add(raw_record.get("id"))
 			except Exception as e:
-				log.warning(f"⚠️ [SYNC_BACKEND] Failed to delete {doctype} record {record_id}: {e!s}")
-				# Don't raise for delete failures - record might already be deleted
+				frappe.log_error(f"❌ [SYNC_BACKEND] Failed to create {doctype} record {i + 1}: {e!s}")
+				raise
 
-		deleted_duration = time.time() - deleted_start
-		frappe.log(f"✅ [SYNC_BACKEND] Processed {len(deleted_ids)} deletions in {deleted_duration:.3f}s")
+	# Process updated records. Each record is checked and reduced to its
+	# changed columns here; the writes then go out as ceil(N / chunk) CASE
+	# WHEN statements instead of one UPDATE per record. Updates never ran the
+	# controller, so nothing is lost by not going through a document.
+	doc_updates = {}
+	for i, raw_record in enumerate(updated_records):
+		try:
+			fields_to_update = _fields_to_update(doctype, raw_record, exists=raw_record.get("id") in existing)
+		except Exception as e:
+			frappe.log_error(f"❌ [SYNC_BACKEND] Failed to update {doctype} record {i + 1}: {e!s}")
+			raise
+		if fields_to_update:
+			# A record pushed twice in one batch keeps its last value per field.
+			doc_updates.setdefault(raw_record["id"], {}).update(fields_to_update)
 
-	total_duration = time.time() - start_time
-	total_records = len(created_records) + len(updated_records) + len(deleted_ids)
-	frappe.log(
-		f"✅ [SYNC_BACKEND] Completed {table_name} processing: {total_records} total records in {total_duration:.3f}s"
+	if doc_updates:
+		frappe.db.bulk_update(doctype, doc_updates, chunk_size=PUSH_UPDATE_CHUNK_SIZE, update_modified=False)
+		for record_id in doc_updates:
+			frappe.clear_document_cache(doctype, record_id)
+
+	# Process deleted records
+	for record_id in deleted_ids:
+		try:
+			delete_record(doctype, record_id, exists=record_id in existing)
+		except Exception as e:
+			log.warning(f"⚠️ [SYNC_BACKEND] Failed to delete {doctype} record {record_id}: {e!s}")
+			# Don't raise for delete failures - record might already be deleted
+
+	log.debug(
+		"[SYNC_BACKEND] %s: +%d ~%d -%d applied in %.3fs",
+		table_name,
+		len(created_records),
+		len(updated_records),
+		len(deleted_ids),
+		time.time() - start_time,
 	)
 
 	# Return file URLs for attachments
 	if doctype == "GRM Issue Attachment" and file_urls:
-		frappe.log(f"📎 [SYNC_BACKEND] Returning file URLs for {len(file_urls)} attachments")
 		return file_urls
 
 	return None
 
 
-def create_record(doctype, raw_record, return_file_url=False):
-	"""Create new record from WatermelonDB data with enhanced logging"""
-	create_start = time.time()
+# Columns a pushed record may not set on insert: Frappe owns the timestamps,
+# and amendment links are only created by the amend flow itself.
+_CREATE_EXCLUDED_FIELDS = frozenset({"creation", "modified", "amended_from"})
+
+
+@request_cache
+def _writable_fields(doctype):
+	"""Columns of ``doctype`` a pushed record may set on insert.
+
+	Replaces a ``hasattr(doc, field)`` probe per field per record, which also
+	answered True for any Document method name a payload happened to carry.
+	"""
+	return frozenset(frappe.get_meta(doctype).get_valid_columns()) - _CREATE_EXCLUDED_FIELDS
+
+
+def create_record(doctype, raw_record, return_file_url=False, exists=None):
+	"""Create new record from WatermelonDB data
+
+	``exists`` lets a batch caller pass in what it already knows about the
+	record; ``None`` probes the database.
+	"""
 	record_id = raw_record.get("id")
 	user = frappe.session.user
-	frappe.log(f"📝 [SYNC_BACKEND] Creating {doctype} record with ID: {record_id} by user: {user}")
 
 	if not record_id:
 		frappe.log_error(f"❌ [SYNC_BACKEND] Missing ID in raw record for {doctype}")
 		raise ValueError("Missing record ID for creation")
 
 	# Validate user has permission to create this record
-	validation_start = time.time()
 	if not validate_user_record_access(doctype, raw_record, user):
-		validation_duration = time.time() - validation_start
 		frappe.log_error(
-			f"❌ [SYNC_BACKEND] User {user} lacks permission to create {doctype} record {record_id} (validation took {validation_duration:.4f}s)"
+			f"❌ [SYNC_BACKEND] User {user} lacks permission to create {doctype} record {record_id}"
 		)
 		raise frappe.PermissionError(f"Permission denied to create {doctype} record")
-	validation_duration = time.time() - validation_start
-	frappe.log(f"🔒 [SYNC_BACKEND] Permission validation took: {validation_duration:.4f}s")
 
 	# Handle child table creation differently
-	if doctype in ["GRM Issue Log", "GRM Issue Comment", "GRM Issue Attachment"]:
+	if doctype in CHILD_TABLE_DOCTYPES:
 		return create_child_record(doctype, raw_record, return_file_url=return_file_url)
 
 	# Check if record already exists
-	existence_check_start = time.time()
-	record_exists = frappe.db.exists(doctype, record_id)
-	existence_check_duration = time.time() - existence_check_start
-	frappe.log(f"🔍 [SYNC_BACKEND] Existence check took: {existence_check_duration:.4f}s")
-
+	record_exists = frappe.db.exists(doctype, record_id) if exists is None else exists
 	if record_exists:
 		log.warning(f"⚠️ [SYNC_BACKEND] Record {record_id} already exists, updating instead")
-		return update_record(doctype, raw_record)
+		return update_record(doctype, raw_record, exists=True)
 
 	# Convert WatermelonDB data to Frappe format
-	conversion_start = time.time()
 	frappe_data = watermelon_to_frappe_data(raw_record)
-	conversion_duration = time.time() - conversion_start
-	frappe.log(f"🔄 [SYNC_BACKEND] Data conversion took: {conversion_duration:.4f}s")
 
 	# Create new document
-	doc_creation_start = time.time()
 	doc = frappe.new_doc(doctype)
-	doc_creation_duration = time.time() - doc_creation_start
-	frappe.log(f"Final frappe_data {frappe_data}")
-	frappe.log(f"📄 [SYNC_BACKEND] Document creation took: {doc_creation_duration:.4f}s")
 
 	# Set the name for sync records - store the desired name in a temporary attribute
 	doc._sync_name = record_id
 
 	# Set all fields
-	field_setting_start = time.time()
-	field_count = 0
+	writable = _writable_fields(doctype)
 	for field, value in frappe_data.items():
-		print("Field validation", field, hasattr(doc, field))
-		if hasattr(doc, field) and field not in [
-			"creation",
-			"modified",
-			"amended_from",
-		]:
+		if field in writable:
 			setattr(doc, field, value)
-			field_count += 1
-	field_setting_duration = time.time() - field_setting_start
-	frappe.log(f"Final fields after conversion {doc.__dict__}")
-	frappe.log(f"🏗️ [SYNC_BACKEND] Field setting took: {field_setting_duration:.4f}s ({field_count} fields)")
 
 	# Insert the document
-	insert_start = time.time()
 	doc.insert(ignore_permissions=False)  # Respect permissions
 	# Auto-submit a freshly-created GRM Issue so the mobile-app contract
 	# holds: by the time CitizenReportStep4 (success screen) is shown the
@@ -1490,28 +1870,13 @@ def create_record(doctype, raw_record, return_file_url=False):
 		if doc.docstatus == 0:
 			doc.flags.ignore_permissions = True
 			doc.submit()
-	insert_duration = time.time() - insert_start
-	frappe.log(f"💾 [SYNC_BACKEND] Document insertion took: {insert_duration:.4f}s")
 
-	create_duration = time.time() - create_start
-	frappe.log(f"✅ [SYNC_BACKEND] Created {doctype} record {record_id} in {create_duration:.4f}s")
-	frappe.log("📊 [SYNC_BACKEND] Create breakdown:")
-	frappe.log(f"  - Permission validation: {validation_duration:.4f}s")
-	frappe.log(f"  - Existence check: {existence_check_duration:.4f}s")
-	frappe.log(f"  - Data conversion: {conversion_duration:.4f}s")
-	frappe.log(f"  - Doc creation: {doc_creation_duration:.4f}s")
-	frappe.log(f"  - Field setting: {field_setting_duration:.4f}s")
-	frappe.log(f"  - Document insert: {insert_duration:.4f}s")
+	log.debug("[SYNC_BACKEND] Created %s record %s", doctype, record_id)
 
 
 def create_child_record(doctype, raw_record, return_file_url=False):
 	"""Create child table record by adding it to parent document"""
-	create_start = time.time()
 	record_id = raw_record.get("id")
-	user = frappe.session.user
-	frappe.log(
-		f"📝 [SYNC_BACKEND] Creating child table {doctype} record with ID: {record_id} by user: {user}"
-	)
 
 	# Get parent issue ID from raw record
 	parent_issue_id = raw_record.get("grm_issue")
@@ -1519,47 +1884,126 @@ def create_child_record(doctype, raw_record, return_file_url=False):
 		frappe.log_error(f"❌ [SYNC_BACKEND] Missing parent issue ID in {doctype} record {record_id}")
 		raise ValueError(f"Missing parent issue ID for {doctype} child record")
 
-	# Check if parent issue exists
-	parent_exists = frappe.db.exists("GRM Issue", parent_issue_id)
-	if not parent_exists:
+	parent_doc = _get_parent_issue(doctype, parent_issue_id, record_id)
+	created_file_url = _append_child(parent_doc, doctype, raw_record)
+	_save_parent_issue(parent_doc)
+
+	log.debug("[SYNC_BACKEND] Created %s record %s on %s", doctype, record_id, parent_issue_id)
+
+	# Return file URL if requested and available
+	if return_file_url and created_file_url:
+		return created_file_url
+
+	return None
+
+
+def create_child_records(doctype, raw_records):
+	"""Create a batch of child rows, loading and saving each parent issue once.
+
+	``create_child_record`` loads the whole ``GRM Issue`` (with every child
+	table) and saves it again for each row; a push carrying K comments or
+	attachments for one issue did that K times. Here the rows are grouped by
+	parent, appended in memory, and each parent is saved once. Returns
+	``{record_id: file_url}`` for attachments whose file was uploaded.
+	"""
+	user = frappe.session.user
+	file_urls = {}
+
+	by_parent = {}
+	for raw_record in raw_records:
+		record_id = raw_record.get("id")
+		if not record_id:
+			frappe.log_error(f"❌ [SYNC_BACKEND] Missing ID in raw record for {doctype}")
+			raise ValueError("Missing record ID for creation")
+
+		if not validate_user_record_access(doctype, raw_record, user):
+			frappe.log_error(
+				f"❌ [SYNC_BACKEND] User {user} lacks permission to create {doctype} record {record_id}"
+			)
+			raise frappe.PermissionError(f"Permission denied to create {doctype} record")
+
+		parent_issue_id = raw_record.get("grm_issue")
+		if not parent_issue_id:
+			frappe.log_error(f"❌ [SYNC_BACKEND] Missing parent issue ID in {doctype} record {record_id}")
+			raise ValueError(f"Missing parent issue ID for {doctype} child record")
+
+		by_parent.setdefault(parent_issue_id, []).append(raw_record)
+
+	# Every parent is loaded and checked before any is saved, so a missing or
+	# out-of-scope parent fails the batch without a partial write.
+	parents = {
+		parent_issue_id: _get_parent_issue(doctype, parent_issue_id, children[0].get("id"))
+		for parent_issue_id, children in by_parent.items()
+	}
+
+	for parent_issue_id, children in by_parent.items():
+		parent_doc = parents[parent_issue_id]
+		for raw_record in children:
+			file_url = _append_child(parent_doc, doctype, raw_record)
+			if file_url:
+				file_urls[raw_record["id"]] = file_url
+		_save_parent_issue(parent_doc)
+
+		log.debug("[SYNC_BACKEND] Created %d %s records on %s", len(children), doctype, parent_issue_id)
+
+	return file_urls
+
+
+def _get_parent_issue(doctype, parent_issue_id, record_id):
+	"""Load the ``GRM Issue`` a pushed child row belongs to, and check that the
+	current user may see it.
+
+	The row validators only look at the row itself; this is what keeps a
+	comment, log or attachment off an issue outside the user's scope.
+	"""
+	try:
+		parent_doc = frappe.get_doc("GRM Issue", parent_issue_id)
+	except frappe.DoesNotExistError:
 		frappe.log_error(
 			f"❌ [SYNC_BACKEND] Parent issue {parent_issue_id} does not exist for {doctype} record {record_id}"
 		)
-		raise ValueError(f"Parent issue {parent_issue_id} does not exist")
+		raise ValueError(f"Parent issue {parent_issue_id} does not exist") from None
+
+	user = frappe.session.user
+	if not validate_user_record_access("GRM Issue", parent_doc, user):
+		frappe.log_error(
+			f"❌ [SYNC_BACKEND] User {user} cannot add {doctype} record {record_id} to issue {parent_issue_id}"
+		)
+		raise frappe.PermissionError(f"Permission denied to add {doctype} records to this issue")
+
+	return parent_doc
+
+
+# Parent linkage on a pushed child row, which _append_child sets itself.
+_CHILD_RESERVED_FIELDS = frozenset({"grm_issue", "name", "parent", "parenttype", "parentfield"})
 
-	# Get parent document
-	parent_doc = frappe.get_doc("GRM Issue", parent_issue_id)
-	frappe.log(f"📋 [SYNC_BACKEND] Retrieved parent issue {parent_issue_id}")
+
+def _append_child(parent_doc, doctype, raw_record):
+	"""Build a child row from ``raw_record`` and append it to ``parent_doc``.
+
+	Only mutates the in-memory parent; the caller saves it. Returns the URL of
+	the file created for an attachment upload, if any.
+	"""
+	record_id = raw_record.get("id")
+	parent_issue_id = parent_doc.name
 
 	# Convert WatermelonDB data to Frappe format
-	conversion_start = time.time()
 	frappe_data = watermelon_to_frappe_data(raw_record)
-	conversion_duration = time.time() - conversion_start
-	frappe.log(f"🔄 [SYNC_BACKEND] Data conversion took: {conversion_duration:.4f}s")
 
 	# Special handling for GRM Issue Attachment with file data
 	created_file_url = None
 	if doctype == "GRM Issue Attachment" and raw_record.get("file_data") and raw_record.get("needs_upload"):
-		frappe.log(f"📎 [SYNC_BACKEND] Processing file upload for attachment {record_id}")
-		frappe.log(
-			f"📎 [SYNC_BACKEND] File details: name={raw_record.get('file_name')}, has_data={bool(raw_record.get('file_data'))}"
-		)
-
 		file_url = create_file_from_base64(raw_record, parent_issue_id)
 		if file_url:
 			frappe_data["attachment"] = file_url
 			created_file_url = file_url
-			frappe.log(f"📎 [SYNC_BACKEND] Created file attachment: {file_url}")
 		else:
 			frappe.log_error(f"❌ [SYNC_BACKEND] Failed to create file for attachment {record_id}")
-			frappe.log_error(f"❌ [SYNC_BACKEND] Raw record debug info: {raw_record}")
 			# Don't raise error - continue without file, let attachment record be created
-			frappe.log(f"⚠️ [SYNC_BACKEND] Continuing without file for attachment {record_id}")
 			# Set attachment field to the original attachment value if it exists, or file_name as fallback
-			if raw_record.get("attachment"):
-				frappe_data["attachment"] = raw_record.get("attachment")
-			else:
-				frappe_data["attachment"] = raw_record.get("file_name", "unknown_file")
+			frappe_data["attachment"] = raw_record.get("attachment") or raw_record.get(
+				"file_name", "unknown_file"
+			)
 
 	# Determine the child table field name dynamically using Frappe meta
 	child_table_field = get_child_table_field_name("GRM Issue", doctype)
@@ -1567,8 +2011,6 @@ def create_child_record(doctype, raw_record, return_file_url=False):
 		frappe.log_error(f"❌ [SYNC_BACKEND] Cannot find child table field for {doctype} in GRM Issue")
 		raise ValueError(f"Cannot find child table field for {doctype} in GRM Issue")
 
-	frappe.log(f"🔍 [SYNC_BACKEND] Using child table field: {child_table_field}")
-
 	# WatermelonDB <-> Frappe field-name mapping for issue child rows.
 	#
 	# The mobile app's WatermelonDB schema spells the comment author
@@ -1600,34 +2042,25 @@ def create_child_record(doctype, raw_record, return_file_url=False):
 	# Create child record as proper Document object
 	child_doc = frappe.new_doc(doctype)
 	child_doc.name = record_id  # Use WatermelonDB ID
-	child_doc.parent = parent_issue_id
-	child_doc.parenttype = "GRM Issue"
-	child_doc.parentfield = child_table_field
 
 	# Add all fields from frappe_data except the parent reference
 	for field, value in frappe_data.items():
-		if field not in ["grm_issue", "name", "parent", "parenttype", "parentfield"]:
+		if field not in _CHILD_RESERVED_FIELDS:
 			if hasattr(child_doc, field):
 				setattr(child_doc, field, value)
 
-	frappe.log(f"📝 [SYNC_BACKEND] Child record data: {child_doc.as_dict()}")
-
-	# Add child record to parent document
-	if not hasattr(parent_doc, child_table_field):
-		# If the child table field doesn't exist, create it as empty list
-		setattr(parent_doc, child_table_field, [])
+	# Document.append wires parent/parenttype/parentfield and idx, and
+	# creates the child list if the parent has none yet.
+	parent_doc.append(child_table_field, child_doc)
 
-	child_table = getattr(parent_doc, child_table_field, [])
+	if log.isEnabledFor(logging.DEBUG):
+		log.debug("[SYNC_BACKEND] Child record data: %s", child_doc.as_dict())
 
-	# Check if child record already exists
-	for existing_record in child_table:
-		if existing_record.get("name") == record_id:
-			break
+	return created_file_url
 
-	# Add new child record as Document object
-	child_table.append(child_doc)
-	frappe.log(f"📝 [SYNC_BACKEND] Added child record {record_id} to parent {parent_issue_id}")
 
+def _save_parent_issue(parent_doc):
+	"""Persist the child rows appended to ``parent_doc``."""
 	# Save parent document. The L1 'write' duty is restricted to
 	# Review/Assignment/Investigate&Resolve users, but the canonical
 	# mobile actor is Intake-only and must still be able to attach
@@ -1640,154 +2073,162 @@ def create_child_record(doctype, raw_record, return_file_url=False):
 	# GRMIssue._enforce_duty_field_constraints fires on every save and
 	# short-circuits only on flags.ignore_permissions, which the field
 	# set above does not change.
-	save_start = time.time()
 	parent_doc.flags.ignore_permissions = True
 	try:
 		parent_doc.save(ignore_permissions=True)
 	except frappe.exceptions.UpdateAfterSubmitError:
 		# Issue is already submitted, we need to allow updates to child table
-		frappe.log("⚠️ [SYNC_BACKEND] Issue is submitted, allowing child table updates")
 		parent_doc.flags.ignore_validate_update_after_submit = True
 		parent_doc.save(ignore_permissions=True)
-	save_duration = time.time() - save_start
-	frappe.log(f"💾 [SYNC_BACKEND] Parent document save took: {save_duration:.4f}s")
-
-	create_duration = time.time() - create_start
-	frappe.log(
-		f"✅ [SYNC_BACKEND] Created child table {doctype} record {record_id} in {create_duration:.4f}s"
-	)
-	frappe.log("📊 [SYNC_BACKEND] Child create breakdown:")
-	frappe.log(f"  - Data conversion: {conversion_duration:.4f}s")
-	frappe.log(f"  - Parent document save: {save_duration:.4f}s")
-
-	# Return file URL if requested and available
-	if return_file_url and created_file_url:
-		return created_file_url
-
-	return None
 
 
-def update_record(doctype, raw_record):
+def update_record(doctype, raw_record, exists=None):
 	"""
 	Update existing record using WatermelonDB's _changed property for optimized field updates.
 	Uses direct database updates to avoid TimestampMismatchError.
+
+	``exists`` is the batch caller's existence answer; ``None`` probes the database.
+
+	Does not commit: the update joins the caller's transaction, which
+	``_apply_push_changes`` commits once for the whole push (or rolls back).
+	``process_table_changes`` batches its updates itself; this single-record
+	path serves the create-or-update fallback in ``create_record``.
+	"""
+	fields_to_update = _fields_to_update(doctype, raw_record, exists=exists)
+	if not fields_to_update:
+		return
+
+	# Update fields directly in database, in one UPDATE for all of them
+	record_id = raw_record["id"]
+	frappe.db.set_value(doctype, record_id, fields_to_update, update_modified=False)
+
+	log.debug("[SYNC_BACKEND] Updated %s record %s (%d fields)", doctype, record_id, len(fields_to_update))
+
+
+def _fields_to_update(doctype, raw_record, exists=None):
+	"""Check a pushed update and return the columns it changes, as Frappe data.
+
+	Raises when the record has no id, is out of the user's scope or does not
+	exist; returns an empty dict when there is nothing to write.
 	"""
-	update_start = time.time()
 	record_id = raw_record.get("id")
 	user = frappe.session.user
-	frappe.log(f"✏️ [SYNC_BACKEND] Updating {doctype} record with ID: {record_id} by user: {user}")
-	frappe.log(f"✏️ [SYNC_BACKEND] Update raw data {raw_record}")
 
 	if not record_id:
 		frappe.log_error(f"❌ [SYNC_BACKEND] Missing ID in raw record for {doctype}")
 		raise ValueError("Missing record ID for update")
 
 	# Validate user has permission to update this record
-	time.time()
 	if not validate_user_record_access(doctype, raw_record, user):
 		raise frappe.PermissionError(f"Permission denied to update {doctype} record")
 
 	# Verify record exists
-	if not frappe.db.exists(doctype, record_id):
+	if not (frappe.db.exists(doctype, record_id) if exists is None else exists):
 		raise ValueError(f"Record {record_id} not found")
 
 	# Parse changed fields from WatermelonDB
 	changed_fields_raw = raw_record.get("_changed", "")
 	if not changed_fields_raw:
 		frappe.log_error(f"No _changed property in record {record_id}")
-		return
-
-	changed_fields = [field.strip() for field in changed_fields_raw.split(",") if field.strip()]
-	if not changed_fields:
-		return
+		return {}
 
-	# Convert and filter data
+	# Convert and keep only the changed fields. updated_at is the device's
+	# own bookkeeping column and is never written back.
 	frappe_data = watermelon_to_frappe_data(raw_record)
-	fields_to_update = {field: frappe_data[field] for field in changed_fields if field in frappe_data}
-
-	if not fields_to_update:
-		return
-
-	# Update fields directly in database
-	for field_name, field_value in fields_to_update.items():
-		if field_name != "updated_at":
-			frappe.db.set_value(doctype, record_id, field_name, field_value, update_modified=False)
-
-	frappe.db.commit()
+	return {
+		field: frappe_data[field]
+		for field in (part.strip() for part in changed_fields_raw.split(","))
+		if field and field != "updated_at" and field in frappe_data
+	}
 
-	update_duration = time.time() - update_start
-	frappe.log(
-		f"✅ [SYNC_BACKEND] Updated {doctype} record {record_id} "
-		f"with {len(fields_to_update)} fields in {update_duration:.4f}s"
-	)
 
+def delete_record(doctype, record_id, exists=None):
+	"""Delete record (soft delete)
 
-def delete_record(doctype, record_id):
-	"""Delete record (soft delete) with enhanced logging"""
-	delete_start = time.time()
+	``exists`` is the batch caller's existence answer. With ``None`` the
+	record is fetched directly and a missing one is skipped, rather than
+	probing with ``exists()`` first and then loading it.
+	"""
 	user = frappe.session.user
-	frappe.log(f"🗑️ [SYNC_BACKEND] Deleting {doctype} record: {record_id} by user: {user}")
 
-	# Check if record exists
-	existence_check_start = time.time()
-	record_exists = frappe.db.exists(doctype, record_id)
-	existence_check_duration = time.time() - existence_check_start
-	frappe.log(f"🔍 [SYNC_BACKEND] Existence check took: {existence_check_duration:.4f}s")
-
-	if not record_exists:
-		frappe.log(f"🗑️ [SYNC_BACKEND] Record {record_id} already deleted or doesn't exist")
+	if exists is False:
 		return
 
 	try:
 		# Get document for permission validation
-		doc_fetch_start = time.time()
-		doc = frappe.get_doc(doctype, record_id)
-		doc_fetch_duration = time.time() - doc_fetch_start
-		frappe.log(f"📄 [SYNC_BACKEND] Document fetch took: {doc_fetch_duration:.4f}s")
-
-		# Validate user has permission to delete this record
-		validation_start = time.time()
-		record_data = doc.as_dict()
-		if not validate_user_record_access(doctype, record_data, user):
-			validation_duration = time.time() - validation_start
+		try:
+			doc = frappe.get_doc(doctype, record_id)
+		except frappe.DoesNotExistError:
+			return
+
+		# Validate user has permission to delete this record. The validators
+		# only read a few fields through .get(), which Document provides, so
+		# the doc is passed as is rather than serialised with its child tables.
+		if not validate_user_record_access(doctype, doc, user):
 			frappe.log_error(
-				f"❌ [SYNC_BACKEND] User {user} lacks permission to delete {doctype} record {record_id} (validation took {validation_duration:.4f}s)"
+				f"❌ [SYNC_BACKEND] User {user} lacks permission to delete {doctype} record {record_id}"
 			)
 			return  # Don't raise exception, just skip this delete
-		validation_duration = time.time() - validation_start
-		frappe.log(f"🔒 [SYNC_BACKEND] Permission validation took: {validation_duration:.4f}s")
 
 		# Delete document
-		delete_operation_start = time.time()
 		doc.delete()
-		delete_operation_duration = time.time() - delete_operation_start
-		frappe.log(f"🗑️ [SYNC_BACKEND] Delete operation took: {delete_operation_duration:.4f}s")
-
-		delete_duration = time.time() - delete_start
-		frappe.log(f"✅ [SYNC_BACKEND] Deleted {doctype} record {record_id} in {delete_duration:.4f}s")
-		frappe.log("📊 [SYNC_BACKEND] Delete breakdown:")
-		frappe.log(f"  - Existence check: {existence_check_duration:.4f}s")
-		frappe.log(f"  - Document fetch: {doc_fetch_duration:.4f}s")
-		frappe.log(f"  - Permission validation: {validation_duration:.4f}s")
-		frappe.log(f"  - Delete operation: {delete_operation_duration:.4f}s")
+		log.debug("[SYNC_BACKEND] Deleted %s record %s", doctype, record_id)
 
 	except frappe.PermissionError:
-		delete_duration = time.time() - delete_start
-		log.warning(
-			f"⚠️ [SYNC_BACKEND] No permission to delete {doctype} {record_id} (took {delete_duration:.4f}s)"
-		)
+		log.warning(f"⚠️ [SYNC_BACKEND] No permission to delete {doctype} {record_id}")
 		# Don't raise - just log the issue
 	except Exception as e:
-		delete_duration = time.time() - delete_start
-		frappe.log_error(
-			f"❌ [SYNC_BACKEND] Failed to delete {doctype} {record_id} after {delete_duration:.4f}s: {e!s}"
-		)
+		frappe.log_error(f"❌ [SYNC_BACKEND] Failed to delete {doctype} {record_id}: {e!s}")
 		# Don't raise - continue with other operations
 
 
-def frappe_to_watermelon_raw(frappe_doc):
+# Fields sent to the device as millisecond timestamps. Module-level so the set
+# is built once, not once per serialised record.
+_TIMESTAMP_FIELDS = frozenset(
+	{
+		"creation",
+		"modified",
+		"issue_date",
+		"intake_date",
+		"resolution_date",
+		"accepted_date",
+		"rejected_date",
+		"escalated_date",
+		"rated_date",
+		"appeal_date",
+	}
+)
+
+# Pushed records also carry the issue-log `timestamp` column in milliseconds.
+_PUSHED_TIMESTAMP_FIELDS = _TIMESTAMP_FIELDS | {"timestamp"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _timestamp_ms(value):
+	"""Milliseconds since the epoch for a datetime, date or date string.
+
+	Frappe's ``get_timestamp`` is ``time.mktime(getdate(date).timetuple())``,
+	~5x slower than ``.timestamp()`` on a datetime. With ~3.5k GRM Issues and
+	~4.5k GRM Issue Logs serialised per pull (each touching 2-8 timestamp
+	fields) that was the second-largest hot spot in the warm pull, so datetimes
+	take the fast path and only strings/dates fall back to ``get_timestamp``.
+
+	Memoised: records in a pull share many values (a day's ``issue_date``, a
+	bulk import's ``creation``), and every accepted value is hashable. The
+	conversion is pure, so a process-wide cache cannot go stale.
 	"""
-	Convert Frappe document to WatermelonDB raw format
+	if isinstance(value, datetime):
+		return int(value.timestamp() * 1000)
+	return int(get_timestamp(value) * 1000)
+
+
+def frappe_to_watermelon_raw(doc_dict):
+	"""
+	Convert a Frappe row to WatermelonDB raw format
+
+	Takes a plain dict, as ``frappe.get_all`` returns it — not a ``Document``.
+	Pulls project the columns they need in the query; hydrating a Document
+	only to flatten it back with ``as_dict()`` is the cost this avoids.
 
 	CRITICAL: WatermelonDB raw records MUST NOT contain _status or _changed fields.
 	These are internal WatermelonDB fields managed by the mobile app only.
@@ -1804,12 +2245,6 @@ def frappe_to_watermelon_raw(frappe_doc):
 	pull. The hot-loop log emissions have been deleted; the function now
 	only allocates what it needs to return.
 	"""
-	# Handle both dict and Document objects
-	if isinstance(frappe_doc, Document):
-		doc_dict = frappe_doc.as_dict()
-	else:
-		doc_dict = frappe_doc
-
 	# CRITICAL: Start with clean record - NO _status or _changed fields
 	# Both `id` (WatermelonDB convention) and `name` (Frappe convention)
 	# carry the document name. Inner-workflow consumers reference it by
@@ -1818,80 +2253,32 @@ def frappe_to_watermelon_raw(frappe_doc):
 	if not doc_name:
 		frappe.log_error(f"❌ [SYNC_BACKEND] Missing 'name' field in Frappe document: {doc_dict}")
 		raise ValueError("Frappe document missing 'name' field - cannot create WatermelonDB record")
-	raw_record = {"id": doc_name, "name": doc_name}
-
-	# Hot-path constants: keep field-name lookups O(1) and out of the
-	# iteration overhead.
-	_TIMESTAMP_FIELDS = frozenset(
-		(
-			"creation",
-			"modified",
-			"issue_date",
-			"intake_date",
-			"resolution_date",
-			"accepted_date",
-			"rejected_date",
-			"escalated_date",
-			"rated_date",
-			"appeal_date",
-		)
-	)
-
-	# Hot-path timestamp conversion: Frappe's `get_timestamp` is
-	# `time.mktime(getdate(date).timetuple())` which is ~5x slower than
-	# calling `.timestamp()` directly on a datetime object. With ~3.5k
-	# GRM Issues + ~4.5k GRM Issue Logs being serialized per pull (each
-	# touching 2-8 timestamp fields) this is the second-largest hot
-	# spot in the warm pull. Use the fast path for datetime instances
-	# and only fall back to `get_timestamp` for strings/dates.
-	from datetime import date as _date
-	from datetime import datetime as _dt
-
-	def _ts_ms(v):
-		if isinstance(v, _dt):
-			return int(v.timestamp() * 1000)
-		# date-only or string — use Frappe's parser as the slow fallback
-		return int(get_timestamp(v) * 1000)
-
-	# Direct field copy - no transformation needed after schema alignment
-	for field_name, value in doc_dict.items():
-		# Skip internal fields and the name field (already mapped to id)
-		if field_name.startswith("_") or field_name == "name":
-			continue
-
-		# Only convert timestamps - everything else copies directly
-		if value and field_name in _TIMESTAMP_FIELDS:
-			raw_record[field_name] = _ts_ms(value)
-		else:
-			# Direct assignment - fields already aligned
-			raw_record[field_name] = value
+	# Built in one comprehension: fields copy straight across except the
+	# timestamps, and the internal `_` fields (which covers WatermelonDB's
+	# `_status`/`_changed`) and `name` (already mapped to id) are skipped.
+	raw_record = {
+		"id": doc_name,
+		"name": doc_name,
+		**{
+			field_name: _timestamp_ms(value) if value and field_name in _TIMESTAMP_FIELDS else value
+			for field_name, value in doc_dict.items()
+			if field_name[0] != "_" and field_name != "name"
+		},
+	}
 
 	# Special field mapping for attachments: map 'parent' to 'grm_issue'
-	if doc_dict.get("doctype") == "GRM Issue Attachment" and doc_dict.get("parent"):
-		raw_record["grm_issue"] = doc_dict.get("parent")
-	elif doc_dict.get("parent") and doc_dict.get("parenttype") == "GRM Issue":
-		raw_record["grm_issue"] = doc_dict.get("parent")
-
-	# Add standard timestamps for WatermelonDB and sync tracking. The
-	# creation/modified fields were already converted in the loop above
-	# when present — reuse those values to avoid double-converting.
+	parent = doc_dict.get("parent")
+	if parent and (
+		doc_dict.get("doctype") == "GRM Issue Attachment" or doc_dict.get("parenttype") == "GRM Issue"
+	):
+		raw_record["grm_issue"] = parent
+
+	# Add standard timestamps for WatermelonDB and sync tracking, reusing the
+	# values converted above rather than converting twice.
 	if "creation" in raw_record:
 		raw_record["created_at"] = raw_record["creation"]
-	else:
-		creation_time = doc_dict.get("creation")
-		if creation_time:
-			created_at_ms = _ts_ms(creation_time)
-			raw_record["created_at"] = created_at_ms
-			raw_record["creation"] = created_at_ms
-
 	if "modified" in raw_record:
 		raw_record["updated_at"] = raw_record["modified"]
-	else:
-		modified_time = doc_dict.get("modified")
-		if modified_time:
-			updated_at_ms = _ts_ms(modified_time)
-			raw_record["updated_at"] = updated_at_ms
-			raw_record["modified"] = updated_at_ms
 
 	# Final validation - ensure no WatermelonDB internal fields. These
 	# should never appear (we never set them), but the original code
@@ -1902,66 +2289,96 @@ def frappe_to_watermelon_raw(frappe_doc):
 	return raw_record
 
 
-def watermelon_to_frappe_data(raw_record):
-	"""Convert WatermelonDB raw record to Frappe data - MINIMAL TRANSFORMATION"""
-	conversion_start = time.time()
-	frappe.log("🔄 [SYNC_BACKEND] Converting WatermelonDB raw record to Frappe data")
+def frappe_to_watermelon_raw_bulk(rows):
+	"""``frappe_to_watermelon_raw`` over every row of one query result.
 
-	frappe_data = {}
-	processed_fields = 0
-	timestamp_conversions = 0
+	Rows from a single ``frappe.get_all`` or query builder call all carry the
+	same columns, so the per-field decisions — skip it, convert it as a
+	timestamp, map ``parent`` to ``grm_issue`` — are taken once from the first
+	row instead of again for every field of every row. The output is the same
+	as converting each row on its own.
+	"""
+	if not rows:
+		return []
 
-	# Direct field copy - no complex transformation needed
-	field_processing_start = time.time()
+	columns = [
+		(field_name, field_name in _TIMESTAMP_FIELDS)
+		for field_name in rows[0]
+		if field_name[0] != "_" and field_name != "name"
+	]
+	has_parent = "parent" in rows[0]
+	has_creation = "creation" in rows[0]
+	has_modified = "modified" in rows[0]
+
+	raw_records = []
+	for row in rows:
+		doc_name = row.get("name")
+		if not doc_name:
+			frappe.log_error(f"❌ [SYNC_BACKEND] Missing 'name' field in Frappe document: {row}")
+			raise ValueError("Frappe document missing 'name' field - cannot create WatermelonDB record")
+		raw_record = {
+			"id": doc_name,
+			"name": doc_name,
+			**{
+				field_name: _timestamp_ms(row[field_name])
+				if is_timestamp and row[field_name]
+				else row[field_name]
+				for field_name, is_timestamp in columns
+			},
+		}
+		if has_parent:
+			parent = row["parent"]
+			if parent and (
+				row.get("doctype") == "GRM Issue Attachment" or row.get("parenttype") == "GRM Issue"
+			):
+				raw_record["grm_issue"] = parent
+		if has_creation:
+			raw_record["created_at"] = raw_record["creation"]
+		if has_modified:
+			raw_record["updated_at"] = raw_record["modified"]
+		raw_records.append(raw_record)
+
+	return raw_records
+
+
+@functools.lru_cache(maxsize=4096)
+def _datetime_from_ms(value):
+	"""Naive local datetime for epoch milliseconds; the inverse of ``_timestamp_ms``.
+
+	Deliberately ``fromtimestamp`` and not ``utcfromtimestamp``: Frappe stores
+	naive datetimes in the site's timezone, and the pull side encodes them with
+	``datetime.timestamp()``, which reads them as process-local time. Only the
+	local-time conversion round-trips. Memoised instead — one pushed record
+	carries the same instant several times (``creation``/``created_at``,
+	``modified``/``updated_at``) and a batch repeats them across records, so
+	most conversions skip the ``localtime`` call entirely.
+	"""
+	return datetime.fromtimestamp(value / 1000)
 
-	for key, value in raw_record.items():
-		if key.startswith("_"):  # Skip WatermelonDB internal fields
-			continue
 
-		processed_fields += 1
-
-		# Only convert timestamp fields back to datetime
-		if key in [
-			"creation",
-			"modified",
-			"issue_date",
-			"intake_date",
-			"resolution_date",
-			"accepted_date",
-			"rejected_date",
-			"escalated_date",
-			"rated_date",
-			"appeal_date",
-			"timestamp",
-		]:
-			if value and isinstance(value, int | float):
-				# Convert from milliseconds to datetime
-				timestamp_start = time.time()
-				frappe_data[key] = datetime.fromtimestamp(value / 1000)
-				timestamp_duration = time.time() - timestamp_start
-				timestamp_conversions += 1
-				frappe.log(
-					f"🕐 [SYNC_BACKEND] Converted {key} timestamp in {timestamp_duration:.4f}s: {value} -> {frappe_data[key]}"
-				)
-		else:
-			# Direct assignment - fields already aligned
-			frappe_data[key] = value
+def watermelon_to_frappe_data(raw_record):
+	"""Convert WatermelonDB raw record to Frappe data - MINIMAL TRANSFORMATION
+
+	Runs once per pushed record, so like ``frappe_to_watermelon_raw`` it does
+	no logging or timing of its own: the per-field ``frappe.log`` lines cost
+	more than the copy itself.
+	"""
+	# Direct field copy in one pass. WatermelonDB internal fields are skipped;
+	# timestamp fields arrive as epoch milliseconds and are converted back to
+	# datetimes, or dropped when empty or not numeric so Frappe keeps its own.
+	frappe_data = {
+		key: _datetime_from_ms(value) if key in _PUSHED_TIMESTAMP_FIELDS else value
+		for key, value in raw_record.items()
+		if not key.startswith("_")
+		and (key not in _PUSHED_TIMESTAMP_FIELDS or (value and isinstance(value, int | float)))
+	}
 
 	# Special field mapping for attachments: map 'grm_issue' back to 'parent'
 	if raw_record.get("grm_issue"):
 		frappe_data["parent"] = raw_record.get("grm_issue")
-		frappe.log(f"📎 [SYNC_BACKEND] Mapped grm_issue field to parent: {raw_record.get('grm_issue')}")
 
 	frappe_data["name"] = raw_record["id"]
 
-	field_processing_duration = time.time() - field_processing_start
-	conversion_duration = time.time() - conversion_start
-
-	frappe.log(f"✅ [SYNC_BACKEND] WatermelonDB-to-Frappe conversion completed in {conversion_duration:.4f}s")
-	frappe.log("🔍 [SYNC_BACKEND] Conversion breakdown:")
-	frappe.log(f"  - Field processing: {field_processing_duration:.4f}s ({processed_fields} fields)")
-	frappe.log(f"  - Timestamp conversions: {timestamp_conversions} conversions")
-
 	return frappe_data
 
 
@@ -1974,14 +2391,17 @@ def get_user_data(project_id=None):
 	"""
 	try:
 		# Trigger a full sync by calling pullChanges with no timestamp
-		result = pull_changes(lastPulledAt=None)
+		result = _pull_payload()
 
-		# Transform the response to match legacy format if needed
+		# Transform the response to match legacy format if needed. The pull
+		# result is ours alone, so each table's created list is extended in
+		# place with its updated records rather than concatenated into a
+		# third list the size of both.
 		legacy_data = {}
 		if result and result.get("changes"):
 			for table_name, table_changes in result["changes"].items():
-				# Combine created and updated records
-				all_records = table_changes.get("created", []) + table_changes.get("updated", [])
+				all_records = table_changes.get("created") or []
+				all_records.extend(table_changes.get("updated") or ())
 				legacy_data[table_name] = all_records
 
 		return {
@@ -1995,10 +2415,15 @@ def get_user_data(project_id=None):
 		return {"status": "error", "message": str(e)}
 
 
+@request_cache
 def get_child_table_field_name(parent_doctype, child_doctype):
 	"""
 	Dynamically determine the field name for a child table in the parent DocType
 
+	Resolved once per request: every pushed child row asks for the same
+	mapping. Request-scoped rather than process-wide, like ``_writable_fields``,
+	so a customised parent doctype is picked up on the next request.
+
 	Args:
 	    parent_doctype (str): The parent DocType name (e.g., "GRM Issue")
 	    child_doctype (str): The child DocType name (e.g., "GRM Issue Log")
@@ -2013,9 +2438,6 @@ def get_child_table_field_name(parent_doctype, child_doctype):
 		# Find table fields that link to the child doctype
 		for field in parent_meta.fields:
 			if field.fieldtype == "Table" and field.options == child_doctype:
-				frappe.log(
-					f"🔍 [SYNC_BACKEND] Found child table field: {field.fieldname} for {child_doctype}"
-				)
 				return field.fieldname
 
 		frappe.log_error(f"❌ [SYNC_BACKEND] No table field found for {child_doctype} in {parent_doctype}")
@@ -2045,52 +2467,41 @@ def create_file_from_base64(raw_record, parent_issue_id):
 			frappe.log_error("❌ [SYNC_BACKEND] Missing file data or filename")
 			return None
 
-		frappe.log(f"📎 [SYNC_BACKEND] Creating file from Base64 data: {file_name}")
-
-		# Import necessary modules
-		import base64
-		import os
-
 		from frappe.utils.file_manager import save_file
 
 		# Validate file name and extension
-		frappe.log(f"📎 [SYNC_BACKEND] Validating file name: {file_name}")
 		if not validate_file_name(file_name):
 			frappe.log_error(f"❌ [SYNC_BACKEND] Invalid file name: {file_name}")
 			return None
-		frappe.log("📎 [SYNC_BACKEND] File name validation passed")
+
+		# Validate file type before decoding the payload. validate_file_type
+		# only reads the first 16 bytes, and 24 Base64 characters decode to 18,
+		# so a mislabelled upload is rejected without materialising the whole
+		# file (up to the size limit) in memory first.
+		try:
+			file_header = base64.b64decode(file_data[:24])
+		except Exception as decode_error:
+			frappe.log_error(f"❌ [SYNC_BACKEND] Invalid Base64 data: {decode_error!s}")
+			return None
+		if not validate_file_type(file_name, file_header):
+			frappe.log_error(f"❌ [SYNC_BACKEND] Invalid file type: {file_name}")
+			return None
 
 		# Decode Base64 data
-		frappe.log(f"📎 [SYNC_BACKEND] Decoding Base64 data (length: {len(file_data)})")
 		try:
 			file_content = base64.b64decode(file_data)
 		except Exception as decode_error:
 			frappe.log_error(f"❌ [SYNC_BACKEND] Invalid Base64 data: {decode_error!s}")
 			return None
-		frappe.log("📎 [SYNC_BACKEND] Base64 decoding successful")
 
 		# Validate file size
 		file_size = len(file_content)
 		max_size = get_max_file_size()
-		frappe.log(f"📎 [SYNC_BACKEND] File size check: {file_size} bytes (max: {max_size} bytes)")
 		if file_size > max_size:
 			frappe.log_error(f"❌ [SYNC_BACKEND] File too large: {file_size} bytes > {max_size} bytes")
 			return None
-		frappe.log("📎 [SYNC_BACKEND] File size validation passed")
-
-		# Validate file type
-		frappe.log(f"📎 [SYNC_BACKEND] Validating file type for: {file_name}")
-		if not validate_file_type(file_name, file_content):
-			frappe.log_error(f"❌ [SYNC_BACKEND] Invalid file type: {file_name}")
-			return None
-		frappe.log("📎 [SYNC_BACKEND] File type validation passed")
-
-		frappe.log(f"📎 [SYNC_BACKEND] File validation passed: {file_name} ({file_size} bytes)")
 
 		# Create file using Frappe's file manager
-		frappe.log(
-			f"📎 [SYNC_BACKEND] Calling save_file with fname={file_name}, dt=GRM Issue, dn={parent_issue_id}"
-		)
 		try:
 			file_doc = save_file(
 				fname=file_name,
@@ -2100,14 +2511,9 @@ def create_file_from_base64(raw_record, parent_issue_id):
 				folder=None,
 				is_private=0,  # Public files for issue attachments
 			)
-			frappe.log(f"📎 [SYNC_BACKEND] save_file returned: {file_doc}")
-			frappe.log(f"📎 [SYNC_BACKEND] File doc type: {type(file_doc)}")
-			frappe.log(f"📎 [SYNC_BACKEND] File doc attributes: {dir(file_doc) if file_doc else 'None'}")
-
 			if file_doc and hasattr(file_doc, "file_url"):
-				file_url = file_doc.file_url
-				frappe.log(f"📎 [SYNC_BACKEND] Successfully created file: {file_url}")
-				return file_url
+				log.debug("[SYNC_BACKEND] Saved %s (%d bytes) as %s", file_name, file_size, file_doc.file_url)
+				return file_doc.file_url
 			else:
 				frappe.log_error(f"❌ [SYNC_BACKEND] save_file returned invalid result: {file_doc}")
 				return None
@@ -2120,6 +2526,42 @@ def create_file_from_base64(raw_record, parent_issue_id):
 		return None
 
 
+# Path traversal, separators and characters Windows or shells treat specially.
+# One compiled pattern scans the name once instead of once per character.
+_UNSAFE_FILE_NAME_RE = re.compile(r'\.\.|[/\\:*?"<>|\0]')
+
+_ALLOWED_FILE_EXTENSIONS = frozenset(
+	{
+		# Images
+		".jpg",
+		".jpeg",
+		".png",
+		".gif",
+		".bmp",
+		".svg",
+		# Documents
+		".pdf",
+		".doc",
+		".docx",
+		".txt",
+		".rtf",
+		# Audio
+		".3gp",
+		".mp3",
+		".wav",
+		".ogg",
+		".aac",
+		".flac",
+		# Video
+		".mp4",
+		".avi",
+		".mov",
+		".wmv",
+		".mkv",
+	}
+)
+
+
 def validate_file_name(file_name):
 	"""
 	Validate file name for security and compatibility
@@ -2130,9 +2572,6 @@ def validate_file_name(file_name):
 	Returns:
 	    bool: True if valid, False otherwise
 	"""
-	import os
-	import re
-
 	# Check for empty or None
 	if not file_name or not file_name.strip():
 		return False
@@ -2142,63 +2581,61 @@ def validate_file_name(file_name):
 		return False
 
 	# Check for dangerous characters
-	dangerous_chars = ["..", "/", "\\", ":", "*", "?", '"', "<", ">", "|", "\0"]
-	for char in dangerous_chars:
-		if char in file_name:
-			frappe.log_error(
-				f"❌ [SYNC_BACKEND] File name contains dangerous character '{char}': {file_name}"
-			)
-			return False
+	unsafe = _UNSAFE_FILE_NAME_RE.search(file_name)
+	if unsafe:
+		frappe.log_error(
+			f"❌ [SYNC_BACKEND] File name contains dangerous character '{unsafe.group()}': {file_name}"
+		)
+		return False
 
 	# Check for valid extension
-	allowed_extensions = [
-		".jpg",
-		".jpeg",
-		".png",
-		".gif",
-		".bmp",
-		".svg",  # Images
-		".pdf",
-		".doc",
-		".docx",
-		".txt",
-		".rtf",  # Documents
-		".3gp",
-		".mp3",
-		".wav",
-		".ogg",
-		".aac",
-		".flac",  # Audio
-		".mp4",
-		".avi",
-		".mov",
-		".wmv",
-		".mkv",  # Video
-	]
-
 	file_ext = os.path.splitext(file_name)[1].lower()
-	frappe.log(f"📎 [SYNC_BACKEND] File extension: '{file_ext}' (allowed: {allowed_extensions})")
-	if file_ext not in allowed_extensions:
+	if file_ext not in _ALLOWED_FILE_EXTENSIONS:
 		frappe.log_error(f"❌ [SYNC_BACKEND] File extension '{file_ext}' not allowed for file: {file_name}")
 		return False
 
-	frappe.log(f"📎 [SYNC_BACKEND] File name validation successful: {file_name}")
 	return True
 
 
+# Magic byte signatures for common file types
+_MAGIC_BYTES = {
+	".jpg": (b"\xff\xd8\xff",),
+	".jpeg": (b"\xff\xd8\xff",),
+	".png": (b"\x89PNG\r\n\x1a\n",),
+	".gif": (b"GIF87a", b"GIF89a"),
+	".pdf": (b"%PDF",),
+	".mp3": (b"ID3", b"\xff\xfb"),
+	".mp4": (b"ftyp",),
+	".3gp": (b"ftyp3g",),  # 3GP files have 'ftyp3g' signature
+	".avi": (b"RIFF",),
+	".wav": (b"RIFF",),
+}
+
+# Image signatures accepted under any image extension: a PNG uploaded as .jpg
+# is still an image, just mislabelled.
+_IMAGE_SIGNATURES = {
+	"PNG": b"\x89PNG\r\n\x1a\n",
+	"JPEG": b"\xff\xd8\xff",
+	"GIF87a": b"GIF87a",
+	"GIF89a": b"GIF89a",
+}
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif"})
+
+# Audio containers vary too much in their headers to reject on a mismatch.
+_AUDIO_EXTENSIONS = frozenset({".3gp", ".mp3", ".wav", ".ogg", ".aac", ".flac"})
+
+
 def validate_file_type(file_name, file_content):
 	"""
 	Validate file type based on content (magic bytes)
 
 	Args:
 	    file_name (str): File name
-	    file_content (bytes): File content
+	    file_content (bytes): File content, or at least its first 16 bytes
 
 	Returns:
 	    bool: True if valid, False otherwise
 	"""
-	import os
-
 	# Get file extension
 	file_ext = os.path.splitext(file_name)[1].lower()
 
@@ -2206,78 +2643,46 @@ def validate_file_type(file_name, file_content):
 	if len(file_content) < 4:
 		return False
 
-	# Magic byte signatures for common file types
-	magic_bytes = {
-		".jpg": [b"\xff\xd8\xff"],
-		".jpeg": [b"\xff\xd8\xff"],
-		".png": [b"\x89PNG\r\n\x1a\n"],
-		".gif": [b"GIF87a", b"GIF89a"],
-		".pdf": [b"%PDF"],
-		".mp3": [b"ID3", b"\xff\xfb"],
-		".mp4": [b"ftyp"],
-		".3gp": [b"ftyp3g"],  # 3GP files have 'ftyp3g' signature
-		".avi": [b"RIFF"],
-		".wav": [b"RIFF"],
-	}
-
 	# Check if file has expected magic bytes
-	if file_ext in magic_bytes:
-		expected_signatures = magic_bytes[file_ext]
-		file_header = file_content[:16]  # Check first 16 bytes
+	expected_signatures = _MAGIC_BYTES.get(file_ext)
+	if expected_signatures is None:
+		# For file types without magic byte checking, allow them
+		return True
 
-		frappe.log(f"📎 [SYNC_BACKEND] Checking magic bytes for {file_ext}")
-		frappe.log(f"📎 [SYNC_BACKEND] File header: {file_header.hex()}")
-		frappe.log(f"📎 [SYNC_BACKEND] Expected signatures: {[sig.hex() for sig in expected_signatures]}")
+	file_header = file_content[:16]  # Check first 16 bytes
+	if file_header.startswith(expected_signatures):
+		return True
 
-		for signature in expected_signatures:
+	# Check if it's actually a different image type with wrong extension
+	if file_ext in _IMAGE_EXTENSIONS:
+		for img_type, signature in _IMAGE_SIGNATURES.items():
 			if file_header.startswith(signature):
-				frappe.log(f"📎 [SYNC_BACKEND] Magic bytes match for {file_ext}")
+				log.info(
+					"[SYNC_BACKEND] File extension mismatch: %s has %s extension but is actually %s; allowing",
+					file_name,
+					file_ext,
+					img_type,
+				)
 				return True
 
-		# Check if it's actually a different image type with wrong extension
-		all_image_signatures = {
-			"PNG": b"\x89PNG\r\n\x1a\n",
-			"JPEG": b"\xff\xd8\xff",
-			"GIF87a": b"GIF87a",
-			"GIF89a": b"GIF89a",
-		}
-
-		detected_type = None
-		for img_type, signature in all_image_signatures.items():
-			if file_header.startswith(signature):
-				detected_type = img_type
-				break
-
-		if detected_type and file_ext in [".jpg", ".jpeg", ".png", ".gif"]:
-			frappe.log(
-				f"⚠️ [SYNC_BACKEND] File extension mismatch: {file_name} has {file_ext} extension but is actually {detected_type}"
-			)
-			frappe.log("⚠️ [SYNC_BACKEND] Allowing image with mismatched extension")
-			return True
-
-		# For audio files, be more lenient with validation
-		audio_extensions = [".3gp", ".mp3", ".wav", ".ogg", ".aac", ".flac"]
-		if file_ext in audio_extensions:
-			frappe.log(
-				f"📎 [SYNC_BACKEND] Audio file with potential signature mismatch, allowing: {file_name}"
-			)
-			return True
-
-		# If no magic bytes match for non-audio files, it's suspicious
-		frappe.log_error(
-			f"❌ [SYNC_BACKEND] File type mismatch: {file_name} does not match expected signature"
-		)
-		return False
+	# For audio files, be more lenient with validation
+	if file_ext in _AUDIO_EXTENSIONS:
+		return True
 
-	# For file types without magic byte checking, allow them
-	frappe.log(f"📎 [SYNC_BACKEND] No magic byte check for {file_ext}, allowing")
-	return True
+	# If no magic bytes match for non-audio files, it's suspicious
+	frappe.log_error(f"❌ [SYNC_BACKEND] File type mismatch: {file_name} does not match expected signature")
+	return False
 
 
+@site_cache(ttl=300)
 def get_max_file_size():
 	"""
 	Get maximum allowed file size in bytes
 
+	Cached per site rather than with ``lru_cache``: one worker process serves
+	every site on the bench, and each has its own ``max_file_size``. The TTL
+	lets a ``bench set-config`` take effect without a restart.
+
 	Returns:
 	    int: Maximum file size in bytes
 	"""
@@ -2292,7 +2697,7 @@ def get_max_file_size():
 		return default_size
 
 
-def optimize_attachment_sync(attachment_changes, last_sync_time, page_boundary=None):
+def optimize_attachment_sync(attachment_changes, last_sync_time, page_boundary=None, known_hashes=None):
 	"""
 	Optimize attachment sync using Frappe QB for better performance
 
@@ -2304,90 +2709,61 @@ def optimize_attachment_sync(attachment_changes, last_sync_time, page_boundary=N
 	        window as the rest of the response — attachments are the heaviest
 	        rows in the payload (they carry base64 file data), so letting them
 	        ignore the cap would defeat the pagination.
+	    known_hashes (frozenset | None): Content hashes the device already has
+	        files for. When given, every row carries ``file_hash`` and rows
+	        whose hash is known are sent without ``file_data``. ``None`` keeps
+	        the original behaviour of shipping every file.
 
 	Returns:
 	    dict: Optimized attachment changes with file data
 	"""
 	start_time = time.time()
-	frappe.log("📎 [SYNC_BACKEND] Starting optimized attachment sync")
 
 	try:
-		# Use Frappe QB for efficient attachment querying
-		attachment_table = frappe.qb.DocType("GRM Issue Attachment")
-		accessible_issues = accessible_issue_subquery(frappe.session.user)
-		if accessible_issues is None:
-			frappe.log("⚠️ [SYNC_BACKEND] No accessible issues found for attachment filtering")
-			return {"created": [], "updated": [], "deleted": attachment_changes.get("deleted", [])}
-
-		# Only GRM Issue uses this child table; naming the parenttype lets the
-		# standard (parent, parenttype) child index carry the semi-join.
-		in_scope = (attachment_table.parenttype == "GRM Issue") & attachment_table.parent.isin(
-			accessible_issues
-		)
-
-		# Query for created attachments
-		created_query = (
-			frappe.qb.from_(attachment_table)
-			.select("*")
-			.where(in_scope)
-			.where(attachment_table.creation > last_sync_time)
+		created_attachments, updated_attachments = _issue_child_rows(
+			"GRM Issue Attachment", frappe.session.user, last_sync_time, page_boundary
 		)
 
-		# Query for updated attachments
-		updated_query = (
-			frappe.qb.from_(attachment_table)
-			.select("*")
-			.where(in_scope)
-			.where(attachment_table.modified > last_sync_time)
-			.where(attachment_table.creation <= last_sync_time)
-		)
-
-		if page_boundary is not None:
-			created_query = created_query.where(attachment_table.modified <= page_boundary)
-			updated_query = updated_query.where(attachment_table.modified <= page_boundary)
-
-		# Execute queries
-		created_attachments = created_query.run(as_dict=True)
-		updated_attachments = updated_query.run(as_dict=True)
-
-		frappe.log(
-			f"📎 [SYNC_BACKEND] Found {len(created_attachments)} created, {len(updated_attachments)} updated attachments"
-		)
-
-		# Process created attachments with file data
-		processed_created = []
-		for attachment in created_attachments:
-			raw_record = frappe_to_watermelon_raw(attachment)
-
-			# Always add file data for created attachments
-			if attachment.get("attachment"):
-				file_data = get_attachment_file_data(attachment.get("attachment"))
-				if file_data:
-					raw_record["file_data"] = file_data
-					frappe.log(
-						f"📎 [SYNC_BACKEND] Added file data for created attachment: {attachment.get('name')}"
-					)
-
-			processed_created.append(raw_record)
-
-		# Process updated attachments with file data
-		processed_updated = []
-		for attachment in updated_attachments:
-			raw_record = frappe_to_watermelon_raw(attachment)
-
-			# Add file data for updated attachments to ensure mobile app has the file
-			if attachment.get("attachment"):
-				file_data = get_attachment_file_data(attachment.get("attachment"))
+		file_urls = {a.get("attachment") for a in created_attachments + updated_attachments}
+		file_urls.discard(None)
+
+		# Only devices that say which files they hold get hashes; everyone
+		# else is shipped every file, so the mobile app always has it.
+		hash_by_url = {}
+		if known_hashes is not None and file_urls:
+			hash_by_url = dict(
+				frappe.get_all(
+					"File",
+					filters={"file_url": ["in", list(file_urls)]},
+					fields=["file_url", "content_hash"],
+					as_list=True,
+				)
+			)
+			file_urls = {url for url in file_urls if hash_by_url.get(url) not in known_hashes}
+
+		# The files are read together up front rather than one per loop iteration.
+		file_data_by_url = load_attachment_files(file_urls)
+
+		def to_raw(attachments):
+			raw_records = frappe_to_watermelon_raw_bulk(attachments)
+			for attachment, raw_record in zip(attachments, raw_records, strict=True):
+				file_url = attachment.get("attachment")
+				if known_hashes is not None:
+					raw_record["file_hash"] = hash_by_url.get(file_url)
+				file_data = file_data_by_url.get(file_url)
 				if file_data:
 					raw_record["file_data"] = file_data
-					frappe.log(
-						f"📎 [SYNC_BACKEND] Added file data for updated attachment: {attachment.get('name')}"
-					)
+			return raw_records
 
-			processed_updated.append(raw_record)
+		processed_created = to_raw(created_attachments)
+		processed_updated = to_raw(updated_attachments)
 
-		duration = time.time() - start_time
-		frappe.log(f"📎 [SYNC_BACKEND] Optimized attachment sync completed in {duration:.3f}s")
+		log.debug(
+			"[SYNC_BACKEND] Attachments: +%d ~%d in %.3fs",
+			len(processed_created),
+			len(processed_updated),
+			time.time() - start_time,
+		)
 
 		return {
 			"created": processed_created,
@@ -2401,6 +2777,72 @@ def optimize_attachment_sync(attachment_changes, last_sync_time, page_boundary=N
 		return attachment_changes
 
 
+def _project_linked_rows(doctype, child_table_filter, last_sync_time, page_boundary=None):
+	"""Rows of a reference table in the pull window whose project links match.
+
+	Handing ``[link_doctype, "project", "in", projects]`` to ``frappe.get_all``
+	joins the link table on ``parent`` alone, so a record linked to several of
+	the user's projects came back once per link and had to be de-duplicated,
+	and the ``(parenttype, project, parent)`` index added by
+	``add_sync_reconciliation_indexes`` went unused for want of a
+	``parenttype`` predicate. A semi-join on the link table names the
+	parenttype, is answered from that index alone, and returns each record
+	once.
+	"""
+	table = frappe.qb.DocType(doctype)
+	link = frappe.qb.DocType(child_table_filter["child_doctype"])
+	linked = (
+		frappe.qb.from_(link)
+		.select(link.parent)
+		.where(link.parenttype == doctype)
+		.where(link[child_table_filter["field"]].isin(child_table_filter["values"]))
+	)
+	query = (
+		frappe.qb.from_(table)
+		.select(*_pulled_fields(doctype))
+		.where(table.name.isin(linked))
+		.where(table.modified > last_sync_time)
+	)
+	if page_boundary is not None:
+		query = query.where(table.modified <= page_boundary)
+	return query.run(as_dict=True)
+
+
+def _issue_child_rows(doctype, user, last_sync_time, page_boundary=None):
+	"""Rows of an issue child table in the pull window, scoped to ``user``.
+
+	Logs, comments and attachments carry no project or region of their own,
+	so they are scoped through their parent issue with
+	``accessible_issue_subquery``. One query covers the window: a row created
+	since the watermark was necessarily modified since it too, so the created
+	and updated sets are split in Python on ``creation``.
+
+	Returns ``(created, updated)`` lists of row dicts.
+	"""
+	accessible_issues = accessible_issue_subquery(user)
+	if accessible_issues is None:
+		return [], []
+
+	table = frappe.qb.DocType(doctype)
+	# Only GRM Issue uses these child tables; naming the parenttype lets the
+	# standard (parent, parenttype) child index carry the semi-join.
+	query = (
+		frappe.qb.from_(table)
+		.select(*_pulled_fields(doctype))
+		.where(table.parenttype == "GRM Issue")
+		.where(table.parent.isin(accessible_issues))
+		.where(table.modified > last_sync_time)
+	)
+	if page_boundary is not None:
+		query = query.where(table.modified <= page_boundary)
+
+	created, updated = [], []
+	for row in query.run(as_dict=True):
+		(created if row.creation > last_sync_time else updated).append(row)
+	return created, updated
+
+
+@request_cache
 def accessible_issue_subquery(user):
 	"""Build a subquery selecting every GRM Issue ``user`` may see.
 
@@ -2420,8 +2862,17 @@ def accessible_issue_subquery(user):
 	regions while the issue query used the BFS-expanded set, and only the
 	union with the synced IDs papered over the difference.
 
+	Built once per request: logs, comments and attachments are all scoped
+	through it on every pull, and the query object is only ever embedded, never
+	modified.
+
 	Returns ``None`` when the user is entitled to nothing.
 	"""
+	# No projects means no issues; answer before get_user_filters_for_doctype,
+	# which raises for a user without projects.
+	if not _sync_scope(user)["projects"]:
+		return None
+
 	issue_table = frappe.qb.DocType("GRM Issue")
 	filters = get_user_filters_for_doctype("GRM Issue", None, None, user)
 	filters.pop("_child_table_filter", None)
@@ -2461,39 +2912,72 @@ def get_attachment_file_data(file_url):
 	if not file_url:
 		return None
 
-	try:
-		import base64
-		import os
+	file_path = _attachment_file_path(file_url)
+	if not file_path:
+		log.warning("[SYNC_BACKEND] Unsupported file URL format: %s", file_url)
+		return None
 
-		# Get the file path from Frappe's file system
-		if file_url.startswith("/files/"):
-			# Remove the '/files/' prefix to get the actual filename
-			filename = file_url[7:]  # Remove '/files/' (7 characters)
+	file_base64 = _read_file_base64(file_path)
+	if file_base64 is None:
+		log.warning("[SYNC_BACKEND] File not found or unreadable: %s", file_path)
+	return file_base64
 
-			# Get the full file path using Frappe's file utilities
-			file_path = frappe.get_site_path("public", "files", filename)
 
-			frappe.log(f"📎 [SYNC_BACKEND] Reading file from path: {file_path}")
+def load_attachment_files(file_urls):
+	"""Base64-encode several attachments' files at once: ``{file_url: data}``.
 
-			# Check if file exists
-			if not os.path.exists(file_path):
-				frappe.log(f"⚠️ [SYNC_BACKEND] File not found: {file_path}")
-				return None
+	A pull that ships attachments reads every file from disk and encodes it,
+	one after another, and on network-backed storage the pull mostly waits on
+	those reads. Files are read on a small thread pool instead: both the read
+	and ``b64encode`` release the GIL. Paths are resolved here first, because
+	``frappe.get_site_path`` needs the request's site context, which worker
+	threads do not have — the workers only do file I/O.
+	"""
+	paths = {}
+	for file_url in file_urls:
+		if file_url and file_url not in paths:
+			paths[file_url] = _attachment_file_path(file_url)
+
+	readable = {file_url: path for file_url, path in paths.items() if path}
+	if len(readable) > 1:
+		with ThreadPoolExecutor(max_workers=min(ATTACHMENT_READ_WORKERS, len(readable))) as pool:
+			encoded = dict(zip(readable, pool.map(_read_file_base64, readable.values()), strict=True))
+	else:
+		encoded = {file_url: _read_file_base64(path) for file_url, path in readable.items()}
 
-			# Read file and encode as base64
-			with open(file_path, "rb") as file:
-				file_content = file.read()
-				file_base64 = base64.b64encode(file_content).decode("utf-8")
+	missing = [paths[file_url] for file_url, data in encoded.items() if data is None]
+	if missing:
+		log.warning("[SYNC_BACKEND] %d attachment files not found or unreadable: %s", len(missing), missing)
+	return encoded
 
-				frappe.log(
-					f"📎 [SYNC_BACKEND] Successfully read file: {filename} ({len(file_content)} bytes)"
-				)
-				return file_base64
 
-		else:
-			frappe.log(f"⚠️ [SYNC_BACKEND] Unsupported file URL format: {file_url}")
-			return None
+def _attachment_file_path(file_url):
+	"""Disk path of a public ``/files/...`` URL, or None for any other URL."""
+	if not file_url.startswith("/files/"):
+		return None
+	return frappe.get_site_path("public", "files", file_url[len("/files/") :])
 
-	except Exception as e:
-		frappe.log_error(f"❌ [SYNC_BACKEND] Error reading file {file_url}: {e!s}")
+
+def _read_file_base64(file_path):
+	"""Read and Base64-encode one file. Touches no frappe state, so it is safe
+	to run off the request thread.
+
+	The file is memory-mapped and encoded straight from the mapping, so the
+	raw bytes are never copied into a private buffer: at the 25 MB upload cap
+	that is 25 MB less held per file while the pull is assembled. Base64 output
+	is pure ASCII, so it is decoded as such rather than run through UTF-8
+	validation.
+
+	Missing files are found by opening them (EAFP), not with a separate
+	``exists``/``stat`` call first, which would be one more syscall per
+	attachment and racy besides.
+	"""
+	try:
+		with open(file_path, "rb") as file:
+			try:
+				with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+					return base64.b64encode(mapped).decode("ascii")
+			except ValueError:
+				return ""  # mmap refuses empty files
+	except OSError:
 		return None
@@ -98,7 +98,7 @@ def get_my_regions():
 	"""
 	Get regions assigned to current user
 	"""
-	regions = frappe.db.sql(
+	return frappe.db.sql_list(
 		"""
         SELECT administrative_region
         FROM `tabGRM User Project Assignment`
@@ -107,11 +107,8 @@ def get_my_regions():
         AND is_active = 1
     """,
 		frappe.session.user,
-		as_dict=1,
 	)
 
-	return [r.administrative_region for r in regions] if regions else []
-
 
 def get_department_categories():
 	"""
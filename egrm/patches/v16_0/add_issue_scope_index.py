@@ -0,0 +1,36 @@
+# Copyright (c) 2026, eGRM and contributors
+# For license information, please see license.txt
+"""Add composite index (project, administrative_region) on tabGRM Issue.
+
+``accessible_issue_subquery`` scopes attachment pulls with a semi-join on the
+issues a user may see: ``project IN (...) AND administrative_region IN (...)``,
+selecting only ``name``. GRM Issue has no index on either column, so every
+pull that ships attachments re-reads the whole issue table to build that set.
+With both scope columns in one index — and ``name``, the primary key, carried
+by every InnoDB secondary index — the subquery is a range scan answered from
+the index alone.
+
+The attachment side needs no new index. ``optimize_attachment_sync`` filters
+on ``modified``, already indexed by ``add_sync_reconciliation_indexes``, which
+also records why the time window rather than ``parent`` is the selective
+predicate there.
+
+Idempotent: ``frappe.db.add_index`` no-ops when the index already exists, so
+repeated ``bench migrate`` runs are safe.
+"""
+
+import frappe
+
+
+def execute():  # type: ignore[no-untyped-def]
+	try:
+		frappe.db.add_index(
+			"GRM Issue",
+			["project", "administrative_region"],
+			index_name="idx_grm_issue_project_region",
+		)
+	except Exception as exc:  # pragma: no cover - defensive
+		frappe.logger().warning(f"add_issue_scope_index: skipped ({exc})")
+		return
+
+	frappe.db.commit()
@@ -0,0 +1,43 @@
+# Copyright (c) 2026, eGRM and contributors
+# For license information, please see license.txt
+"""Add ``(modified, project, administrative_region)`` on tabGRM Issue.
+
+Every pull asks GRM Issue the same question twice — once to place the page
+boundary, once for the page itself:
+
+    modified > watermark
+    and project in (...) and administrative_region in (...)
+
+Frappe's own ``modified`` index finds the window but leaves the scope columns
+to be read from the row, and ``add_issue_scope_index`` gives
+``(project, administrative_region)``, which finds the scope but not in
+``modified`` order. The page-boundary probe walks
+``order by modified limit 2 offset N-1`` and selects only ``modified``, so
+with all three columns in one index it is answered from the index alone:
+rows outside the user's scope are discarded by index condition pushdown
+instead of costing a row lookup each, and the ``N`` rows it skips never
+touch the table. The page query itself gets the same pushdown and only reads
+the rows it returns. It also stands in for the ``(modified, creation)`` index
+``add_sync_window_indexes`` gives the other synced tables, which is why GRM
+Issue is not in that patch's list: a second index led by ``modified`` would
+only be another one to maintain on every issue write.
+
+Idempotent: ``frappe.db.add_index`` no-ops when the index already exists, so
+repeated ``bench migrate`` runs are safe.
+"""
+
+import frappe
+
+
+def execute():  # type: ignore[no-untyped-def]
+	try:
+		frappe.db.add_index(
+			"GRM Issue",
+			["modified", "project", "administrative_region"],
+			index_name="idx_grm_issue_sync_window_scope",
+		)
+	except Exception as exc:  # pragma: no cover - defensive
+		frappe.logger().warning(f"add_issue_window_scope_index: skipped ({exc})")
+		return
+
+	frappe.db.commit()
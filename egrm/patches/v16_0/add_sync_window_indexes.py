@@ -0,0 +1,55 @@
+# Copyright (c) 2026, eGRM and contributors
+# For license information, please see license.txt
+"""Add ``(modified, creation)`` to the tables ``pull_changes`` reads by window.
+
+``get_changes_since`` asks each of these tables two questions per pull:
+
+    created:  creation > watermark
+    updated:  modified > watermark and creation <= watermark
+
+Frappe indexes ``modified`` on its own, which serves the first predicate of the
+updated stream but leaves ``creation <= watermark`` to be checked row by row
+against the table. With ``creation`` as the second column the whole window is
+answered from the index, and the range the planner walks is the rows touched
+since the watermark — not every row the table has ever held.
+
+Only tables whose pull query is that window get it. GRM Issue is windowed and
+scoped in the same query, so ``add_issue_window_scope_index`` gives it
+``(modified, project, administrative_region)`` instead. ``User`` is read by primary
+key (a user only ever pulls their own row), and the issue child tables (logs,
+comments, attachments) are read through their parent issue on the standard
+``(parent, parenttype)`` index. ``Deleted Document (deleted_doctype, creation)``
+comes from ``add_sync_reconciliation_indexes``. A core table or a child table
+that gains an index here for no query pays for it on every write.
+
+Idempotent: ``frappe.db.add_index`` no-ops when the index already exists, so
+repeated ``bench migrate`` runs are safe.
+"""
+
+import frappe
+
+INDEX_NAME = "idx_sync_modified_creation"
+
+WINDOW_DOCTYPES = (
+	"GRM Issue Category",
+	"GRM Issue Type",
+	"GRM Issue Status",
+	"GRM Administrative Region",
+	"GRM Administrative Level Type",
+	"GRM Issue Age Group",
+	"GRM Issue Citizen Group",
+	"GRM Issue Department",
+	"GRM Project",
+	"GRM Project Link",
+)
+
+
+def execute():  # type: ignore[no-untyped-def]
+	for doctype in WINDOW_DOCTYPES:
+		try:
+			frappe.db.add_index(doctype, ["modified", "creation"], index_name=INDEX_NAME)
+		except Exception as exc:  # pragma: no cover - defensive
+			frappe.logger().warning(f"add_sync_window_indexes: {doctype} skipped ({exc})")
+			continue
+
+	frappe.db.commit()
@@ -0,0 +1,1250 @@
+"""Tests for the WatermelonDB sync endpoints in ``egrm.api.sync``.
+
+Each TestCase pins one contract of the pull or push path. They share one
+fixture: two projects with the catalogue a GRM Issue needs, and a field user
+activated on the first project only, so scope checks have something on either
+side of them. Issues the pull tests read are dated in 2099 and pulled from a
+2099 watermark, so nothing else on the bench falls into their window.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from datetime import datetime
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils.response import json_handler
+from werkzeug.test import EnvironBuilder
+
+from egrm.api.lookup import get_user_accessible_regions
+from egrm.api.sync import (
+	_SCOPE_FILTER_BUILDERS,
+	MAX_PULL_PAGE_SIZE,
+	PULL_PAGE_SIZE,
+	PUSH_BACKGROUND_THRESHOLD,
+	SYNC_TABLES,
+	_json_pull_response,
+	_parse_last_pulled_at,
+	_process_push,
+	_project_linked_rows,
+	_pull_payload,
+	_pulled_fields,
+	_push_request_body,
+	_read_file_base64,
+	_save_parent_issue,
+	create_child_records,
+	create_file_from_base64,
+	create_record,
+	frappe_to_watermelon_raw,
+	get_changes_since,
+	get_deleted_records_by_doctype,
+	get_user_filters_for_doctype,
+	load_attachment_files,
+	optimize_attachment_sync,
+	process_table_changes,
+	pull_changes,
+	push_changes,
+	push_status,
+	validate_file_name,
+	validate_user_record_access,
+)
+
+PROJECT = "TEST-SYNC"
+OTHER_PROJECT = "TEST-SYNC-OTHER"
+FIELD_USER = "sync.field@example.com"
+
+
+def _ensure(doctype: str, filters: dict, payload: dict) -> str:
+	if frappe.db.exists(doctype, filters):
+		return frappe.db.get_value(doctype, filters, "name")
+	return frappe.get_doc({**payload, "doctype": doctype}).insert(ignore_permissions=True).name
+
+
+def _ensure_user(email: str, first_name: str) -> str:
+	if not frappe.db.exists("User", email):
+		frappe.get_doc(
+			{
+				"doctype": "User",
+				"email": email,
+				"first_name": first_name,
+				"enabled": 1,
+				"user_type": "System User",
+				"send_welcome_email": 0,
+			}
+		).insert(ignore_permissions=True)
+	return email
+
+
+def _ms(value: datetime) -> int:
+	# Same local-time convention as the endpoint's own watermark.
+	return int(value.timestamp() * 1000)
+
+
+def _project_fixture(project: str) -> frappe._dict:
+	"""Everything GRMIssue.validate_project_entities() needs for ``project``."""
+	_ensure(
+		"GRM Project",
+		{"project_code": project},
+		{"project_code": project, "title": project, "is_active": 1},
+	)
+	role = _ensure(
+		"GRM Project Role",
+		{"project": project, "role_name": f"{project}-Intake"},
+		{
+			"project": project,
+			"role_name": f"{project}-Intake",
+			"is_active": 1,
+			"duties": [{"duty": "Intake"}],
+		},
+	)
+	category = _ensure(
+		"GRM Issue Category",
+		{"category_name": f"{project}-Cat"},
+		{
+			"project": project,
+			"category_name": f"{project}-Cat",
+			"label": f"{project}-Cat",
+			"abbreviation": "SYN",
+			"routing_target_type": "Role",
+			"assigned_role": role,
+			"confidentiality_level": "Public",
+			"redirection_protocol": "0",
+			"grm_project_link": [{"project": project}],
+		},
+	)
+	status = _ensure(
+		"GRM Issue Status",
+		{"project": project, "status_name": "Open"},
+		{
+			"project": project,
+			"status_name": "Open",
+			"initial_status": 1,
+			"open_status": 1,
+			"grm_project_link": [{"project": project}],
+		},
+	)
+	issue_type = _ensure(
+		"GRM Issue Type",
+		{"project": project, "type_name": "Complaint"},
+		{"project": project, "type_name": "Complaint", "grm_project_link": [{"project": project}]},
+	)
+	level = _ensure(
+		"GRM Administrative Level Type",
+		{"project": project, "level_name": "Sector"},
+		{"project": project, "level_name": "Sector", "level_order": 1},
+	)
+	region = _ensure(
+		"GRM Administrative Region",
+		{"project": project, "region_name": f"{project}-R"},
+		{
+			"project": project,
+			"region_name": f"{project}-R",
+			"administrative_level": level,
+			"path": f"{project}-R",
+		},
+	)
+	return frappe._dict(
+		project=project,
+		role=role,
+		category=category,
+		status=status,
+		issue_type=issue_type,
+		region=region,
+	)
+
+
+def _assign(user: str, fixture: frappe._dict) -> str:
+	name = _ensure(
+		"GRM User Project Assignment",
+		{"user": user, "project": fixture.project, "role": fixture.role},
+		{
+			"user": user,
+			"project": fixture.project,
+			"role": fixture.role,
+			"administrative_region": fixture.region,
+			"is_active": 1,
+		},
+	)
+	# Sync scope only counts activated assignments.
+	frappe.db.set_value(
+		"GRM User Project Assignment", name, {"activation_status": "Activated"}, update_modified=False
+	)
+	return name
+
+
+def _bind_request(test: FrappeTestCase, **environ) -> None:
+	"""Make ``frappe.request`` a real request for the rest of ``test``."""
+	previous = getattr(frappe.local, "request", None)
+	frappe.local.request = EnvironBuilder(**environ).get_request()
+	test.addCleanup(setattr, frappe.local, "request", previous)
+
+
+def _fresh_request():
+	"""Start a new "request": drop the request-scoped memos the sync module
+	keeps, which the test process would otherwise carry from test to test."""
+	frappe.local.request_cache.clear()
+	frappe.local.flags.pop("aqe_sync_user_projects", None)
+	frappe.local.flags.pop("aqe_sync_accessible_regions", None)
+
+
+class SyncTestCase(FrappeTestCase):
+	"""Shared fixture. Has no tests of its own, so the runner never sets it up
+	on its own account."""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.own = _project_fixture(PROJECT)
+		cls.other = _project_fixture(OTHER_PROJECT)
+		# Auto-routing assigns new issues to Administrator, which
+		# validate_project_entities() only accepts with an assignment.
+		_assign("Administrator", cls.own)
+		_assign("Administrator", cls.other)
+		_ensure_user(FIELD_USER, "Sync Field")
+		_assign(FIELD_USER, cls.own)
+		frappe.db.commit()
+
+	@classmethod
+	def tearDownClass(cls):
+		# Best-effort, as in the other suites: the project cascade takes the
+		# catalogue with it.
+		try:
+			for project in (PROJECT, OTHER_PROJECT):
+				for issue in frappe.get_all("GRM Issue", filters={"project": project}, pluck="name"):
+					frappe.delete_doc("GRM Issue", issue, force=True, delete_permanently=True)
+				frappe.delete_doc("GRM Project", project, force=True, delete_permanently=True)
+			frappe.db.commit()
+		except Exception:
+			frappe.db.rollback()
+		super().tearDownClass()
+
+	def setUp(self):
+		_fresh_request()
+
+	def tearDown(self):
+		frappe.set_user("Administrator")
+		frappe.local.response.pop("http_status_code", None)
+		_fresh_request()
+
+	@classmethod
+	def _issue(
+		cls, fixture: frappe._dict, modified: datetime | None = None, submitted=True, **overrides
+	) -> str:
+		"""Insert an issue as Administrator. ``submitted`` keeps it out of the
+		draft-privacy rules; ``modified`` places it in a pull window."""
+		payload = {
+			"doctype": "GRM Issue",
+			"project": fixture.project,
+			"category": fixture.category,
+			"status": fixture.status,
+			"issue_type": fixture.issue_type,
+			"administrative_region": fixture.region,
+			"reporter": "Administrator",
+			"contact_medium": "anonymous",
+			"title": "T",
+			"description": "D",
+			**overrides,
+		}
+		name = frappe.get_doc(payload).insert(ignore_permissions=True).name
+		values = {}
+		if submitted:
+			values["docstatus"] = 1
+		if modified:
+			values["modified"] = modified
+		if values:
+			frappe.db.set_value("GRM Issue", name, values, update_modified=False)
+		return name
+
+
+def _log_rows(count: int) -> dict:
+	return {"grm_issue_logs": {"created": [{"id": f"sync-log-{i}"} for i in range(count)]}}
+
+
+class PullScopeTests(SyncTestCase):
+	"""Every pulled table is scoped to the user's projects. Issue logs and
+	comments carry no project of their own and follow their parent issue;
+	GRM Project Link rows follow the project they point at."""
+
+	WINDOW = datetime(2099, 1, 1)
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.children = {}
+		for key, fixture in (("own", cls.own), ("other", cls.other)):
+			issue = frappe.get_doc("GRM Issue", cls._issue(fixture, submitted=False))
+			issue.append("grm_issue_log", {"text": key, "user": "Administrator", "timestamp": cls.WINDOW})
+			issue.append("grm_issue_comment", {"user": "Administrator", "comment": key})
+			issue.flags.ignore_permissions = True
+			issue.save()
+			cls.children[key] = {
+				"GRM Issue Log": issue.grm_issue_log[-1].name,
+				"GRM Issue Comment": issue.grm_issue_comment[-1].name,
+			}
+			# Submit, and move the issue and its rows into the 2099 pull window.
+			frappe.db.set_value(
+				"GRM Issue",
+				issue.name,
+				{"docstatus": 1, "modified": datetime(2099, 1, 2)},
+				update_modified=False,
+			)
+			for doctype, name in cls.children[key].items():
+				frappe.db.set_value(doctype, name, "modified", datetime(2099, 1, 2), update_modified=False)
+		frappe.db.commit()
+
+	def _pulled_ids(self, changes: dict, table: str) -> set:
+		rows = changes[table]["created"] + changes[table]["updated"]
+		return {row["id"] for row in rows}
+
+	def test_issue_child_rows_follow_their_parent_issue(self):
+		frappe.set_user(FIELD_USER)
+		changes = get_changes_since(self.WINDOW)
+
+		for table, doctype in (
+			("grm_issue_logs", "GRM Issue Log"),
+			("grm_issue_comments", "GRM Issue Comment"),
+		):
+			pulled = self._pulled_ids(changes, table)
+			self.assertIn(self.children["own"][doctype], pulled)
+			self.assertNotIn(self.children["other"][doctype], pulled)
+
+	def test_project_links_are_scoped_to_the_users_projects(self):
+		frappe.set_user(FIELD_USER)
+		changes = get_changes_since(datetime.min)
+
+		rows = changes["grm_project_links"]["created"] + changes["grm_project_links"]["updated"]
+		projects = {row["project"] for row in rows}
+		self.assertIn(PROJECT, projects)
+		self.assertNotIn(OTHER_PROJECT, projects)
+
+
+def _log_rows(count: int) -> dict:
+	return {"grm_issue_logs": {"created": [{"id": f"sync-log-{i}"} for i in range(count)]}}
+
+
+class AsyncPushTests(SyncTestCase):
+	"""``asyncPush`` moves a large batch to a worker. The client then holds
+	only a job id, so the switch, the status it polls and the all-or-nothing
+	apply are what it relies on."""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.issue = cls._issue(cls.own, title="Before")
+		frappe.db.commit()
+
+	def _push(self, changes: dict, **body) -> dict:
+		_bind_request(self, method="POST", json={"changes": changes, **body})
+		return push_changes()
+
+	def test_large_opted_in_push_is_queued(self):
+		with (
+			patch("egrm.api.sync.frappe.enqueue") as enqueue,
+			patch("egrm.api.sync._apply_push_changes") as apply,
+		):
+			response = self._push(_log_rows(PUSH_BACKGROUND_THRESHOLD + 1), asyncPush=True)
+
+		self.assertEqual(response["file_urls"], {})
+		self.assertTrue(response["job_id"])
+		self.assertEqual(frappe.local.response.http_status_code, 202)
+		apply.assert_not_called()
+		enqueue.assert_called_once()
+		self.assertEqual(enqueue.call_args.kwargs["queue"], "long")
+		self.assertEqual(enqueue.call_args.kwargs["push_job_id"], response["job_id"])
+		self.assertEqual(
+			len(enqueue.call_args.kwargs["changes"]["grm_issue_logs"]["created"]),
+			PUSH_BACKGROUND_THRESHOLD + 1,
+		)
+
+	def test_threshold_opt_out_and_attachments_stay_inline(self):
+		attachments = {
+			"grm_issue_attachments": {
+				"created": [{"id": f"sync-att-{i}"} for i in range(PUSH_BACKGROUND_THRESHOLD + 1)]
+			}
+		}
+		for changes, body in (
+			(_log_rows(PUSH_BACKGROUND_THRESHOLD), {"asyncPush": True}),
+			(_log_rows(PUSH_BACKGROUND_THRESHOLD + 1), {}),
+			(attachments, {"asyncPush": True}),
+		):
+			with (
+				patch("egrm.api.sync.frappe.enqueue") as enqueue,
+				patch("egrm.api.sync._apply_push_changes", return_value={}) as apply,
+			):
+				response = self._push(changes, **body)
+			enqueue.assert_not_called()
+			apply.assert_called_once()
+			self.assertEqual(response, {"file_urls": {}})
+
+	def test_job_id_round_trips_through_push_status(self):
+		with patch("egrm.api.sync.frappe.enqueue") as enqueue:
+			job_id = self._push(_log_rows(PUSH_BACKGROUND_THRESHOLD + 1), asyncPush=True)["job_id"]
+		self.assertEqual(push_status(job_id), {"status": "queued"})
+
+		with patch("egrm.api.sync._apply_push_changes") as apply:
+			_process_push(enqueue.call_args.kwargs["changes"], enqueue.call_args.kwargs["push_job_id"])
+		apply.assert_called_once()
+		self.assertEqual(push_status(job_id), {"status": "finished"})
+
+	def test_failed_background_push_rolls_back(self):
+		"""The title update is applied before the bad table is reached; the
+		job must still leave the issue exactly as it was."""
+		changes = {
+			"grm_issues": {
+				"updated": [{"id": self.issue, "title": "After", "_changed": "title"}],
+			},
+			"no_such_table": {"created": [{"id": "x"}]},
+		}
+		# Raised, so the worker records the job as failed as well.
+		with self.assertRaises(ValueError):
+			_process_push(changes, "sync-test-failed-job")
+
+		self.assertEqual(push_status("sync-test-failed-job"), {"status": "failed"})
+		self.assertEqual(frappe.db.get_value("GRM Issue", self.issue, "title"), "Before")
+
+	def test_job_status_is_private_to_its_user(self):
+		with patch("egrm.api.sync.frappe.enqueue"):
+			job_id = self._push(_log_rows(PUSH_BACKGROUND_THRESHOLD + 1), asyncPush=True)["job_id"]
+
+		frappe.set_user(FIELD_USER)
+		self.assertEqual(push_status(job_id), {"status": "unknown"})
+		self.assertEqual(push_status("no-such-job"), {"status": "unknown"})
+
+
+class PullStreamTests(SyncTestCase):
+	"""``stream=1`` must carry exactly the document the JSON endpoint returns."""
+
+	WATERMARK = datetime(2099, 1, 3)
+	# Both pulls below are pinned to one instant, so their `timestamp`s agree.
+	PULLED_AT = datetime(2099, 1, 3, 14)
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls._issue(cls.own, modified=datetime(2099, 1, 3, 12))
+		cls._issue(cls.own, modified=datetime(2099, 1, 3, 13))
+		frappe.db.commit()
+
+	def setUp(self):
+		super().setUp()
+		clock = patch("egrm.api.sync.now_datetime", return_value=self.PULLED_AT)
+		clock.start()
+		self.addCleanup(clock.stop)
+
+	def _query(self, **extra) -> dict:
+		return {"lastPulledAt": _ms(self.WATERMARK), "paging": 1, **extra}
+
+	def _stream(self, headers: dict):
+		"""Call ``pull_changes`` as an HTTP request would, with ``stream=1``."""
+		previous = getattr(frappe.local, "request", None)
+		frappe.local.request = EnvironBuilder(
+			query_string=self._query(stream=1), headers=headers
+		).get_request()
+		try:
+			response = pull_changes()
+			return response, b"".join(response.response)
+		finally:
+			frappe.local.request = previous
+
+	def _expected(self) -> dict:
+		_fresh_request()
+		payload = pull_changes(**self._query())
+		# As Frappe would send it: dates through json_handler.
+		return json.loads(json.dumps(payload, default=json_handler))
+
+	@staticmethod
+	def _parse(body: bytes) -> dict:
+		lines = [json.loads(line) for line in body.decode().splitlines()]
+		meta = lines.pop()
+		return {**meta, "changes": {line["table"]: line["changes"] for line in lines}}
+
+	def test_stream_matches_json_response(self):
+		response, body = self._stream({})
+
+		self.assertEqual(response.mimetype, "application/x-ndjson")
+		streamed = self._parse(body)
+		self.assertEqual(len(streamed["changes"]["grm_issues"]["updated"]), 2)
+		self.assertEqual(streamed, self._expected())
+
+	def test_gzipped_stream_matches_json_response(self):
+		response, body = self._stream({"Accept-Encoding": "gzip, deflate"})
+
+		self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+		self.assertIn("Accept-Encoding", response.headers.get("Vary", ""))
+		# 31: expect gzip framing, as an HTTP client would.
+		self.assertEqual(self._parse(zlib.decompress(body, 31)), self._expected())
+
+	def test_plain_stream_when_gzip_not_accepted(self):
+		response, body = self._stream({"Accept-Encoding": "identity"})
+
+		self.assertIsNone(response.headers.get("Content-Encoding"))
+		self.assertEqual(self._parse(body), self._expected())
+
+
+class WatermarkParseTests(FrappeTestCase):
+	"""``lastPulledAt`` arrives as a number, a digit string or an ISO string,
+	and must come back as the instant the server handed out."""
+
+	def test_numeric_and_iso_watermarks(self):
+		instant = datetime(2099, 1, 5, 12, 30, 45, 500000)
+		millis = _ms(instant)
+		for value in (millis, float(millis), str(millis)):
+			self.assertEqual(_parse_last_pulled_at(value), instant, repr(value))
+		self.assertEqual(_parse_last_pulled_at("2099-01-05 12:30:45"), datetime(2099, 1, 5, 12, 30, 45))
+
+	def test_unsupported_values_are_rejected(self):
+		for value in (True, None, [1]):
+			with self.assertRaises(ValueError, msg=repr(value)):
+				_parse_last_pulled_at(value)
+
+
+class TombstoneWindowTests(SyncTestCase):
+	"""Tombstones come from one query over ``Deleted Document``, windowed the
+	same way as the rows: after the watermark, up to the page boundary."""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.tombstones = []
+		for name, deleted_at in (
+			("SYNC-TOMB-BEFORE", datetime(2099, 1, 6)),
+			("SYNC-TOMB-IN", datetime(2099, 1, 6, 12)),
+			("SYNC-TOMB-AFTER", datetime(2099, 1, 7)),
+		):
+			tombstone = frappe.get_doc(
+				{
+					"doctype": "Deleted Document",
+					"deleted_doctype": "GRM Issue",
+					"deleted_name": name,
+					"data": "{}",
+				}
+			).insert(ignore_permissions=True)
+			frappe.db.set_value(
+				"Deleted Document", tombstone.name, "creation", deleted_at, update_modified=False
+			)
+			cls.tombstones.append(tombstone.name)
+		frappe.db.commit()
+
+	@classmethod
+	def tearDownClass(cls):
+		try:
+			for name in cls.tombstones:
+				frappe.delete_doc("Deleted Document", name, force=True, ignore_permissions=True)
+			frappe.db.commit()
+		except Exception:
+			frappe.db.rollback()
+		super().tearDownClass()
+
+	def test_window_is_open_below_and_closed_above(self):
+		deleted = get_deleted_records_by_doctype(
+			("GRM Issue", "GRM Issue Comment"), datetime(2099, 1, 6), datetime(2099, 1, 7)
+		)
+
+		self.assertEqual(set(deleted), {"GRM Issue", "GRM Issue Comment"})
+		self.assertEqual(
+			{name for name in deleted["GRM Issue"] if name.startswith("SYNC-TOMB-")},
+			{"SYNC-TOMB-IN", "SYNC-TOMB-AFTER"},
+		)
+		self.assertEqual(deleted["GRM Issue Comment"], [])
+
+	def test_no_upper_bound_without_a_page_boundary(self):
+		deleted = get_deleted_records_by_doctype(("GRM Issue",), datetime(2099, 1, 6, 12))
+
+		self.assertEqual(
+			{name for name in deleted["GRM Issue"] if name.startswith("SYNC-TOMB-")}, {"SYNC-TOMB-AFTER"}
+		)
+
+
+class RecordAccessScopeTests(SyncTestCase):
+	"""A push checks every record against the user's scope. The scope is read
+	once per request, and a new request sees a changed assignment."""
+
+	@classmethod
+	def _record(cls, fixture: frappe._dict) -> dict:
+		return {"project": fixture.project, "administrative_region": fixture.region}
+
+	def test_scope_is_resolved_once_per_request(self):
+		with patch(
+			"egrm.api.sync.get_user_accessible_regions", wraps=get_user_accessible_regions
+		) as hierarchy:
+			for _ in range(3):
+				self.assertTrue(validate_user_record_access("GRM Issue", self._record(self.own), FIELD_USER))
+
+		hierarchy.assert_called_once()
+
+	def test_next_request_sees_a_new_assignment(self):
+		record = self._record(self.other)
+		self.assertFalse(validate_user_record_access("GRM Issue", record, FIELD_USER))
+
+		assignment = _assign(FIELD_USER, self.other)
+		self.addCleanup(frappe.delete_doc, "GRM User Project Assignment", assignment, force=True)
+
+		self.assertFalse(validate_user_record_access("GRM Issue", record, FIELD_USER))
+		_fresh_request()
+		self.assertTrue(validate_user_record_access("GRM Issue", record, FIELD_USER))
+
+
+class RecordAccessDispatchTests(SyncTestCase):
+	"""``validate_user_record_access`` hands each doctype to its own check."""
+
+	def test_each_doctype_is_checked_against_its_own_field(self):
+		for doctype, record, allowed in (
+			("GRM Issue", {"project": PROJECT, "administrative_region": self.own.region}, True),
+			("GRM Issue", {"project": OTHER_PROJECT, "administrative_region": self.other.region}, False),
+			("GRM Administrative Region", {"id": self.own.region, "project": PROJECT}, True),
+			("GRM Administrative Region", {"id": self.other.region, "project": OTHER_PROJECT}, False),
+			("GRM Project", {"id": PROJECT}, True),
+			("GRM Project", {"id": OTHER_PROJECT}, False),
+			("GRM Issue Category", {"project": PROJECT}, True),
+			("GRM Issue Category", {"project": OTHER_PROJECT}, False),
+			# A lookup row without a project is shared by every project.
+			("GRM Issue Type", {}, True),
+			("User", {"id": FIELD_USER}, True),
+			("User", {"id": "Administrator"}, False),
+			("GRM Issue Comment", {"user": FIELD_USER}, True),
+			("GRM Issue Log", {"user": "Administrator"}, False),
+			# No check of its own: only the project gate applies.
+			("GRM Issue Attachment", {}, True),
+		):
+			self.assertEqual(
+				validate_user_record_access(doctype, record, FIELD_USER), allowed, f"{doctype} {record}"
+			)
+
+	def test_administrator_bypasses_every_check(self):
+		for doctype, record in (
+			("GRM Issue", {"project": OTHER_PROJECT, "administrative_region": self.other.region}),
+			("GRM Project", {"id": OTHER_PROJECT}),
+			("User", {"id": FIELD_USER}),
+		):
+			self.assertTrue(validate_user_record_access(doctype, record, "Administrator"), doctype)
+
+
+class ChildRecordBatchTests(SyncTestCase):
+	"""``create_child_records`` appends a batch of pushed child rows per
+	parent issue and saves each parent once. A parent that is missing or out
+	of the user's scope fails the batch before anything is saved."""
+
+	def _comment(self, issue: str, text: str, user: str = "Administrator") -> dict:
+		return {
+			"id": f"sync-comment-{frappe.generate_hash(length=10)}",
+			"grm_issue": issue,
+			"user": user,
+			"comment": text,
+		}
+
+	@staticmethod
+	def _comments(issue: str) -> list:
+		return frappe.get_all(
+			"GRM Issue Comment",
+			filters={"parent": issue, "parenttype": "GRM Issue"},
+			order_by="idx asc",
+			pluck="comment",
+		)
+
+	def test_rows_are_grouped_by_parent(self):
+		first = self._issue(self.own, submitted=False)
+		second = self._issue(self.own, submitted=False)
+		rows = [
+			self._comment(first, "one"),
+			self._comment(second, "two"),
+			self._comment(first, "three"),
+		]
+
+		with patch("egrm.api.sync._save_parent_issue", wraps=_save_parent_issue) as save:
+			self.assertEqual(create_child_records("GRM Issue Comment", rows), {})
+
+		self.assertEqual(save.call_count, 2)
+		self.assertEqual(self._comments(first), ["one", "three"])
+		self.assertEqual(self._comments(second), ["two"])
+
+	def test_missing_parent_fails_before_any_save(self):
+		issue = self._issue(self.own, submitted=False)
+		rows = [self._comment(issue, "kept out"), self._comment("GRM-NO-SUCH-ISSUE", "orphan")]
+
+		with self.assertRaises(ValueError):
+			create_child_records("GRM Issue Comment", rows)
+		self.assertEqual(self._comments(issue), [])
+
+	def test_unauthorized_parent_fails_before_any_save(self):
+		own = self._issue(self.own)
+		foreign_project = self._issue(self.other)
+		# In scope by project, but a draft someone else owns.
+		foreign_draft = self._issue(self.own, submitted=False)
+
+		frappe.set_user(FIELD_USER)
+		for unauthorized in (foreign_project, foreign_draft):
+			rows = [
+				self._comment(own, "kept out", user=FIELD_USER),
+				self._comment(unauthorized, "refused", user=FIELD_USER),
+			]
+			with self.assertRaises(frappe.PermissionError):
+				create_child_records("GRM Issue Comment", rows)
+			self.assertEqual(self._comments(unauthorized), [])
+		self.assertEqual(self._comments(own), [])
+
+	def test_single_row_path_checks_the_parent_issue(self):
+		"""``create_record`` routes a child row through ``create_child_record``,
+		which must refuse a parent the user cannot see just like the batch."""
+		own = self._issue(self.own)
+		foreign = self._issue(self.other)
+
+		frappe.set_user(FIELD_USER)
+		with self.assertRaises(frappe.PermissionError):
+			create_record("GRM Issue Comment", self._comment(foreign, "refused", user=FIELD_USER))
+		self.assertEqual(self._comments(foreign), [])
+
+		create_record("GRM Issue Comment", self._comment(own, "accepted", user=FIELD_USER))
+		self.assertEqual(self._comments(own), ["accepted"])
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 64
+
+
+class UploadValidationTests(FrappeTestCase):
+	"""A pushed attachment is checked before it becomes a File. The type check
+	reads the magic bytes only, so it runs before the payload is decoded."""
+
+	def _upload(self, file_name: str, content: bytes):
+		with patch(
+			"frappe.utils.file_manager.save_file", return_value=frappe._dict(file_url=f"/files/{file_name}")
+		) as save_file:
+			file_url = create_file_from_base64(
+				{"file_name": file_name, "file_data": base64.b64encode(content).decode("ascii")}, "GRM-TEST"
+			)
+		return file_url, save_file
+
+	def test_matching_magic_bytes_are_saved(self):
+		file_url, save_file = self._upload("photo.png", PNG)
+
+		self.assertEqual(file_url, "/files/photo.png")
+		self.assertEqual(save_file.call_args.kwargs["content"], PNG)
+
+	def test_mismatched_type_is_rejected_before_the_full_decode(self):
+		# Another image type under an image extension is tolerated; a PDF is not.
+		pdf = b"%PDF-1.4" + b"\0" * 4096
+		with patch("base64.b64decode", wraps=base64.b64decode) as decode:
+			file_url, save_file = self._upload("photo.png", pdf)
+
+		self.assertIsNone(file_url)
+		save_file.assert_not_called()
+		# Only the header was decoded.
+		decode.assert_called_once()
+		self.assertEqual(len(decode.call_args.args[0]), 24)
+
+	def test_file_names(self):
+		"""Each character the old per-substring loop refused is still refused."""
+		for file_name in ("photo.png", "Photo Final.JPG", "voice-note.3gp", "a.b.pdf"):
+			self.assertTrue(validate_file_name(file_name), file_name)
+		for file_name in (
+			"",
+			"   ",
+			"x" * 252 + ".png",
+			"../photo.png",
+			"dir/photo.png",
+			"dir\\photo.png",
+			"c:photo.png",
+			"photo*.png",
+			"photo?.png",
+			'photo".png',
+			"photo<.png",
+			"photo>.png",
+			"photo|.png",
+			"photo\0.png",
+			"photo.exe",
+			"photo",
+		):
+			self.assertFalse(validate_file_name(file_name), repr(file_name))
+
+
+def _b64(content: bytes) -> str:
+	return base64.b64encode(content).decode("ascii")
+
+
+class AttachmentFileTests(SyncTestCase):
+	"""Attachment rows ship their file as ``file_data`` unless the device says
+	it already holds that content (``knownHashes``). An empty or missing file
+	must cost the row its data, never the whole table."""
+
+	WATERMARK = datetime(2099, 1, 4)
+	EMPTY_URL = "/files/sync-test-empty.txt"
+	MISSING_URL = "/files/sync-test-missing.txt"
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.known_file = cls._file("sync-test-known.txt", b"known attachment")
+		cls.changed_file = cls._file("sync-test-changed.txt", b"changed attachment, v1")
+		with open(cls._path(cls.EMPTY_URL), "wb"):
+			pass
+
+		# Every row is inserted against a real File (the field is mandatory),
+		# then re-pointed where the test needs a broken one.
+		issue = frappe.get_doc("GRM Issue", cls._issue(cls.own, submitted=False))
+		for _ in range(4):
+			issue.append("grm_issue_attachment", {"attachment": cls.known_file.file_url})
+		issue.save(ignore_permissions=True)
+		cls.rows = dict(
+			zip(
+				("known", "changed", "empty", "missing"),
+				(row.name for row in issue.grm_issue_attachment),
+				strict=True,
+			)
+		)
+		for key, url in (
+			("changed", cls.changed_file.file_url),
+			("empty", cls.EMPTY_URL),
+			("missing", cls.MISSING_URL),
+		):
+			frappe.db.set_value(
+				"GRM Issue Attachment", cls.rows[key], "attachment", url, update_modified=False
+			)
+		for row in cls.rows.values():
+			frappe.db.set_value(
+				"GRM Issue Attachment", row, "modified", datetime(2099, 1, 4, 12), update_modified=False
+			)
+		frappe.db.set_value("GRM Issue", issue.name, "docstatus", 1, update_modified=False)
+		frappe.db.commit()
+
+	@classmethod
+	def tearDownClass(cls):
+		try:
+			for file in (cls.known_file, cls.changed_file):
+				frappe.delete_doc("File", file.name, force=True, ignore_permissions=True)
+			frappe.db.commit()
+		except Exception:
+			frappe.db.rollback()
+		if os.path.exists(cls._path(cls.EMPTY_URL)):
+			os.remove(cls._path(cls.EMPTY_URL))
+		super().tearDownClass()
+
+	@staticmethod
+	def _path(file_url: str) -> str:
+		return frappe.get_site_path("public", "files", file_url[len("/files/") :])
+
+	@staticmethod
+	def _file(file_name: str, content: bytes):
+		return frappe.get_doc(
+			{"doctype": "File", "file_name": file_name, "content": content, "is_private": 0}
+		).insert(ignore_permissions=True)
+
+	def _rewrite(self, file, content: bytes) -> str:
+		"""Replace a File's content on disk, as an edit would, and return its new hash."""
+		with open(self._path(file.file_url), "wb") as handle:
+			handle.write(content)
+		content_hash = hashlib.md5(content).hexdigest()
+		frappe.db.set_value("File", file.name, "content_hash", content_hash, update_modified=False)
+		return content_hash
+
+	def _rows(self, known_hashes) -> dict:
+		_fresh_request()
+		changes = optimize_attachment_sync({"deleted": []}, self.WATERMARK, None, known_hashes)
+		by_id = {row["id"]: row for row in changes["created"] + changes["updated"]}
+		return {key: by_id[name] for key, name in self.rows.items()}
+
+	def test_read_file_base64_empty_and_missing(self):
+		"""An empty file cannot be memory-mapped and is encoded as "" instead;
+		a missing one reads as None."""
+		with tempfile.TemporaryDirectory() as directory:
+			empty = os.path.join(directory, "empty")
+			with open(empty, "wb"):
+				pass
+			full = os.path.join(directory, "full")
+			with open(full, "wb") as file:
+				file.write(b"content")
+
+			self.assertEqual(_read_file_base64(empty), "")
+			self.assertIsNone(_read_file_base64(os.path.join(directory, "missing")))
+			self.assertEqual(_read_file_base64(full), _b64(b"content"))
+
+	def test_load_attachment_files(self):
+		encoded = load_attachment_files(
+			[
+				self.known_file.file_url,
+				self.changed_file.file_url,
+				# Asked for twice, read once.
+				self.known_file.file_url,
+				self.EMPTY_URL,
+				self.MISSING_URL,
+				"https://example.com/elsewhere.txt",
+			]
+		)
+		self.assertEqual(
+			encoded,
+			{
+				self.known_file.file_url: _b64(b"known attachment"),
+				self.changed_file.file_url: _b64(b"changed attachment, v1"),
+				self.EMPTY_URL: "",
+				self.MISSING_URL: None,
+			},
+		)
+
+	def test_known_hash_omits_file_data(self):
+		rows = self._rows(frozenset({self.known_file.content_hash}))
+
+		self.assertEqual(rows["known"]["file_hash"], self.known_file.content_hash)
+		self.assertNotIn("file_data", rows["known"])
+		self.assertEqual(rows["changed"]["file_data"], _b64(b"changed attachment, v1"))
+
+	def test_changed_file_is_resent(self):
+		"""The device holds v1. Once the file on the server changes, its hash
+		no longer matches and the new content goes out."""
+		old_hash = self.changed_file.content_hash
+		self.addCleanup(self._rewrite, self.changed_file, b"changed attachment, v1")
+		new_content = b"changed attachment, v2"
+		new_hash = self._rewrite(self.changed_file, new_content)
+
+		row = self._rows(frozenset({old_hash}))["changed"]
+
+		self.assertEqual(row["file_hash"], new_hash)
+		self.assertEqual(row["file_data"], _b64(new_content))
+
+	def test_empty_and_missing_files_keep_their_rows(self):
+		for known_hashes in (None, frozenset()):
+			rows = self._rows(known_hashes)
+			self.assertNotIn("file_data", rows["empty"])
+			self.assertNotIn("file_data", rows["missing"])
+			self.assertEqual(rows["known"]["file_data"], _b64(b"known attachment"))
+		# Without knownHashes the rows carry no hash, as before.
+		self.assertNotIn("file_hash", self._rows(None)["known"])
+
+
+class PullWindowTests(SyncTestCase):
+	"""One query per table fetches ``modified > watermark``; rows are then
+	split into ``created`` and ``updated`` on ``creation``."""
+
+	WATERMARK = datetime(2099, 1, 8)
+
+	def test_rows_are_split_on_creation(self):
+		old = self._issue(self.own, modified=datetime(2099, 1, 8, 12))
+		new = self._issue(self.own, modified=datetime(2099, 1, 8, 12))
+		frappe.db.set_value("GRM Issue", new, "creation", datetime(2099, 1, 8, 6), update_modified=False)
+		untouched = self._issue(self.own, modified=datetime(2099, 1, 7))
+
+		issues = get_changes_since(self.WATERMARK)["grm_issues"]
+
+		self.assertEqual([row["id"] for row in issues["created"]], [new])
+		self.assertEqual([row["id"] for row in issues["updated"]], [old])
+		self.assertNotIn(untouched, {row["id"] for row in issues["created"] + issues["updated"]})
+
+
+class PulledFieldsTests(SyncTestCase):
+	"""The pull selects ``_pulled_fields`` rather than ``*``; the raw records
+	it produces must be the ones ``SELECT *`` produced."""
+
+	def test_projection_matches_the_full_row(self):
+		issue = self._issue(self.own)
+		for doctype, name in (("GRM Issue", issue), ("User", FIELD_USER)):
+			full = frappe.get_all(doctype, filters={"name": name}, fields=["*"])[0]
+			projected = frappe.get_all(doctype, filters={"name": name}, fields=_pulled_fields(doctype))[0]
+
+			self.assertEqual(frappe_to_watermelon_raw(projected), frappe_to_watermelon_raw(full), doctype)
+			# Only Frappe's _-prefixed bookkeeping columns are left out.
+			self.assertEqual(
+				set(full) - set(projected), {key for key in full if key.startswith("_")}, doctype
+			)
+
+
+class ProjectLinkedRowsTests(SyncTestCase):
+	"""Reference tables scoped through GRM Project Link are selected with a
+	semi-join on the links: each record once, however many links match."""
+
+	FOREIGN_PROJECT = "TEST-SYNC-FOREIGN"
+	WATERMARK = datetime(2099, 1, 9)
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		_ensure(
+			"GRM Project",
+			{"project_code": cls.FOREIGN_PROJECT},
+			{"project_code": cls.FOREIGN_PROJECT, "title": cls.FOREIGN_PROJECT, "is_active": 1},
+		)
+		cls.shared = cls._issue_type("Shared", PROJECT, OTHER_PROJECT)
+		cls.foreign = cls._issue_type("Foreign", cls.FOREIGN_PROJECT)
+		frappe.db.commit()
+
+	@classmethod
+	def tearDownClass(cls):
+		try:
+			for name in (cls.shared, cls.foreign):
+				frappe.delete_doc("GRM Issue Type", name, force=True, delete_permanently=True)
+			frappe.delete_doc("GRM Project", cls.FOREIGN_PROJECT, force=True, delete_permanently=True)
+			frappe.db.commit()
+		except Exception:
+			frappe.db.rollback()
+		super().tearDownClass()
+
+	@classmethod
+	def _issue_type(cls, type_name: str, *projects: str) -> str:
+		name = (
+			frappe.get_doc(
+				{
+					"doctype": "GRM Issue Type",
+					"type_name": f"Sync {type_name}",
+					"grm_project_link": [{"project": project} for project in projects],
+				}
+			)
+			.insert(ignore_permissions=True)
+			.name
+		)
+		frappe.db.set_value(
+			"GRM Issue Type", name, "modified", datetime(2099, 1, 9, 12), update_modified=False
+		)
+		return name
+
+	def test_each_record_once_and_only_through_the_users_projects(self):
+		rows = _project_linked_rows(
+			"GRM Issue Type",
+			{"child_doctype": "GRM Project Link", "field": "project", "values": [PROJECT, OTHER_PROJECT]},
+			self.WATERMARK,
+		)
+
+		self.assertEqual([row.name for row in rows], [self.shared])
+
+
+class ScopeFilterDispatchTests(SyncTestCase):
+	"""``get_user_filters_for_doctype`` hands each pulled doctype to its own
+	filter builder; every table of the pull comes back scoped."""
+
+	def _filters(self, doctype: str) -> dict:
+		return get_user_filters_for_doctype(doctype, None, None, FIELD_USER)
+
+	def test_each_doctype_gets_its_scope(self):
+		linked = {
+			"_child_table_filter": {
+				"child_doctype": "GRM Project Link",
+				"field": "project",
+				"values": [PROJECT],
+			}
+		}
+		for doctype, expected in (
+			("GRM Issue", {"project": [PROJECT], "administrative_region": [self.own.region]}),
+			("GRM Administrative Region", {"name": [self.own.region], "project": [PROJECT]}),
+			("GRM Project", {"name": [PROJECT]}),
+			("GRM Administrative Level Type", {"project": [PROJECT]}),
+			("GRM Project Link", {"project": [PROJECT]}),
+			("User", {"name": FIELD_USER}),
+			("GRM Issue Category", linked),
+			("GRM Issue Status", linked),
+			# Scoped through the parent issue, not by a filter.
+			("GRM Issue Comment", {}),
+		):
+			self.assertEqual(self._filters(doctype), expected, doctype)
+
+	def test_every_pulled_table_has_a_builder(self):
+		self.assertEqual(set(SYNC_TABLES.values()) - set(_SCOPE_FILTER_BUILDERS), set())
+
+
+def _pulled_ids(payload: dict, table: str = "grm_issues") -> set:
+	changes = payload["changes"][table]
+	return {row["id"] for row in changes["created"] + changes["updated"]}
+
+
+class PullPageSizeTests(SyncTestCase):
+	"""``pageSize`` picks where a page is cut; ``timestamp`` stays the cursor."""
+
+	WATERMARK = datetime(2099, 1, 2)
+
+	def test_page_size_is_clamped(self):
+		for requested, expected in (
+			(MAX_PULL_PAGE_SIZE + 1, MAX_PULL_PAGE_SIZE),
+			(10, 10),
+			(0, PULL_PAGE_SIZE),
+			(-5, PULL_PAGE_SIZE),
+		):
+			_fresh_request()
+			with (
+				patch("egrm.api.sync._resolve_page_boundary", return_value=(None, False)) as boundary,
+				patch("egrm.api.sync.get_changes_since", return_value={}),
+			):
+				pull_changes(lastPulledAt=_ms(self.WATERMARK), paging=1, pageSize=requested)
+			self.assertEqual(boundary.call_args.args[4], expected, f"pageSize={requested}")
+
+	def test_rows_sharing_the_boundary_stay_on_one_page(self):
+		"""B and C share the boundary instant. Cutting the page after B and
+		resuming at ``> boundary`` must not lose C."""
+		tied = datetime(2099, 1, 2, 12, 0, 1, 123456)
+		first = self._issue(self.own, modified=datetime(2099, 1, 2, 12))
+		tied_ids = {self._issue(self.own, modified=tied), self._issue(self.own, modified=tied)}
+
+		page = pull_changes(lastPulledAt=_ms(self.WATERMARK), paging=1, pageSize=2)
+
+		self.assertTrue(page["hasMore"])
+		self.assertEqual(_pulled_ids(page), {first} | tied_ids)
+		# The cursor is the boundary row rounded up to the next millisecond,
+		# not the time of the pull.
+		self.assertEqual(page["timestamp"], _ms(datetime(2099, 1, 2, 12, 0, 1, 124000)))
+
+		_fresh_request()
+		next_page = pull_changes(lastPulledAt=page["timestamp"], paging=1, pageSize=2)
+		self.assertFalse(next_page["hasMore"])
+		self.assertFalse(_pulled_ids(next_page) & ({first} | tied_ids))
+
+
+class FirstSyncTombstoneTests(SyncTestCase):
+	"""A device's first pull skips the tombstone lookup; a forced replay keeps it."""
+
+	def _include_deleted(self, **query) -> bool:
+		_fresh_request()
+		with (
+			patch("egrm.api.sync._resolve_page_boundary", return_value=(None, False)),
+			patch("egrm.api.sync.get_changes_since", return_value={}) as changes,
+		):
+			pull_changes(**query)
+		return changes.call_args.kwargs["include_deleted"]
+
+	def test_first_sync_skips_tombstones(self):
+		self.assertFalse(self._include_deleted())
+
+	def test_forced_replays_keep_tombstones(self):
+		self.assertTrue(self._include_deleted(fullSync=1))
+		with patch("egrm.api.sync._resolve_full_sync", return_value=(True, "entitlement-changed")):
+			self.assertTrue(self._include_deleted(lastPulledAt=_ms(datetime(2099, 1, 2))))
+
+	def test_deleted_lists_are_empty_without_the_lookup(self):
+		frappe.set_user(FIELD_USER)
+		with patch("egrm.api.sync.get_deleted_records_by_doctype") as lookup:
+			changes = get_changes_since(datetime(2099, 1, 2), include_deleted=False)
+
+		lookup.assert_not_called()
+		self.assertTrue(all(table["deleted"] == [] for table in changes.values()))
+
+
+class OrjsonResponseTests(SyncTestCase):
+	"""orjson only changes how the sync endpoints encode and decode, never the
+	document a client sees."""
+
+	WATERMARK = datetime(2099, 1, 8)
+	PULLED_AT = datetime(2099, 1, 8, 14)
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls._issue(cls.own, modified=datetime(2099, 1, 8, 12))
+		frappe.db.commit()
+
+	def setUp(self):
+		super().setUp()
+		clock = patch("egrm.api.sync.now_datetime", return_value=self.PULLED_AT)
+		clock.start()
+		self.addCleanup(clock.stop)
+
+	@staticmethod
+	def _as_frappe_sends(payload: dict) -> dict:
+		return json.loads(json.dumps({"message": payload}, default=json_handler))
+
+	def test_json_response_matches_frappe_encoding(self):
+		payload = {
+			"changes": {"grm_issues": {"created": [{"id": "x", "at": datetime(2099, 1, 8, 9, 30, 15, 250)}]}},
+			"reported_on": datetime(2099, 1, 8).date(),
+			"timestamp": _ms(self.PULLED_AT),
+			"hasMore": False,
+		}
+
+		response = _json_pull_response(payload)
+
+		self.assertEqual(response.mimetype, "application/json")
+		self.assertEqual(json.loads(response.get_data()), self._as_frappe_sends(payload))
+
+	def test_pull_over_http_matches_the_plain_dict(self):
+		expected = self._as_frappe_sends(_pull_payload(_ms(self.WATERMARK), is_paging=1))
+
+		_fresh_request()
+		_bind_request(self, query_string={"lastPulledAt": _ms(self.WATERMARK), "paging": 1})
+		body = json.loads(pull_changes().get_data())
+
+		self.assertEqual(body, expected)
+		self.assertEqual(len(body["message"]["changes"]["grm_issues"]["updated"]), 1)
+		self.assertEqual(body["message"]["timestamp"], _ms(self.PULLED_AT))
+		self.assertFalse(body["message"]["hasMore"])
+
+	def test_push_body_keeps_the_get_json_contract(self):
+		for data, expected in (
+			(b'{"changes": {"grm_issues": {}}}', {"changes": {"grm_issues": {}}}),
+			(b"{not json", {}),
+			(b"[1, 2]", {}),
+			(b"", {}),
+		):
+			_bind_request(self, method="POST", data=data, content_type="application/json")
+			self.assertEqual(_push_request_body(), expected, data)
+
+
+class PushUpdateBatchTests(SyncTestCase):
+	"""``process_table_changes`` writes a table's updates with one
+	``frappe.db.bulk_update`` after every row has been checked."""
+
+	def setUp(self):
+		super().setUp()
+		self.own_issue = self._issue(self.own, title="Own", description="Own description")
+		self.other_issue = self._issue(self.other, title="Other")
+		frappe.db.commit()
+		self.addCleanup(self._delete_issues, self.own_issue, self.other_issue)
+
+	@staticmethod
+	def _delete_issues(*names):
+		for name in names:
+			frappe.delete_doc("GRM Issue", name, force=True, delete_permanently=True)
+		frappe.db.commit()
+
+	def _update(self, issue: str, fixture: frappe._dict, changed: str, **fields) -> dict:
+		return {
+			"id": issue,
+			"project": fixture.project,
+			"administrative_region": fixture.region,
+			"_changed": changed,
+			**fields,
+		}
+
+	def test_updates_persist_without_touching_modified(self):
+		modified = frappe.db.get_value("GRM Issue", self.own_issue, "modified")
+		# Warm the document cache, which the batch write must invalidate.
+		self.assertEqual(frappe.get_cached_doc("GRM Issue", self.own_issue).title, "Own")
+
+		frappe.set_user(FIELD_USER)
+		with patch.object(frappe.db, "bulk_update", wraps=frappe.db.bulk_update) as bulk_update:
+			process_table_changes(
+				"grm_issues",
+				{
+					"updated": [
+						self._update(self.own_issue, self.own, "title", title="First push"),
+						# Pushed twice in one batch: the last value per field
+						# wins, and fields from either push are kept.
+						self._update(
+							self.own_issue, self.own, "title,description", title="Pushed", description="New"
+						),
+					]
+				},
+			)
+
+		bulk_update.assert_called_once()
+		row = frappe.db.get_value(
+			"GRM Issue", self.own_issue, ["title", "description", "modified"], as_dict=True
+		)
+		self.assertEqual((row.title, row.description), ("Pushed", "New"))
+		self.assertEqual(row.modified, modified)
+		self.assertEqual(frappe.get_cached_doc("GRM Issue", self.own_issue).title, "Pushed")
+
+	def test_unauthorized_row_rejects_the_batch_before_any_write(self):
+		frappe.set_user(FIELD_USER)
+		with (
+			patch.object(frappe.db, "bulk_update") as bulk_update,
+			self.assertRaises(frappe.PermissionError),
+		):
+			process_table_changes(
+				"grm_issues",
+				{
+					"updated": [
+						self._update(self.own_issue, self.own, "title", title="Pushed"),
+						self._update(self.other_issue, self.other, "title", title="Pushed"),
+					]
+				},
+			)
+
+		bulk_update.assert_not_called()
+		self.assertEqual(frappe.db.get_value("GRM Issue", self.own_issue, "title"), "Own")
+		self.assertEqual(frappe.db.get_value("GRM Issue", self.other_issue, "title"), "Other")
@@ -38,13 +38,25 @@ def get_user_accessible_projects(user: str) -> list[str]:
 	if user == "Administrator" or GRM_ALL_PROJECTS_ROLES & set(frappe.get_roles(user)):
 		return sorted(frappe.get_all("GRM Project", filters={"is_active": 1}, pluck="name"))
 
-	assignments = frappe.get_all(
-		"GRM User Project Assignment",
-		filters={"user": user, "is_active": 1, "activation_status": "Activated"},
-		fields=["project"],
+	# One query for the assignments and their projects' active flag, rather
+	# than an is_active lookup per assigned project.
+	assignment = frappe.qb.DocType("GRM User Project Assignment")
+	project = frappe.qb.DocType("GRM Project")
+	projects = (
+		frappe.qb.from_(assignment)
+		.join(project)
+		.on(project.name == assignment.project)
+		.select(assignment.project)
+		.distinct()
+		.where(
+			(assignment.user == user)
+			& (assignment.is_active == 1)
+			& (assignment.activation_status == "Activated")
+			& (project.is_active == 1)
+		)
+		.run(pluck=True)
 	)
-	projects = {a.project for a in assignments}
-	return sorted(p for p in projects if frappe.db.get_value("GRM Project", p, "is_active"))
+	return sorted(projects)
 
 
 def is_platform_admin(user: str | None = None) -> bool: